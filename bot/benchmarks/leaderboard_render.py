@@ -0,0 +1,116 @@
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from bot.cogs.commands.leaderboard_renderer import LeaderboardRenderer
+from bot.services.boss_progression import BossProgressionService
+
+GUILD_ID = 1
+PAGE_SIZE = 10
+
+
+def _build_tables(size: int, mode: str, max_bosses: int) -> dict[str, list[dict]]:
+    start = datetime(2025, 1, 1)
+    participants = [
+        {
+            'guild_id': GUILD_ID,
+            'user_id': user_id,
+            'progress': user_id % max(1, max_bosses),
+            'mode': mode,
+            'joined_at': start.isoformat(),
+            'last_completion': (start + timedelta(seconds=user_id)).isoformat(),
+        }
+        for user_id in range(size)
+    ]
+    completions = [
+        {
+            'id': index + 1,
+            'guild_id': GUILD_ID,
+            'user_id': size + index,
+            'difficulty': mode,
+            'completion_time': (start + timedelta(minutes=index)).isoformat(),
+            'completion_order': index + 1,
+        }
+        for index in range(max(1, size // 10))
+    ]
+    return {'participants': participants, 'completions': completions}
+
+
+def _open_tiny(directory: Path, tables: dict[str, list[dict]]):
+    from bot.db.tiny import EventDatabase
+    path = directory / "event_bot.db"
+    raw = {
+        name: {
+            str(index + 1): {key: value for key, value in row.items() if key != 'id'}
+            for index, row in enumerate(rows)
+        }
+        for name, rows in tables.items()
+    }
+    path.write_text(json.dumps(raw), encoding='utf-8')
+    return EventDatabase(str(path))
+
+
+def _open_sqlite(directory: Path, tables: dict[str, list[dict]]):
+    from bot.db.sqlite import SqliteEventDatabase
+    db = SqliteEventDatabase(str(directory / "event_bot.sqlite3"))
+    for name, rows in tables.items():
+        db.import_rows(name, rows)
+    return db
+
+
+def _timed(func, repeat: int) -> tuple[float, object]:
+    result = None
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - started) * 1000 / repeat, result
+
+
+def _names(rows: list[dict]) -> dict[int, str]:
+    return {row['user_id']: f"Player {row['user_id']}" for row in rows}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Time the leaderboard path the bot takes: a top-10 board query plus render, and one /leaderboard page"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100000])
+    parser.add_argument("--mode", default="normal")
+    parser.add_argument("--backend", choices=["tiny", "sqlite"], default="tiny")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    boss_service = BossProgressionService()
+    max_bosses = boss_service.get_max_bosses_for_mode(args.mode)
+    opener = _open_tiny if args.backend == "tiny" else _open_sqlite
+    print(f"{'participants':>12} {'board ms':>10} {'render ms':>10} {'page ms':>10}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            db = opener(Path(directory), _build_tables(size, args.mode, max_bosses))
+            renderer = LeaderboardRenderer(boss_service)
+            try:
+                board_ms, board = _timed(lambda: db.get_mode_board(GUILD_ID, args.mode, limit=10), args.repeat)
+                names = _names(board['finalized'] + board['live'])
+                render_ms, _ = _timed(lambda: renderer.render(args.mode, board, names), args.repeat)
+
+                page_number = max(1, (size // PAGE_SIZE) // 2)
+
+                def page():
+                    rows = db.get_board_page(GUILD_ID, args.mode, (page_number - 1) * PAGE_SIZE, PAGE_SIZE)
+                    return renderer.render_page(
+                        args.mode, rows, _names(rows['finalized'] + rows['live']), page_number, PAGE_SIZE
+                    )
+
+                page_ms, _ = _timed(page, args.repeat)
+            finally:
+                db.close()
+        print(f"{size:>12} {board_ms:>10.2f} {render_ms:>10.2f} {page_ms:>10.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,10 +5,11 @@ from bot.services.boss_progression import BossProgressionService
 
 class JoinCommand:
     
-    def __init__(self, bot, db, boss_service: BossProgressionService):
+    def __init__(self, bot, db, boss_service: BossProgressionService, leaderboard_manager):
         self.bot = bot
         self.db = db
         self.boss_service = boss_service
+        self.leaderboard_manager = leaderboard_manager
     
     async def join(
         self, 
@@ -26,14 +27,14 @@ class JoinCommand:
             )
             return
             
-        if self.db.is_joined(guild_id, user_id):
+        if await self.db.is_joined(guild_id, user_id):
             await interaction.response.send_message(
                 "⚔️ You're already participating in the boss challenge!",
                 ephemeral=True
             )
             return
         
-        success = self.db.join_user_with_mode(guild_id, user_id, mode)
+        success = await self.db.join_user_with_mode(guild_id, user_id, mode)
         if success:
             starting_boss = self.boss_service.get_next_boss(0, mode)
             mode_info = self.boss_service.get_mode_info(mode)
@@ -43,14 +44,7 @@ class JoinCommand:
                 ephemeral=True
             )
             
-            user_mode = self.db.get_user_mode(guild_id, user_id)
-            from bot.cogs.commands.leaderboard_manager import LeaderboardManager
-            leaderboard_manager = LeaderboardManager(self.bot, self.db, self.boss_service)
-            channel = await leaderboard_manager.get_channel_by_id(guild_id, user_mode)
-            if channel:
-                await leaderboard_manager.update_mode_leaderboard(channel, guild_id, user_mode)
-            else:
-                print(f"No leaderboard channel found for mode {user_mode}")
+            self.leaderboard_manager.request_update(guild_id, mode)
         else:
             await interaction.response.send_message(
                 "❌ Something went wrong. Please try again.",
@@ -0,0 +1,73 @@
+import discord
+
+from bot.services.boss_progression import BossProgressionService
+from bot.services.discord_dispatcher import PRIORITY_FOLLOWUP, get_dispatcher, interaction_route
+
+
+class LeaderboardPageView(discord.ui.View):
+    
+    def __init__(self, leaderboard_manager, guild_id: int, mode: str, page_number: int, total_pages: int):
+        super().__init__(timeout=180)
+        self.leaderboard_manager = leaderboard_manager
+        self.guild_id = guild_id
+        self.mode = mode
+        self.page_number = page_number
+        self.total_pages = total_pages
+        self._sync_buttons()
+    
+    def _sync_buttons(self):
+        self.previous_page.disabled = self.page_number <= 1
+        self.next_page.disabled = self.page_number >= self.total_pages
+    
+    async def _show(self, interaction: discord.Interaction, page_number: int):
+        await interaction.response.defer()
+        embed, self.page_number, self.total_pages = await self.leaderboard_manager.get_leaderboard_page(
+            self.guild_id, self.mode, page_number
+        )
+        self._sync_buttons()
+        await interaction.edit_original_response(embed=embed, view=self)
+    
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.page_number - 1)
+    
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.page_number + 1)
+
+
+class LeaderboardCommand:
+    
+    def __init__(self, bot, db, boss_service: BossProgressionService, leaderboard_manager):
+        self.bot = bot
+        self.db = db
+        self.boss_service = boss_service
+        self.leaderboard_manager = leaderboard_manager
+        self.dispatcher = get_dispatcher()
+    
+    async def leaderboard(self, interaction: discord.Interaction, mode: str, page: int = 1):
+        mode = mode.lower()
+        if mode not in ["easy", "normal", "hard", "extreme"]:
+            await interaction.response.send_message(
+                "❌ Invalid mode! Choose one of: easy, normal, hard, extreme.",
+                ephemeral=True
+            )
+            return
+        
+        await interaction.response.defer(ephemeral=True)
+        
+        try:
+            embed, page_number, total_pages = await self.leaderboard_manager.get_leaderboard_page(
+                interaction.guild_id, mode, page
+            )
+            view = LeaderboardPageView(self.leaderboard_manager, interaction.guild_id, mode, page_number, total_pages)
+            await self.dispatcher.run(
+                PRIORITY_FOLLOWUP, interaction_route(interaction),
+                interaction.followup.send, embed=embed, view=view, ephemeral=True
+            )
+        except Exception as e:
+            print(f"Error in leaderboard command: {e}")
+            await self.dispatcher.run(
+                PRIORITY_FOLLOWUP, interaction_route(interaction),
+                interaction.followup.send, "❌ Could not load the leaderboard.", ephemeral=True
+            )
@@ -1,7 +1,18 @@
+import copy
+import os
+from collections import OrderedDict
+
 import discord
-from datetime import datetime, timezone
 
+from bot.cogs.commands.leaderboard_renderer import LeaderboardRenderer, get_rank_medal
 from bot.services.boss_progression import BossProgressionService
+from bot.services.discord_dispatcher import PRIORITY_LEADERBOARD, channel_route, fetch_history, get_dispatcher
+from bot.services.display_names import get_display_name_cache
+from bot.services.leaderboard_scheduler import LeaderboardRefreshScheduler
+from bot.services.static_messages import embed_fingerprint, get_static_message_tracker
+
+
+LEADERBOARD_PAGE_SIZE = 10
 
 
 class LeaderboardManager:
@@ -10,38 +21,61 @@ class LeaderboardManager:
         self.bot = bot
         self.db = db
         self.boss_service = boss_service
+        self.display_names = get_display_name_cache(bot)
+        self.renderer = LeaderboardRenderer(boss_service)
+        self.dispatcher = get_dispatcher()
+        self.static_messages = get_static_message_tracker(bot)
+        self.scheduler = LeaderboardRefreshScheduler(
+            self.refresh_mode_leaderboard,
+            window=float(os.getenv('LEADERBOARD_REFRESH_WINDOW', '3')),
+            max_staleness=float(os.getenv('LEADERBOARD_MAX_STALENESS', '10')),
+            flush_timeout=float(os.getenv('LEADERBOARD_FLUSH_TIMEOUT', '10'))
+        )
+        self._published_fingerprints = {}
+        self._message_handles = {}
+        self._page_cache = OrderedDict()
+        self.page_cache_size = max(1, int(os.getenv('LEADERBOARD_PAGE_CACHE_SIZE', '256')))
+        self.page_hits = 0
+        self.page_misses = 0
+        self.skipped_edits = 0
+        self.published_edits = 0
+    
+    def request_update(self, guild_id: int, mode: str):
+        self.scheduler.mark_dirty(guild_id, mode)
+    
+    async def refresh_mode_leaderboard(self, guild_id: int, mode: str):
+        await self.bot.wait_until_provisioned(self.bot.get_guild(guild_id))
+        channel = await self.get_channel_by_id(guild_id, mode)
+        if channel:
+            await self.update_mode_leaderboard(channel, guild_id, mode)
+        else:
+            print(f"No leaderboard channel found for mode {mode}")
+    
+    def get_refresh_metrics(self) -> dict:
+        metrics = self.scheduler.metrics()
+        metrics['skipped_edits'] = self.skipped_edits
+        metrics['published_edits'] = self.published_edits
+        metrics['page_hits'] = self.page_hits
+        metrics['page_misses'] = self.page_misses
+        return metrics
+    
+    def _embed_fingerprint(self, embed: discord.Embed) -> str:
+        return embed_fingerprint(embed)
+    
+    async def close(self):
+        await self.scheduler.close()
     
     async def get_user_display_name(self, guild_id: int, user_id: int) -> str:
-        user = None
-        guild = self.bot.get_guild(guild_id)
-        
-        user = self.bot.get_user(user_id)
-        
-        if not user:
-            try:
-                user = await self.bot.fetch_user(user_id)
-            except:
-                pass
-        
-        if not user and guild:
-            try:
-                user = guild.get_member(user_id)
-            except:
-                pass
-        
-        if user:
-            if hasattr(user, 'display_name') and user.display_name:
-                return user.display_name
-            elif hasattr(user, 'global_name') and user.global_name:
-                return user.global_name
-            else:
-                return user.name
-        else:
-            return f"User {user_id}"
+        names = await self.display_names.resolve_many(guild_id, [user_id])
+        return names[user_id]
+    
+    async def _resolve_board_names(self, guild_id: int, board: dict) -> dict[int, str]:
+        user_ids = [row['user_id'] for row in board['finalized'] + board['live'][:10]]
+        return await self.display_names.resolve_many(guild_id, user_ids)
     
     async def get_channel_by_id(self, guild_id: int, difficulty: str):
         try:
-            channel_id = self.db.get_discord_resource(guild_id, f"channel_{difficulty}")
+            channel_id = await self.db.get_discord_resource(guild_id, f"channel_{difficulty}")
             if channel_id:
                 guild = self.bot.get_guild(guild_id)
                 if guild:
@@ -51,220 +85,62 @@ class LeaderboardManager:
             print(f"Error getting channel for {difficulty}: {e}")
             return None
     
+    async def _send(self, channel, embed: discord.Embed):
+        return await self.dispatcher.run(PRIORITY_LEADERBOARD, channel_route(channel.id), channel.send, embed=embed)
+    
+    async def _edit(self, message, embed: discord.Embed):
+        return await self.dispatcher.run(PRIORITY_LEADERBOARD, channel_route(message.channel.id), message.edit, embed=embed)
+    
+    async def _history(self, channel, limit: int = 50) -> list:
+        return await self.dispatcher.run(PRIORITY_LEADERBOARD, channel_route(channel.id), fetch_history, channel, limit)
+    
     def get_rank_medal(self, rank: int) -> str:
-        if rank == 1:
-            return "🥇"
-        elif rank == 2:
-            return "🥈"
-        elif rank == 3:
-            return "🥉"
-        else:
-            return f"{rank}."
+        return get_rank_medal(rank)
     
-    def get_user_mode_rank(self, guild_id: int, user_id: int, mode: str) -> int:
-        all_leaderboard = self.db.get_leaderboard(guild_id, limit=1000)
-        mode_leaderboard = [user for user in all_leaderboard if user.get('mode', 'normal') == mode]
-        
-        for i, user_data in enumerate(mode_leaderboard, 1):
-            if user_data['user_id'] == user_id:
-                return i
-        return 0
+    async def get_user_mode_rank(self, guild_id: int, user_id: int, mode: str) -> int:
+        return await self.db.get_user_rank(guild_id, user_id, mode)
     
     async def create_normal_mode_content(self, channel, guild_id: int):
-        try:
-            has_content = await self._check_existing_content(channel)
-            if not has_content:
-                embed = self._create_boss_list_embed("normal")
-                await channel.send(embed=embed)
-                await self.ensure_mode_leaderboard(channel, guild_id, "normal")
-        except Exception as e:
-            print(f"Error creating normal mode content: {e}")
+        await self.create_difficulty_content(channel, guild_id, "normal")
     
     async def create_hard_mode_content(self, channel, guild_id: int):
-        try:
-            has_content = await self._check_existing_content(channel)
-            if not has_content:
-                embed = self._create_boss_list_embed("hard")
-                await channel.send(embed=embed)
-                await self.ensure_mode_leaderboard(channel, guild_id, "hard")
-        except Exception as e:
-            print(f"Error creating hard mode content: {e}")
+        await self.create_difficulty_content(channel, guild_id, "hard")
     
     async def create_difficulty_content(self, channel, guild_id: int, difficulty: str):
         try:
-            has_content = await self._check_existing_content(channel)
-            
-            if not has_content:
-                embed = self._create_boss_list_embed(difficulty)
-                await channel.send(embed=embed)
+            embed = self._create_boss_list_embed(difficulty)
+            created = await self.static_messages.ensure(channel, guild_id, f"boss_list_{difficulty}", embed)
+            if created:
                 await self.ensure_mode_leaderboard(channel, guild_id, difficulty)
                 
         except Exception as e:
             print(f"Error creating {difficulty} mode content: {e}")
     
-    async def _check_existing_content(self, channel):
-        async for message in channel.history(limit=50):
-            if message.author == self.bot.user and message.embeds:
-                embed = message.embeds[0]
-                if embed.title and ("Boss Progression" in embed.title or "Leaderboard" in embed.title):
-                    return True
-        return False
-    
     def _create_boss_list_embed(self, difficulty: str):
-        mode_info = self.boss_service.get_mode_info(difficulty)
-        color_map = {
-            "green": discord.Color.green(),
-            "blue": discord.Color.blue(),
-            "red": discord.Color.red(),
-            "purple": discord.Color.purple()
-        }
-        color = color_map.get(mode_info['color_name'], discord.Color.blue())
-        
-        embed = discord.Embed(
-            title=f"{mode_info['emoji']} {mode_info['name']} Boss Progression",
-            color=color
-        )
-        
-        boss_list = self.boss_service.get_difficulty_boss_list(difficulty)
-        
-        if difficulty == "extreme":
-            embed.add_field(
-                name="Starting Boss",
-                value="**Corrupted Hunleff**",
-                inline=False
-            )
-            embed.add_field(
-                name="After Completion",
-                value="Random bosses from the entire boss list",
-                inline=False
-            )
-        else:
-            boss_text1, boss_text2 = self._format_boss_list(boss_list)
-            
-            embed.add_field(
-                name=f"Bosses 1-{min(25, len(boss_list))}",
-                value=boss_text1,
-                inline=True
-            )
-            
-            if len(boss_list) > 25:
-                embed.add_field(
-                    name=f"Bosses 26-{len(boss_list)}",
-                    value=boss_text2,
-                    inline=True
-                )
-        
-        return embed
-    
-    def _format_boss_list(self, boss_list):
-        boss_text1 = ""
-        boss_text2 = ""
-        
-        for i, boss_name in enumerate(boss_list):
-            if i < 25:
-                boss_text1 += f"{i+1}. **{boss_name}**\n"
-            else:
-                boss_text2 += f"{i+1}. **{boss_name}**\n"
-        
-        return boss_text1, boss_text2
+        return self.renderer.boss_list_embed(difficulty)
     
     async def ensure_mode_leaderboard(self, channel, guild_id: int, mode: str):
         try:
             resource_type = f"leaderboard_{mode}"
-            stored_message_id = self.db.get_discord_resource(guild_id, resource_type)
+            stored_message_id = await self.db.get_discord_resource(guild_id, resource_type)
             
             if stored_message_id:
-                try:
-                    stored_message = await channel.fetch_message(stored_message_id)
-                    # Message exists and is accessible, we're good
-                    return
-                except:
-                    self.db.remove_discord_resource(guild_id, resource_type)
+                await self.update_mode_leaderboard(channel, guild_id, mode)
+                return
             
             message = await self.create_initial_leaderboard(channel, guild_id, mode)
             if message:
-                self.db.store_discord_resource(guild_id, resource_type, message.id, {'mode': mode})
+                await self.db.store_discord_resource(guild_id, resource_type, message.id, {'mode': mode})
+                self._message_handles[(guild_id, mode)] = message
                 
         except Exception as e:
             print(f"Error ensuring {mode} mode leaderboard: {e}")
     
     async def create_initial_leaderboard(self, channel, guild_id: int, mode: str):
         try:
-            mode_info = self.boss_service.get_mode_info(mode)
-            color_map = {
-                "green": discord.Color.green(),
-                "blue": discord.Color.blue(),
-                "red": discord.Color.red(),
-                "purple": discord.Color.purple()
-            }
-            color = color_map.get(mode_info['color_name'], discord.Color.blue())
-            
-            if mode == "extreme":
-                live = self.db.get_extreme_live_with_archive(guild_id)
-                embed = discord.Embed(
-                    title=f"{mode_info['emoji']} Extreme Mode Live Progress",
-                    color=color
-                )
-                if live:
-                    text = ""
-                    for i, user_data in enumerate(live[:10], 1):
-                        username = await self.get_user_display_name(guild_id, user_data['user_id'])
-                        progress = user_data['progress']
-                        next_boss = self.boss_service.get_next_boss_for_difficulty(progress, mode)
-                        if not next_boss:
-                            assigned = self.db.get_next_extreme_boss(guild_id, user_data['user_id'])
-                            next_boss = assigned or "🎲 Random Boss"
-                        medal = self.get_rank_medal(i)
-                        text += f"{medal} **{username}** - {progress} defeated | Current: {next_boss}\n"
-                    embed.add_field(name="Rankings", value=text, inline=False)
-                else:
-                    embed.add_field(name="No active participants",
-                                    value="Use `/join` to start Extreme Mode.",
-                                    inline=False)
-                embed.set_footer(text="Last updated")
-                embed.timestamp = discord.utils.utcnow()
-            
-            else:
-                finalized = self.db.get_finalized_leaderboard(guild_id, mode)
-                live = self.db.get_live_leaderboard(guild_id, mode)
-                embed = discord.Embed(
-                    title=f"{mode_info['emoji']} {mode_info['name']} Leaderboard",
-                    color=color
-                )
-                if finalized:
-                    fin_text = ""
-                    for i, row in enumerate(finalized, 1):
-                        username = await self.get_user_display_name(guild_id, row['user_id'])
-                        medal = self.get_rank_medal(i)
-                        when_raw = row.get('completion_time', '')
-                        when_fmt = when_raw
-                        try:
-                            when_dt = datetime.fromisoformat(when_raw.replace('Z', ''))
-                            if when_dt.tzinfo is None:
-                                when_dt = when_dt.replace(tzinfo=timezone.utc)
-                            unix_ts = int(when_dt.timestamp())
-                            when_fmt = f"<t:{unix_ts}:f>"
-                        except Exception:
-                            pass
-                        fin_text += f"{medal} **{username}** • completed at {when_fmt}\n"
-                    embed.add_field(name="🏁 Completed", value=fin_text, inline=False)
-                else:
-                    embed.add_field(name="🏁 Completed", value="No completions yet", inline=False)
-                embed.add_field(name="\u200b", value="— — —", inline=False)
-                if live:
-                    prog_text = ""
-                    for user_data in live[:10]:
-                        username = await self.get_user_display_name(guild_id, user_data['user_id'])
-                        progress = user_data['progress']
-                        next_boss = self.boss_service.get_next_boss_for_difficulty(progress, mode) or "🎉 COMPLETED!"
-                        prog_text += f"• **{username}** — {progress} defeated | Next: {next_boss}\n"
-                    embed.add_field(name="⏳ Progress", value=prog_text, inline=False)
-                else:
-                    embed.add_field(name="⏳ Progress", value="No active participants", inline=False)
-                embed.set_footer(text="Last updated")
-                embed.timestamp = discord.utils.utcnow()
-            
-            message = await channel.send(embed=embed)
+            embed = await self._create_leaderboard_embed(guild_id, mode)
+            message = await self._send(channel, embed)
+            self._published_fingerprints[(guild_id, mode)] = self._embed_fingerprint(embed)
             return message
             
         except Exception as e:
@@ -273,41 +149,54 @@ class LeaderboardManager:
     
     async def update_mode_leaderboard(self, channel, guild_id: int, mode: str):
         try:
-            leaderboard_message = await self._get_leaderboard_message(channel, guild_id, mode)
             embed = await self._create_leaderboard_embed(guild_id, mode)
+            fingerprint = self._embed_fingerprint(embed)
+            if self._published_fingerprints.get((guild_id, mode)) == fingerprint:
+                self.skipped_edits += 1
+                return
             
-            if leaderboard_message:
-                try:
-                    await leaderboard_message.edit(embed=embed)
-                except:
-                    new_message = await channel.send(embed=embed)
-                    self.db.store_discord_resource(guild_id, f"leaderboard_{mode}", new_message.id, {'mode': mode})
-            else:
-                new_message = await channel.send(embed=embed)
-                self.db.store_discord_resource(guild_id, f"leaderboard_{mode}", new_message.id, {'mode': mode})
+            await self._publish_leaderboard(channel, guild_id, mode, embed)
+            self._published_fingerprints[(guild_id, mode)] = fingerprint
+            self.published_edits += 1
                 
         except Exception as e:
             print(f"Error updating {mode} mode leaderboard: {e}")
     
+    async def _publish_leaderboard(self, channel, guild_id: int, mode: str, embed: discord.Embed):
+        resource_type = f"leaderboard_{mode}"
+        leaderboard_message = await self._get_leaderboard_message(channel, guild_id, mode)
+        if leaderboard_message:
+            try:
+                await self._edit(leaderboard_message, embed)
+                return
+            except discord.NotFound:
+                self._message_handles.pop((guild_id, mode), None)
+                await self.db.remove_discord_resource(guild_id, resource_type)
+            
+            leaderboard_message = await self._find_existing_leaderboard(channel, guild_id, mode, resource_type)
+            if leaderboard_message:
+                await self._edit(leaderboard_message, embed)
+                return
+        
+        new_message = await self._send(channel, embed)
+        await self.db.store_discord_resource(guild_id, resource_type, new_message.id, {'mode': mode})
+        self._message_handles[(guild_id, mode)] = new_message
+    
     async def _get_leaderboard_message(self, channel, guild_id: int, mode: str):
         resource_type = f"leaderboard_{mode}"
-        stored_message_id = self.db.get_discord_resource(guild_id, resource_type)
+        stored_message_id = await self.db.get_discord_resource(guild_id, resource_type)
         
-        leaderboard_message = None
         if stored_message_id:
-            try:
-                leaderboard_message = await channel.fetch_message(stored_message_id)
-            except:
-                self.db.remove_discord_resource(guild_id, resource_type)
-                leaderboard_message = None
-        
-        if not leaderboard_message:
-            leaderboard_message = await self._find_existing_leaderboard(channel, guild_id, mode, resource_type)
+            handle = self._message_handles.get((guild_id, mode))
+            if handle is None or handle.id != stored_message_id or handle.channel.id != channel.id:
+                handle = channel.get_partial_message(stored_message_id)
+                self._message_handles[(guild_id, mode)] = handle
+            return handle
         
-        return leaderboard_message
+        return await self._find_existing_leaderboard(channel, guild_id, mode, resource_type)
     
     async def _find_existing_leaderboard(self, channel, guild_id: int, mode: str, resource_type: str):
-        async for message in channel.history(limit=50):
+        for message in await self._history(channel, 50):
             if message.author == self.bot.user and message.embeds:
                 embed = message.embeds[0]
                 if mode == "extreme":
@@ -315,92 +204,39 @@ class LeaderboardManager:
                 else:
                     match_title = f"{mode.title()} Mode Leaderboard"
                 if embed.title and match_title in embed.title:
-                    self.db.store_discord_resource(guild_id, resource_type, message.id, {'mode': mode})
+                    await self.db.store_discord_resource(guild_id, resource_type, message.id, {'mode': mode})
+                    self._message_handles[(guild_id, mode)] = message
                     return message
         return None
     
     async def _create_leaderboard_embed(self, guild_id: int, mode: str):
-        mode_info = self.boss_service.get_mode_info(mode)
-        color_map = {
-            "green": discord.Color.green(),
-            "blue": discord.Color.blue(),
-            "red": discord.Color.red(),
-            "purple": discord.Color.purple()
-        }
-        color = color_map.get(mode_info['color_name'], discord.Color.blue())
-        
-        if mode == "extreme":
-            return await self._create_extreme_embed(guild_id, mode_info, color)
-        else:
-            return await self._create_standard_embed(guild_id, mode, mode_info, color)
-    
-    async def _create_extreme_embed(self, guild_id: int, mode_info: dict, color):
-        live = self.db.get_extreme_live_with_archive(guild_id)
-        embed = discord.Embed(
-            title=f"{mode_info['emoji']} Extreme Mode Live Progress",
-            color=color
+        board = await self.db.get_mode_board(guild_id, mode, limit=10)
+        names = await self._resolve_board_names(guild_id, board)
+        return self.renderer.render(mode, board, names)
+    
+    async def get_leaderboard_page(self, guild_id: int, mode: str, page_number: int):
+        page_number = max(1, page_number)
+        version = await self.db.get_board_version(guild_id, mode)
+        key = (guild_id, mode, page_number)
+        cached = self._page_cache.get(key)
+        if cached and cached[0] == version:
+            self._page_cache.move_to_end(key)
+            self.page_hits += 1
+            return discord.Embed.from_dict(copy.deepcopy(cached[1])), page_number, cached[2]
+        
+        self.page_misses += 1
+        page = await self.db.get_board_page(
+            guild_id, mode, (page_number - 1) * LEADERBOARD_PAGE_SIZE, LEADERBOARD_PAGE_SIZE
         )
-        if live:
-            text = ""
-            for i, user_data in enumerate(live[:10], 1):
-                username = await self.get_user_display_name(guild_id, user_data['user_id'])
-                progress = user_data['progress']
-                next_boss = self.boss_service.get_next_boss_for_difficulty(progress, "extreme")
-                if not next_boss:
-                    assigned = self.db.get_next_extreme_boss(guild_id, user_data['user_id'])
-                    next_boss = assigned or "🎲 Random Boss"
-                medal = self.get_rank_medal(i)
-                text += f"{medal} **{username}** - {progress} defeated | Current: {next_boss}\n"
-            embed.add_field(name="Rankings", value=text, inline=False)
-        else:
-            embed.add_field(name="No active participants",
-                            value="Use `/join` to start Extreme Mode.",
-                            inline=False)
-        embed.set_footer(text="Last updated")
-        embed.timestamp = discord.utils.utcnow()
-        return embed
-    
-    async def _create_standard_embed(self, guild_id: int, mode: str, mode_info: dict, color):
-        finalized = self.db.get_finalized_leaderboard(guild_id, mode)
-        live = self.db.get_live_leaderboard(guild_id, mode)
-        embed = discord.Embed(
-            title=f"{mode_info['emoji']} {mode_info['name']} Leaderboard",
-            color=color
-        )
-        
-        if finalized:
-            fin_text = ""
-            for i, row in enumerate(finalized, 1):
-                username = await self.get_user_display_name(guild_id, row['user_id'])
-                medal = self.get_rank_medal(i)
-                when_raw = row.get('completion_time', '')
-                when_fmt = when_raw
-                try:
-                    when_dt = datetime.fromisoformat(when_raw.replace('Z', ''))
-                    if when_dt.tzinfo is None:
-                        when_dt = when_dt.replace(tzinfo=timezone.utc)
-                    unix_ts = int(when_dt.timestamp())
-                    when_fmt = f"<t:{unix_ts}:f>"
-                except Exception:
-                    pass
-                fin_text += f"{medal} **{username}** • finished at {when_fmt}\n"
-            embed.add_field(name="🏁 Finished", value=fin_text, inline=False)
-        else:
-            embed.add_field(name="🏁 Finished", value="No finishers yet", inline=False)
-        
-        embed.add_field(name="\u200b", value="— — —", inline=False)
-        
-        if live:
-            prog_text = ""
-            for user_data in live[:10]:
-                username = await self.get_user_display_name(guild_id, user_data['user_id'])
-                progress = user_data['progress']
-                next_boss = self.boss_service.get_next_boss_for_difficulty(progress, mode) or "🎉 COMPLETED!"
-                prog_text += f"• **{username}** — {progress} defeated | Current: {next_boss}\n"
-            embed.add_field(name="⏳ In Progress", value=prog_text, inline=False)
-        else:
-            embed.add_field(name="⏳ In Progress", value="No active participants", inline=False)
-        
-        embed.set_footer(text="Last updated")
-        embed.timestamp = discord.utils.utcnow()
-        return embed
+        total_pages = max(1, -(-page['total'] // LEADERBOARD_PAGE_SIZE))
+        if page_number > total_pages:
+            return await self.get_leaderboard_page(guild_id, mode, total_pages)
+        
+        user_ids = [row['user_id'] for row in page['finalized'] + page['live']]
+        names = await self.display_names.resolve_many(guild_id, user_ids)
+        embed = self.renderer.render_page(mode, page, names, page_number, LEADERBOARD_PAGE_SIZE)
+        self._page_cache[key] = (page['version'], embed.to_dict(), total_pages)
+        self._page_cache.move_to_end(key)
+        while len(self._page_cache) > self.page_cache_size:
+            self._page_cache.popitem(last=False)
+        return embed, page_number, total_pages
@@ -0,0 +1,252 @@
+import copy
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+import discord
+
+from bot.services.boss_progression import BossProgressionService
+
+
+COLOR_MAP = {
+    "green": discord.Color.green(),
+    "blue": discord.Color.blue(),
+    "red": discord.Color.red(),
+    "purple": discord.Color.purple()
+}
+
+MEDALS = {1: "🥇", 2: "🥈", 3: "🥉"}
+
+FIELD_LIMIT = 1024
+
+
+def get_rank_medal(rank: int) -> str:
+    return MEDALS.get(rank, f"{rank}.")
+
+
+def format_completion_time(when_raw: str) -> str:
+    try:
+        when_dt = datetime.fromisoformat(when_raw.replace('Z', ''))
+        if when_dt.tzinfo is None:
+            when_dt = when_dt.replace(tzinfo=timezone.utc)
+        return f"<t:{int(when_dt.timestamp())}:f>"
+    except Exception:
+        return when_raw
+
+
+def _more_line(count: int) -> str:
+    return f"…and {count} more — use `/leaderboard`\n"
+
+
+def fit_field(lines: list[str], hidden: int = 0) -> str:
+    text = ""
+    for index, line in enumerate(lines):
+        after = len(lines) - index - 1 + hidden
+        reserve = len(_more_line(after)) if after else 0
+        if len(text) + len(line) + reserve > FIELD_LIMIT:
+            return text + _more_line(after + 1)
+        text += line
+    return text + (_more_line(hidden) if hidden else "")
+
+
+class LeaderboardRenderer:
+    def __init__(self, boss_service: BossProgressionService, max_cached_lines: int = 20000):
+        self.boss_service = boss_service
+        self.max_cached_lines = max(1, max_cached_lines)
+        self._lines = OrderedDict()
+        self.line_hits = 0
+        self.line_misses = 0
+        self._templates = {
+            mode: self._build_template(mode)
+            for mode in boss_service.difficulty_boss_lists
+        }
+
+    def _build_template(self, mode: str) -> dict:
+        mode_info = self.boss_service.get_mode_info(mode)
+        color = COLOR_MAP.get(mode_info['color_name'], discord.Color.blue())
+        if mode == "extreme":
+            title = f"{mode_info['emoji']} Extreme Mode Live Progress"
+        else:
+            title = f"{mode_info['emoji']} {mode_info['name']} Leaderboard"
+        return {
+            'mode': mode,
+            'mode_info': mode_info,
+            'color': color,
+            'title': title,
+            'boss_list': self._build_boss_list_embed(mode, mode_info, color).to_dict(),
+            'next_bosses': self.boss_service.get_difficulty_boss_list(mode),
+        }
+
+    def _template(self, mode: str) -> dict:
+        template = self._templates.get(mode)
+        if template is None:
+            template = self._templates[mode] = self._build_template(mode)
+        return template
+
+    def _build_boss_list_embed(self, difficulty: str, mode_info: dict, color) -> discord.Embed:
+        embed = discord.Embed(
+            title=f"{mode_info['emoji']} {mode_info['name']} Boss Progression",
+            color=color
+        )
+
+        boss_list = self.boss_service.get_difficulty_boss_list(difficulty)
+
+        if difficulty == "extreme":
+            embed.add_field(
+                name="Starting Boss",
+                value="**Corrupted Hunleff**",
+                inline=False
+            )
+            embed.add_field(
+                name="After Completion",
+                value="Random bosses from the entire boss list",
+                inline=False
+            )
+        else:
+            first = "".join(f"{i+1}. **{boss_name}**\n" for i, boss_name in enumerate(boss_list[:25]))
+            embed.add_field(
+                name=f"Bosses 1-{min(25, len(boss_list))}",
+                value=first,
+                inline=True
+            )
+
+            if len(boss_list) > 25:
+                rest = "".join(f"{i+26}. **{boss_name}**\n" for i, boss_name in enumerate(boss_list[25:]))
+                embed.add_field(
+                    name=f"Bosses 26-{len(boss_list)}",
+                    value=rest,
+                    inline=True
+                )
+
+        return embed
+
+    def boss_list_embed(self, mode: str) -> discord.Embed:
+        return discord.Embed.from_dict(copy.deepcopy(self._template(mode)['boss_list']))
+
+    def _line(self, key: tuple, build) -> str:
+        line = self._lines.get(key)
+        if line is not None:
+            self.line_hits += 1
+            self._lines.move_to_end(key)
+            return line
+        self.line_misses += 1
+        line = self._lines[key] = build()
+        while len(self._lines) > self.max_cached_lines:
+            self._lines.popitem(last=False)
+        return line
+
+    def _next_boss(self, template: dict, progress: int) -> str | None:
+        next_bosses = template['next_bosses']
+        if template['mode'] == "extreme":
+            return next_bosses[0] if progress == 0 else None
+        return next_bosses[progress] if progress < len(next_bosses) else None
+
+    def _extreme_line(self, template: dict, rank: int, username: str, row: dict) -> str:
+        progress = row['progress']
+        next_extreme_boss = row.get('next_extreme_boss')
+
+        def build():
+            next_boss = self._next_boss(template, progress) or next_extreme_boss or "🎲 Random Boss"
+            return f"{get_rank_medal(rank)} **{username}** - {progress} defeated | Current: {next_boss}\n"
+
+        return self._line(('extreme', rank, username, progress, next_extreme_boss), build)
+
+    def _finalized_line(self, rank: int, username: str, row: dict) -> str:
+        when_raw = row.get('completion_time', '')
+
+        def build():
+            return f"{get_rank_medal(rank)} **{username}** • finished at {format_completion_time(when_raw)}\n"
+
+        return self._line(('finalized', rank, username, when_raw), build)
+
+    def _progress_line(self, template: dict, mode: str, username: str, row: dict) -> str:
+        progress = row['progress']
+
+        def build():
+            next_boss = self._next_boss(template, progress) or "🎉 COMPLETED!"
+            return f"• **{username}** — {progress} defeated | Current: {next_boss}\n"
+
+        return self._line(('progress', mode, username, progress), build)
+
+    def _ranked_progress_line(self, template: dict, mode: str, rank: int, username: str, row: dict) -> str:
+        progress = row['progress']
+
+        def build():
+            next_boss = self._next_boss(template, progress) or "🎉 COMPLETED!"
+            return f"{get_rank_medal(rank)} **{username}** — {progress} defeated | Current: {next_boss}\n"
+
+        return self._line(('ranked', mode, rank, username, progress), build)
+
+    def render(self, mode: str, board: dict, names: dict[int, str], live_limit: int = 10) -> discord.Embed:
+        template = self._template(mode)
+        embed = discord.Embed(title=template['title'], color=template['color'])
+        live = board['live'][:live_limit]
+
+        if mode == "extreme":
+            if live:
+                lines = [
+                    self._extreme_line(template, rank, names[row['user_id']], row)
+                    for rank, row in enumerate(live, 1)
+                ]
+                embed.add_field(name="Rankings", value=fit_field(lines), inline=False)
+            else:
+                embed.add_field(name="No active participants",
+                                value="Use `/join` to start Extreme Mode.",
+                                inline=False)
+        else:
+            finalized = board['finalized']
+            if finalized:
+                lines = [
+                    self._finalized_line(rank, names[row['user_id']], row)
+                    for rank, row in enumerate(finalized, 1)
+                ]
+                hidden = board.get('finalized_total', len(finalized)) - len(finalized)
+                embed.add_field(name="🏁 Finished", value=fit_field(lines, hidden), inline=False)
+            else:
+                embed.add_field(name="🏁 Finished", value="No finishers yet", inline=False)
+
+            embed.add_field(name="\u200b", value="— — —", inline=False)
+
+            if live:
+                lines = [
+                    self._progress_line(template, mode, names[row['user_id']], row)
+                    for row in live
+                ]
+                embed.add_field(name="⏳ In Progress", value=fit_field(lines), inline=False)
+            else:
+                embed.add_field(name="⏳ In Progress", value="No active participants", inline=False)
+
+        embed.set_footer(text="Last updated")
+        embed.timestamp = discord.utils.utcnow()
+        return embed
+
+    def render_page(self, mode: str, page: dict, names: dict[int, str], page_number: int, page_size: int) -> discord.Embed:
+        template = self._template(mode)
+        total_pages = max(1, -(-page['total'] // page_size))
+        embed = discord.Embed(
+            title=f"{template['title']} — Page {page_number}/{total_pages}",
+            color=template['color']
+        )
+        offset = (page_number - 1) * page_size
+        lines = [
+            self._finalized_line(rank, names[row['user_id']], row)
+            for rank, row in enumerate(page['finalized'], offset + 1)
+        ]
+        first_live_rank = max(offset, page['finalized_total']) + 1
+        for rank, row in enumerate(page['live'], first_live_rank):
+            if mode == "extreme":
+                lines.append(self._extreme_line(template, rank, names[row['user_id']], row))
+            else:
+                lines.append(self._ranked_progress_line(template, mode, rank, names[row['user_id']], row))
+        if lines:
+            embed.add_field(name="Rankings", value=fit_field(lines), inline=False)
+        else:
+            embed.add_field(name="Rankings", value="No participants yet", inline=False)
+        embed.set_footer(text=f"{page['total']} ranked")
+        return embed
+
+    def metrics(self) -> dict:
+        return {
+            'cached_lines': len(self._lines),
+            'line_hits': self.line_hits,
+            'line_misses': self.line_misses,
+        }
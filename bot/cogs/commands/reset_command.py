@@ -1,34 +1,35 @@
 import discord
 
 from bot.services.boss_progression import BossProgressionService
+from bot.services.discord_dispatcher import PRIORITY_COMPLETION, channel_route, get_dispatcher
 
 
 class ResetCommand:
     
-    def __init__(self, bot, db, boss_service: BossProgressionService):
+    def __init__(self, bot, db, boss_service: BossProgressionService, leaderboard_manager):
         self.bot = bot
         self.db = db
         self.boss_service = boss_service
+        self.leaderboard_manager = leaderboard_manager
+        self.dispatcher = get_dispatcher()
     
     async def reset(self, interaction: discord.Interaction):
         guild_id = interaction.guild_id
         user_id = interaction.user.id
         
-        if not self.db.is_joined(guild_id, user_id):
+        if not await self.db.is_joined(guild_id, user_id):
             await interaction.response.send_message(
                 "❓ You're not currently participating in the boss challenge. Use `/join` first.",
                 ephemeral=True
             )
             return
         
-        user_mode = self.db.get_user_mode(guild_id, user_id)
-        current_progress = self.db.get_user_progress(guild_id, user_id)
+        user_mode = await self.db.get_user_mode(guild_id, user_id)
+        current_progress = await self.db.get_user_progress(guild_id, user_id)
         
-        from bot.cogs.commands.leaderboard_manager import LeaderboardManager
-        leaderboard_manager = LeaderboardManager(self.bot, self.db, self.boss_service)
-        current_rank = leaderboard_manager.get_user_mode_rank(guild_id, user_id, user_mode)
+        current_rank = await self.leaderboard_manager.get_user_mode_rank(guild_id, user_id, user_mode)
         
-        success = self.db.reset_user(guild_id, user_id)
+        success = await self.db.reset_user(guild_id, user_id)
         if success:
             starting_boss = self.boss_service.get_next_boss(0, user_mode)
             await interaction.response.send_message(
@@ -36,25 +37,23 @@ class ResetCommand:
                 ephemeral=True
             )
             
-            await self._post_reset_announcement(interaction, user_mode, current_progress, current_rank, leaderboard_manager)
+            await self._post_reset_announcement(interaction, user_mode, current_progress, current_rank)
             
-            channel = await leaderboard_manager.get_channel_by_id(guild_id, user_mode)
-            if channel:
-                await leaderboard_manager.update_mode_leaderboard(channel, guild_id, user_mode)
+            self.leaderboard_manager.request_update(guild_id, user_mode)
         else:
             await interaction.response.send_message(
                 "❌ Something went wrong. Please try again.",
                 ephemeral=True
             )
     
-    async def _post_reset_announcement(self, interaction, user_mode, previous_progress, previous_rank, leaderboard_manager):
-        completions_channel_id = self.db.get_discord_resource(interaction.guild_id, "completions")
+    async def _post_reset_announcement(self, interaction, user_mode, previous_progress, previous_rank):
+        completions_channel_id = await self.db.get_discord_resource(interaction.guild_id, "completions")
         completions_channel = None
         if completions_channel_id:
             completions_channel = interaction.guild.get_channel(completions_channel_id)
         
         if completions_channel:
-            username = await leaderboard_manager.get_user_display_name(interaction.guild_id, interaction.user.id)
+            username = await self.leaderboard_manager.get_user_display_name(interaction.guild_id, interaction.user.id)
             starting_boss = self.boss_service.get_next_boss(0, user_mode)
             
             embed = discord.Embed(
@@ -65,4 +64,7 @@ class ResetCommand:
             embed.set_footer(text=f"Was at {previous_progress} bosses defeated")
             embed.timestamp = discord.utils.utcnow()
             
-            await completions_channel.send(embed=embed)
+            await self.dispatcher.run(
+                PRIORITY_COMPLETION, channel_route(completions_channel.id),
+                completions_channel.send, embed=embed
+            )
@@ -0,0 +1,30 @@
+import discord
+
+from bot.services.discord_dispatcher import PRIORITY_FOLLOWUP, get_dispatcher, interaction_route
+
+
+class SetupCommand:
+
+    def __init__(self, bot, db):
+        self.bot = bot
+        self.db = db
+        self.dispatcher = get_dispatcher()
+
+    async def setup(self, interaction: discord.Interaction):
+        if not interaction.user.guild_permissions.manage_guild:
+            await interaction.response.send_message("❌ You don't have permission to use this.", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True)
+
+        try:
+            await self.bot.ensure_guild_bootstrapped(interaction.guild, force=True)
+            message = "✅ Boss Challenge channels and leaderboards are set up."
+        except Exception as e:
+            print(f"Error in setup command: {e}")
+            message = "❌ Could not set up the Boss Challenge channels. Check the bot's permissions and try again."
+
+        await self.dispatcher.run(
+            PRIORITY_FOLLOWUP, interaction_route(interaction),
+            interaction.followup.send, message, ephemeral=True
+        )
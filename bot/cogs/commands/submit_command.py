@@ -1,18 +1,27 @@
 import discord
-from datetime import datetime
 
 from bot.services.boss_progression import BossProgressionService
-from bot.cogs.commands.leaderboard_manager import LeaderboardManager
+from bot.services.discord_dispatcher import (
+    PRIORITY_COMPLETION, PRIORITY_COSMETIC, PRIORITY_FOLLOWUP,
+    channel_route, get_dispatcher, guild_route, interaction_route
+)
 
 
 class SubmitCommand:
     
-    def __init__(self, bot, db, boss_service: BossProgressionService, image_service):
+    def __init__(self, bot, db, boss_service: BossProgressionService, image_service, leaderboard_manager):
         self.bot = bot
         self.db = db
         self.boss_service = boss_service
         self.image_service = image_service
-        self.leaderboard_manager = LeaderboardManager(bot, db, boss_service)
+        self.leaderboard_manager = leaderboard_manager
+        self.dispatcher = get_dispatcher()
+    
+    async def _followup(self, interaction: discord.Interaction, content: str):
+        await self.dispatcher.run(
+            PRIORITY_FOLLOWUP, interaction_route(interaction),
+            interaction.followup.send, content, ephemeral=True
+        )
     
     async def submit(
         self, 
@@ -22,7 +31,7 @@ class SubmitCommand:
         guild_id = interaction.guild_id
         user_id = interaction.user.id
         
-        if not self.db.is_joined(guild_id, user_id):
+        if not await self.db.is_joined(guild_id, user_id):
             await interaction.response.send_message(
                 "❓ You're not participating in the boss challenge. Use `/join` first!",
                 ephemeral=True
@@ -41,7 +50,7 @@ class SubmitCommand:
         await interaction.response.defer(ephemeral=True)
         
         try:
-            current_progress = self.db.get_user_progress(guild_id, user_id)
+            current_progress = await self.db.get_user_progress(guild_id, user_id)
             boss_number = current_progress + 1
             
             after_path = await self.image_service.upload_from_url(
@@ -49,78 +58,60 @@ class SubmitCommand:
             )
             
             if not after_path:
-                await interaction.followup.send(
-                    "❌ Failed to save the image. Please try again.",
-                    ephemeral=True
-                )
+                await self._followup(interaction, "❌ Failed to save the image. Please try again.")
                 return
             
-            success = self.db.add_completion(guild_id, user_id, after_path)
+            snapshot = await self.db.record_submission(
+                guild_id,
+                user_id,
+                after_path,
+                self.boss_service.is_difficulty_complete,
+                self.boss_service.get_random_boss_for_extreme
+            )
             
-            if success:
-                new_progress = self.db.get_user_progress(guild_id, user_id)
-                user_mode = self.db.get_user_mode(guild_id, user_id)
-
-                rolled_next = None
-                if user_mode == "extreme":
-                    rolled_next = self.boss_service.get_random_boss_for_extreme()
-                    self.db.set_next_extreme_boss(guild_id, user_id, rolled_next)
-                
-                # Check if difficulty is completed
-                is_completed = self.boss_service.is_difficulty_complete(new_progress, user_mode)
-                if is_completed and user_mode != "extreme":
-                    completion_time = datetime.utcnow().isoformat()
-                    self.db.mark_difficulty_complete(guild_id, user_id, user_mode, completion_time)
+            if snapshot:
+                new_progress = snapshot['progress']
+                user_mode = snapshot['mode']
+                rolled_next = snapshot['next_extreme_boss']
+                is_completed = snapshot['completed']
+                boss_number = new_progress
                 
                 completion_msg = "🎉 **DIFFICULTY COMPLETED!** " if is_completed and user_mode != "extreme" else ""
-                await interaction.followup.send(
-                    f"{completion_msg}⚔️ Boss kill submitted successfully! Check the completions channel for your defeat post and the {user_mode} channel for leaderboard.",
-                    ephemeral=True
-                )
+                await self._followup(interaction, f"{completion_msg}⚔️ Boss kill submitted successfully! Check the completions channel for your defeat post and the {user_mode} channel for leaderboard.")
                 
                 await self._post_boss_completion(interaction, after, boss_number, new_progress, user_mode, is_completed, rolled_next)
             else:
-                await interaction.followup.send(
-                    "❌ Failed to record boss kill. Please try again.",
-                    ephemeral=True
-                )
+                await self._followup(interaction, "❌ Failed to record boss kill. Please try again.")
                 
         except Exception as e:
             print(f"Error in submit command: {e}")
-            await interaction.followup.send(
-                "❌ An error occurred while processing your submission.",
-                ephemeral=True
-            )
+            await self._followup(interaction, "❌ An error occurred while processing your submission.")
     
     async def _post_boss_completion(self, interaction, after, boss_number, new_progress, user_mode, is_completed=False, rolled_next: str | None = None):
-        completions_channel_id = self.db.get_discord_resource(interaction.guild_id, "completions")
+        await self.bot.wait_until_provisioned(interaction.guild)
+        completions_channel_id = await self.db.get_discord_resource(interaction.guild_id, "completions")
         completions_channel = None
         if completions_channel_id:
             completions_channel = interaction.guild.get_channel(completions_channel_id)
             if not completions_channel:
                 print(f"Stored completions channel ID {completions_channel_id} is invalid, removing from DB")
-                self.db.remove_discord_resource(interaction.guild_id, "completions")
+                await self.db.remove_discord_resource(interaction.guild_id, "completions")
         
         if not completions_channel:
             print(f"Creating completions channel for guild {interaction.guild_id}")
             try:
-                completions_channel = await interaction.guild.create_text_channel(
+                completions_channel = await self.dispatcher.run(
+                    PRIORITY_COMPLETION, guild_route(interaction.guild_id),
+                    interaction.guild.create_text_channel,
                     "🏆・boss-completions",
                     topic="Boss Defeats and Progress Updates - View difficulty channels for rules and leaderboards"
                 )
-                self.db.store_discord_resource(interaction.guild_id, "completions", completions_channel.id, {'name': completions_channel.name})
+                await self.db.store_discord_resource(interaction.guild_id, "completions", completions_channel.id, {'name': completions_channel.name})
                 
-                try:
-                    await completions_channel.edit(position=1)
-                except discord.Forbidden:
-                    pass
+                self.dispatcher.post(PRIORITY_COSMETIC, guild_route(interaction.guild_id), completions_channel.edit, position=1)
             except Exception as e:
                 print(f"Failed to create completions channel: {e}")
         
-        leaderboard_channel = await self.leaderboard_manager.get_channel_by_id(interaction.guild_id, user_mode)
-        if not leaderboard_channel:
-            print(f"No leaderboard channel found for mode {user_mode}")
-        
         if completions_channel:
             defeated_boss = self.boss_service.get_next_boss_for_difficulty(boss_number - 1, user_mode)
             next_boss = self.boss_service.get_next_boss_for_difficulty(new_progress, user_mode)
@@ -159,7 +150,7 @@ class SubmitCommand:
             if not is_completed or user_mode == "extreme":
                 embed.add_field(
                     name="Rank", 
-                    value=f"#{self.leaderboard_manager.get_user_mode_rank(interaction.guild_id, interaction.user.id, user_mode)}", 
+                    value=f"#{await self.leaderboard_manager.get_user_mode_rank(interaction.guild_id, interaction.user.id, user_mode)}", 
                     inline=True
                 )
             if next_boss:
@@ -172,7 +163,9 @@ class SubmitCommand:
             embed.set_image(url=after.url)
             embed.timestamp = discord.utils.utcnow()
             
-            await completions_channel.send(embed=embed)
-            
-            if leaderboard_channel:
-                await self.leaderboard_manager.update_mode_leaderboard(leaderboard_channel, interaction.guild_id, user_mode)
+            await self.dispatcher.run(
+                PRIORITY_COMPLETION, channel_route(completions_channel.id),
+                completions_channel.send, embed=embed
+            )
+        
+        self.leaderboard_manager.request_update(interaction.guild_id, user_mode)
@@ -2,7 +2,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-from bot.db.tiny import get_database
+from bot.db import get_async_database
 from bot.services.image_upload import get_image_service
 from bot.services.boss_progression import BossProgressionService
 
@@ -10,21 +10,38 @@ from bot.cogs.commands.join_command import JoinCommand
 from bot.cogs.commands.leave_command import LeaveCommand
 from bot.cogs.commands.reset_command import ResetCommand
 from bot.cogs.commands.submit_command import SubmitCommand
+from bot.cogs.commands.leaderboard_command import LeaderboardCommand
 from bot.cogs.commands.leaderboard_manager import LeaderboardManager
+from bot.cogs.commands.setup_command import SetupCommand
 
 
 class EventCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = get_database()
+        self.db = get_async_database()
         self.image_service = get_image_service()
         self.boss_service = BossProgressionService()
         
-        self.join_cmd = JoinCommand(bot, self.db, self.boss_service)
-        self.leave_cmd = LeaveCommand(bot, self.db, self.boss_service)
-        self.reset_cmd = ResetCommand(bot, self.db, self.boss_service)
-        self.submit_cmd = SubmitCommand(bot, self.db, self.boss_service, self.image_service)
         self.leaderboard_manager = LeaderboardManager(bot, self.db, self.boss_service)
+        
+        self.join_cmd = JoinCommand(bot, self.db, self.boss_service, self.leaderboard_manager)
+        self.leave_cmd = LeaveCommand(bot, self.db, self.boss_service, self.leaderboard_manager)
+        self.reset_cmd = ResetCommand(bot, self.db, self.boss_service, self.leaderboard_manager)
+        self.submit_cmd = SubmitCommand(bot, self.db, self.boss_service, self.image_service, self.leaderboard_manager)
+        self.leaderboard_cmd = LeaderboardCommand(bot, self.db, self.boss_service, self.leaderboard_manager)
+        self.setup_cmd = SetupCommand(bot, self.db)
+    
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.guild_id:
+            self.leaderboard_manager.display_names.remember(interaction.guild_id, interaction.user)
+            if interaction.command is None or interaction.command.name != "setup":
+                self.bot.provision_guild_lazily(interaction.guild)
+        return True
+    
+    async def cog_unload(self):
+        metrics = self.leaderboard_manager.get_refresh_metrics()
+        print(f"Leaderboard refreshes: {metrics['executed']} executed, {metrics['coalesced']} coalesced, {metrics['failed']} failed, {metrics['skipped_edits']} unchanged")
+        await self.leaderboard_manager.close()
     
     @app_commands.command(name="join", description="Join the RuneScape boss progression challenge")
     @app_commands.describe(mode="Challenge difficulty: Easy, Normal, Hard, or Extreme")
@@ -35,21 +52,21 @@ class EventCog(commands.Cog):
         app_commands.Choice(name="💀 Extreme Mode", value="extreme")
     ])
     async def join(self, interaction: discord.Interaction, mode: str):
-        if self.db.is_guild_locked(interaction.guild_id):
+        if await self.db.is_guild_locked(interaction.guild_id):
             await interaction.response.send_message("🔒 This server's challenge is locked. An admin must use /unlock.", ephemeral=True)
             return
         await self.join_cmd.join(interaction, mode)
     
     @app_commands.command(name="leave", description="Leave the boss progression challenge")
     async def leave(self, interaction: discord.Interaction):
-        if self.db.is_guild_locked(interaction.guild_id):
+        if await self.db.is_guild_locked(interaction.guild_id):
             await interaction.response.send_message("🔒 This server's challenge is locked. An admin must use /unlock.", ephemeral=True)
             return
         await self.leave_cmd.leave(interaction)
     
     @app_commands.command(name="reset", description="Reset your boss progression (if you died)")
     async def reset(self, interaction: discord.Interaction):
-        if self.db.is_guild_locked(interaction.guild_id):
+        if await self.db.is_guild_locked(interaction.guild_id):
             await interaction.response.send_message("🔒 This server's challenge is locked. An admin must use /unlock.", ephemeral=True)
             return
         await self.reset_cmd.reset(interaction)
@@ -59,18 +76,33 @@ class EventCog(commands.Cog):
         after="After image showing the total value from Items Kept on Death"
     )
     async def submit(self, interaction: discord.Interaction, after: discord.Attachment):
-        if self.db.is_guild_locked(interaction.guild_id):
+        if await self.db.is_guild_locked(interaction.guild_id):
             await interaction.response.send_message("🔒 This server's challenge is locked. An admin must use /unlock.", ephemeral=True)
             return
         await self.submit_cmd.submit(interaction, after)
 
     
+    @app_commands.command(name="leaderboard", description="Browse the full leaderboard for a mode")
+    @app_commands.describe(mode="Challenge difficulty to show", page="Page to open")
+    @app_commands.choices(mode=[
+        app_commands.Choice(name="🌱 Easy Mode", value="easy"),
+        app_commands.Choice(name="🛡️ Normal Mode", value="normal"),
+        app_commands.Choice(name="🔥 Hard Mode", value="hard"),
+        app_commands.Choice(name="💀 Extreme Mode", value="extreme")
+    ])
+    async def leaderboard(self, interaction: discord.Interaction, mode: str, page: app_commands.Range[int, 1] = 1):
+        await self.leaderboard_cmd.leaderboard(interaction, mode, page)
+    
+    @app_commands.command(name="setup", description="[Admin] Create or repair the Boss Challenge channels for this server")
+    async def setup(self, interaction: discord.Interaction):
+        await self.setup_cmd.setup(interaction)
+    
     @app_commands.command(name="unlock", description="[Admin] Unlock all commands for this server")
     async def unlock(self, interaction: discord.Interaction):
         if not interaction.user.guild_permissions.manage_guild:
             await interaction.response.send_message("❌ You don't have permission to use this.", ephemeral=True)
             return
-        self.db.set_guild_locked(interaction.guild_id, False)
+        await self.db.set_guild_locked(interaction.guild_id, False)
         await interaction.response.send_message("✅ Server unlocked. All commands are now available.", ephemeral=True)
 
     @app_commands.command(name="lock", description="[Admin] Lock all participant commands for this server")
@@ -78,7 +110,7 @@ class EventCog(commands.Cog):
         if not interaction.user.guild_permissions.manage_guild:
             await interaction.response.send_message("❌ You don't have permission to use this.", ephemeral=True)
             return
-        self.db.set_guild_locked(interaction.guild_id, True)
+        await self.db.set_guild_locked(interaction.guild_id, True)
         await interaction.response.send_message("🔒 Server locked. Only admins can use commands.", ephemeral=True)
     
     async def create_normal_mode_content(self, channel, guild_id: int):
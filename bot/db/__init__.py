@@ -0,0 +1,75 @@
+import os
+
+
+DEFAULT_PATHS = {
+    "tiny": "data/event_bot.db",
+    "sqlite": "data/event_bot.sqlite3",
+    "sharded": "data/guilds",
+    "journal": "data/event_bot.db",
+}
+
+_db_instance = None
+_async_db_instance = None
+
+
+def create_database(backend: str | None = None, db_path: str | None = None):
+    backend = (backend or os.getenv("DB_BACKEND", "tiny")).lower()
+    if backend not in DEFAULT_PATHS:
+        raise ValueError(f"Unknown DB_BACKEND '{backend}', expected one of: {', '.join(DEFAULT_PATHS)}")
+    db_path = db_path or os.getenv("DB_PATH") or DEFAULT_PATHS[backend]
+    process_locks = os.getenv("DB_PROCESS_LOCKS", "0").lower() in ("1", "true", "yes")
+    if process_locks and backend != "sqlite":
+        raise ValueError(f"DB_PROCESS_LOCKS requires DB_BACKEND 'sqlite', got '{backend}'")
+    if backend == "sqlite":
+        from bot.db.sqlite import SqliteEventDatabase
+        db = SqliteEventDatabase(db_path)
+        if process_locks:
+            from bot.db.process_locks import ProcessLockedDatabase
+            return ProcessLockedDatabase(db, os.getenv("DB_LOCK_DIR", "data/locks"))
+        return db
+    tiny_options = {
+        "write_behind": os.getenv("DB_WRITE_BEHIND", "0").lower() in ("1", "true", "yes"),
+        "flush_interval": float(os.getenv("DB_FLUSH_INTERVAL", "5")),
+        "max_pending_writes": int(os.getenv("DB_FLUSH_MAX_WRITES", "50")),
+    }
+    if backend == "journal":
+        from bot.db.journal import JournalEventDatabase
+        return JournalEventDatabase(
+            db_path,
+            compact_bytes=int(os.getenv("DB_JOURNAL_COMPACT_BYTES", str(4 * 1024 * 1024)))
+        )
+    if backend == "sharded":
+        from bot.db.sharded import ShardedEventDatabase
+        return ShardedEventDatabase(
+            db_path,
+            max_open_shards=int(os.getenv("DB_MAX_OPEN_SHARDS", "64")),
+            idle_seconds=float(os.getenv("DB_SHARD_IDLE_SECONDS", "300")),
+            **tiny_options
+        )
+    from bot.db.tiny import EventDatabase
+    return EventDatabase(db_path, **tiny_options)
+
+
+def get_database():
+    global _db_instance
+    if _db_instance is None:
+        _db_instance = create_database()
+    return _db_instance
+
+
+def get_async_database():
+    global _async_db_instance
+    if _async_db_instance is None:
+        from bot.db.async_db import AsyncEventDatabase
+        _async_db_instance = AsyncEventDatabase(
+            get_database(),
+            reader_threads=int(os.getenv("DB_READER_THREADS", "4"))
+        )
+    return _async_db_instance
+
+
+__all__ = [
+    "create_database",
+    "get_async_database",
+    "get_database",
+]
@@ -0,0 +1,53 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+
+WRITE_OPERATIONS = frozenset({
+    "join_user",
+    "join_user_with_mode",
+    "leave_user",
+    "reset_user",
+    "add_completion",
+    "record_submission",
+    "set_user_progress",
+    "set_next_extreme_boss",
+    "mark_difficulty_complete",
+    "archive_extreme_participant",
+    "store_discord_resource",
+    "remove_discord_resource",
+    "set_guild_locked",
+    "import_rows",
+    "flush",
+})
+
+
+class AsyncEventDatabase:
+    def __init__(self, db, reader_threads: int = 4):
+        self.db = db
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+        self._readers = ThreadPoolExecutor(max_workers=reader_threads, thread_name_prefix="db-reader")
+
+    async def _run(self, executor, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        operation = getattr(self.db, name)
+        if not callable(operation):
+            return operation
+        executor = self._writer if name in WRITE_OPERATIONS else self._readers
+
+        async def call(*args, **kwargs):
+            return await self._run(executor, operation, *args, **kwargs)
+
+        call.__name__ = name
+        self.__dict__[name] = call
+        return call
+
+    async def close(self):
+        await asyncio.to_thread(self._readers.shutdown, wait=True)
+        await self._run(self._writer, self.db.close)
+        await asyncio.to_thread(self._writer.shutdown, wait=True)
@@ -0,0 +1,263 @@
+import argparse
+import copy
+import functools
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from tinydb import TinyDB
+from tinydb.storages import MemoryStorage
+from tinydb.table import Table
+
+from bot.db.async_db import WRITE_OPERATIONS
+from bot.db.tiny import EventDatabase
+from bot.db.write_behind import AtomicJSONStorage
+
+
+JSON_TYPES = (str, int, float, bool, type(None), dict, list)
+
+
+def _scan_entries(path: Path):
+    if not path.exists():
+        return
+    offset = 0
+    with open(path, 'rb') as handle:
+        for line in handle:
+            if not line.endswith(b"\n"):
+                return
+            try:
+                entry = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                return
+            offset += len(line)
+            yield entry, offset
+
+
+def _read_entries(path: Path):
+    for entry, _ in _scan_entries(path):
+        yield entry
+
+
+def _truncate_torn_tail(path: Path, valid_bytes: int):
+    if not path.exists():
+        return
+    size = path.stat().st_size
+    if size > valid_bytes:
+        print(f"Discarding {size - valid_bytes} torn bytes at the end of {path}")
+        os.truncate(path, valid_bytes)
+
+
+def _apply_entry(state: dict, entry: dict):
+    for change in entry.get('changes', []):
+        table = state.setdefault(change['table'], {})
+        doc_id = str(change['doc_id'])
+        if change['doc'] is None:
+            table.pop(doc_id, None)
+        else:
+            table[doc_id] = change['doc']
+
+
+class JournalStorage(MemoryStorage):
+    def __init__(self, path: str, compact_bytes: int = 4 * 1024 * 1024):
+        super().__init__()
+        self.snapshot = AtomicJSONStorage(path)
+        self.log_path = Path(f"{path}.log")
+        self.rotated_log_path = Path(f"{path}.log.rotated")
+        self.archive_dir = Path(f"{path}.log.d")
+        self.compact_bytes = compact_bytes
+        self.entries_since_compaction = 0
+        self.compactions = 0
+        self._touched = {}
+        self._compacting = False
+        self._lock = threading.Lock()
+
+        self.memory = self.snapshot.read() or {}
+        for entry in _read_entries(self.rotated_log_path):
+            _apply_entry(self.memory, entry)
+        valid_bytes = 0
+        for entry, valid_bytes in _scan_entries(self.log_path):
+            _apply_entry(self.memory, entry)
+            self.entries_since_compaction += 1
+        _truncate_torn_tail(self.log_path, valid_bytes)
+
+        self._log = open(self.log_path, 'a', encoding='utf-8')
+        if self.rotated_log_path.exists():
+            self._write_snapshot(copy.deepcopy(self.memory))
+
+    def touch(self, table: str, doc_id: int):
+        self._touched[(table, int(doc_id))] = None
+
+    def commit(self, op: str, args: list):
+        if not self._touched:
+            return
+        changes = []
+        for table, doc_id in self._touched:
+            doc = self.memory.get(table, {}).get(str(doc_id))
+            changes.append({'table': table, 'doc_id': doc_id, 'doc': copy.deepcopy(doc)})
+        self._touched = {}
+        entry = {
+            'ts': datetime.utcnow().isoformat(),
+            'op': op,
+            'args': [arg for arg in args if isinstance(arg, JSON_TYPES)],
+            'changes': changes,
+        }
+        with self._lock:
+            self._log.write(json.dumps(entry) + "\n")
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self.entries_since_compaction += 1
+            should_compact = not self._compacting and self._log.tell() >= self.compact_bytes
+        if should_compact:
+            self.compact_in_background()
+
+    def _rotate(self):
+        self._log.close()
+        os.replace(self.log_path, self.rotated_log_path)
+        self._log = open(self.log_path, 'a', encoding='utf-8')
+        self.entries_since_compaction = 0
+        self._compacting = True
+
+    def _write_snapshot(self, snapshot: dict):
+        try:
+            self.snapshot.write(snapshot)
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            archived = self.archive_dir / f"{datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')}.log"
+            os.replace(self.rotated_log_path, archived)
+            self.compactions += 1
+        except Exception as e:
+            print(f"Error compacting journal {self.log_path}: {e}")
+        finally:
+            with self._lock:
+                self._compacting = False
+
+    def compact_in_background(self):
+        with self._lock:
+            if self._compacting or self.rotated_log_path.exists():
+                return
+            snapshot = copy.deepcopy(self.memory)
+            self._rotate()
+        threading.Thread(
+            target=self._write_snapshot,
+            args=(snapshot,),
+            name="db-journal-compactor",
+            daemon=True
+        ).start()
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                'journal_bytes': self._log.tell(),
+                'entries_since_compaction': self.entries_since_compaction,
+                'compactions': self.compactions,
+                'compacting': self._compacting,
+            }
+
+    def close(self):
+        with self._lock:
+            self._log.close()
+
+
+class JournaledTable(Table):
+    def _touch(self, doc_ids):
+        for doc_id in doc_ids:
+            self._storage.touch(self.name, doc_id)
+        return doc_ids
+
+    def insert(self, document):
+        doc_id = super().insert(document)
+        self._touch([doc_id])
+        return doc_id
+
+    def insert_multiple(self, documents):
+        return self._touch(super().insert_multiple(documents))
+
+    def update(self, fields, cond=None, doc_ids=None):
+        return self._touch(super().update(fields, cond, doc_ids))
+
+    def update_multiple(self, updates):
+        return self._touch(super().update_multiple(updates))
+
+    def upsert(self, document, cond=None):
+        return self._touch(super().upsert(document, cond))
+
+    def remove(self, cond=None, doc_ids=None):
+        return self._touch(super().remove(cond, doc_ids))
+
+    def truncate(self):
+        self._touch([int(doc_id) for doc_id in self._read_table()])
+        super().truncate()
+
+
+class JournaledTinyDB(TinyDB):
+    table_class = JournaledTable
+
+
+def _journaled(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            self._journal_depth += 1
+            try:
+                result = method(self, *args, **kwargs)
+            except BaseException:
+                self._journal_depth -= 1
+                if not self._journal_depth:
+                    self.db.storage.commit(f"{method.__name__}:failed", list(args))
+                raise
+            self._journal_depth -= 1
+            if not self._journal_depth:
+                self.db.storage.commit(method.__name__, list(args) + list(kwargs.values()))
+            return result
+    return wrapper
+
+
+class JournalEventDatabase(EventDatabase):
+    def __init__(self, db_path="data/event_bot.db", compact_bytes: int = 4 * 1024 * 1024):
+        self._journal_depth = 0
+        self._compact_bytes = compact_bytes
+        super().__init__(db_path)
+
+    def _open(self, db_path: str, write_behind: bool, max_pending_writes: int) -> TinyDB:
+        return JournaledTinyDB(db_path, storage=JournalStorage, compact_bytes=self._compact_bytes)
+
+    def _commit_raw(self, tables: dict, touched: list[tuple[str, int]]):
+        super()._commit_raw(tables, touched)
+        for table, doc_id in touched:
+            self.db.storage.touch(table, doc_id)
+
+    def get_storage_metrics(self) -> dict:
+        with self._lock:
+            return self.db.storage.metrics()
+
+
+for _name in WRITE_OPERATIONS:
+    if hasattr(EventDatabase, _name):
+        setattr(JournalEventDatabase, _name, _journaled(getattr(EventDatabase, _name)))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Print journal entries for a guild or user")
+    parser.add_argument("--path", default="data/event_bot.db")
+    parser.add_argument("--guild", type=int, required=True)
+    parser.add_argument("--user", type=int)
+    args = parser.parse_args(argv)
+
+    base = Path(f"{args.path}.log")
+    logs = sorted(Path(f"{args.path}.log.d").glob("*.log"))
+    logs += [Path(f"{args.path}.log.rotated"), base]
+    for log_path in logs:
+        for entry in _read_entries(log_path):
+            entry_args = entry.get('args', [])
+            if not entry_args or entry_args[0] != args.guild:
+                continue
+            if args.user is not None and (len(entry_args) < 2 or entry_args[1] != args.user):
+                continue
+            print(json.dumps(entry))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,61 @@
+import argparse
+import sys
+from pathlib import Path
+
+from tinydb import TinyDB
+
+from bot.db.sqlite import TABLE_COLUMNS, SqliteEventDatabase
+
+
+def _load_tiny_rows(source: str) -> dict[str, list[dict]]:
+    tiny = TinyDB(source, access_mode='r')
+    try:
+        tables = {}
+        for table_name in TABLE_COLUMNS:
+            rows = []
+            for doc in tiny.table(table_name).all():
+                row = dict(doc)
+                if 'id' in TABLE_COLUMNS[table_name]:
+                    row['id'] = doc.doc_id
+                rows.append(row)
+            tables[table_name] = rows
+        return tables
+    finally:
+        tiny.close()
+
+
+def migrate(source: str, target: str) -> bool:
+    if not Path(source).exists():
+        raise FileNotFoundError(f"TinyDB file not found: {source}")
+
+    tables = _load_tiny_rows(source)
+    db = SqliteEventDatabase(target)
+    try:
+        ok = True
+        for table_name, rows in tables.items():
+            db.import_rows(table_name, rows)
+            migrated = db.count_rows(table_name)
+            status = "OK" if migrated == len(rows) else "MISMATCH"
+            if migrated != len(rows):
+                ok = False
+            print(f"{table_name}: {len(rows)} source rows, {migrated} sqlite rows [{status}]")
+        return ok
+    finally:
+        db.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Import a TinyDB event database into SQLite")
+    parser.add_argument("--source", default="data/event_bot.db")
+    parser.add_argument("--target", default="data/event_bot.sqlite3")
+    args = parser.parse_args(argv)
+
+    if migrate(args.source, args.target):
+        print(f"Migration complete: {args.source} -> {args.target}")
+        return 0
+    print("Migration finished with row count mismatches")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
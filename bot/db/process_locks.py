@@ -0,0 +1,57 @@
+import fcntl
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from bot.db.async_db import WRITE_OPERATIONS
+
+
+GUILD_WRITE_OPERATIONS = WRITE_OPERATIONS - {"import_rows", "flush"}
+
+
+class ProcessLockedDatabase:
+    def __init__(self, db, lock_dir="data/locks"):
+        self.db = db
+        self.lock_dir = Path(lock_dir)
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        self._metrics_lock = threading.Lock()
+        self.acquired = 0
+        self.contended = 0
+
+    def lock_path(self, guild_id: int) -> Path:
+        return self.lock_dir / f"{int(guild_id)}.lock"
+
+    @contextmanager
+    def guild_lock(self, guild_id: int):
+        with open(self.lock_path(guild_id), "a") as f:
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                with self._metrics_lock:
+                    self.contended += 1
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            with self._metrics_lock:
+                self.acquired += 1
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        operation = getattr(self.db, name)
+        if name not in GUILD_WRITE_OPERATIONS or not callable(operation):
+            return operation
+
+        def call(guild_id, *args, **kwargs):
+            with self.guild_lock(guild_id):
+                return operation(guild_id, *args, **kwargs)
+
+        call.__name__ = name
+        self.__dict__[name] = call
+        return call
+
+    def get_lock_metrics(self) -> dict:
+        with self._metrics_lock:
+            return {'acquired': self.acquired, 'contended': self.contended}
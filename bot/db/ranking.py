@@ -0,0 +1,39 @@
+import bisect
+
+
+NO_COMPLETION = '9999-12-31'
+
+
+def rank_key(progress: int, last_completion: str | None, user_id: int) -> tuple:
+    if last_completion is None:
+        last_completion = NO_COMPLETION
+    return (-int(progress or 0), last_completion, user_id)
+
+
+class Ranking:
+    def __init__(self):
+        self._keys = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def add(self, key: tuple):
+        bisect.insort(self._keys, key)
+
+    def discard(self, key: tuple):
+        index = bisect.bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            del self._keys[index]
+
+    def rank(self, key: tuple) -> int:
+        index = bisect.bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            return index + 1
+        return 0
+
+    def keys(self, offset: int = 0, limit: int | None = None) -> list[tuple]:
+        end = None if limit is None else offset + limit
+        return self._keys[offset:end]
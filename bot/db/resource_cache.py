@@ -0,0 +1,39 @@
+import threading
+from typing import Callable
+
+
+class ResourceCache:
+    def __init__(self):
+        self._entries = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, guild_id: int, resource_type: str, loader: Callable[[], dict | None]) -> dict | None:
+        key = (guild_id, resource_type)
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            generation = self._generation
+        resource = loader()
+        with self._lock:
+            if self._generation == generation:
+                self._entries[key] = resource
+        return resource
+
+    def put(self, guild_id: int, resource_type: str, resource: dict | None):
+        with self._lock:
+            self._generation += 1
+            self._entries[(guild_id, resource_type)] = resource
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
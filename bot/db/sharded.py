@@ -0,0 +1,107 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+
+from bot.db.tiny import EventDatabase
+
+
+class ShardedEventDatabase:
+    def __init__(self, root="data/guilds", max_open_shards: int = 64,
+                 idle_seconds: float = 300.0, **shard_options):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_open_shards = max(1, max_open_shards)
+        self.idle_seconds = idle_seconds
+        self.shard_options = shard_options
+        self._shards = OrderedDict()
+        self._last_used = {}
+        self._in_use = {}
+        self._version_floors = {}
+        self._lock = threading.RLock()
+        self._sweep_stop = threading.Event()
+        threading.Thread(target=self._sweep_loop, name="db-shard-sweeper", daemon=True).start()
+
+    def shard_path(self, guild_id: int) -> Path:
+        return self.root / f"{int(guild_id)}.json"
+
+    @contextmanager
+    def _shard(self, guild_id: int):
+        with self._lock:
+            db = self._shards.pop(guild_id, None)
+            if db is None:
+                db = EventDatabase(
+                    str(self.shard_path(guild_id)),
+                    version_floor=self._version_floors.get(guild_id, 0),
+                    **self.shard_options
+                )
+            self._shards[guild_id] = db
+            self._last_used[guild_id] = time.monotonic()
+            self._in_use[guild_id] = self._in_use.get(guild_id, 0) + 1
+            self._evict()
+        try:
+            yield db
+        finally:
+            with self._lock:
+                self._in_use[guild_id] -= 1
+                if not self._in_use[guild_id]:
+                    del self._in_use[guild_id]
+
+    def _close_shard(self, guild_id: int):
+        db = self._shards.pop(guild_id)
+        self._last_used.pop(guild_id, None)
+        self._version_floors[guild_id] = db.max_board_version()
+        try:
+            db.close()
+        except Exception as e:
+            print(f"Error closing shard for guild {guild_id}: {e}")
+
+    def _evict(self):
+        now = time.monotonic()
+        idle = [
+            guild_id for guild_id, last_used in self._last_used.items()
+            if now - last_used > self.idle_seconds and guild_id not in self._in_use
+        ]
+        for guild_id in idle:
+            self._close_shard(guild_id)
+        for guild_id in list(self._shards):
+            if len(self._shards) <= self.max_open_shards:
+                break
+            if guild_id not in self._in_use:
+                self._close_shard(guild_id)
+
+    def _sweep_loop(self):
+        while not self._sweep_stop.wait(max(1.0, self.idle_seconds / 2)):
+            with self._lock:
+                self._evict()
+
+    def __getattr__(self, name):
+        if name.startswith("_") or not callable(getattr(EventDatabase, name, None)):
+            raise AttributeError(name)
+
+        def call(guild_id, *args, **kwargs):
+            with self._shard(guild_id) as db:
+                return getattr(db, name)(guild_id, *args, **kwargs)
+
+        call.__name__ = name
+        self.__dict__[name] = call
+        return call
+
+    def open_shard_count(self) -> int:
+        with self._lock:
+            return len(self._shards)
+
+    def flush(self) -> int:
+        with self._lock:
+            return sum(db.flush() for db in self._shards.values())
+
+    def get_storage_metrics(self) -> dict:
+        with self._lock:
+            return {'open_shards': len(self._shards), 'max_open_shards': self.max_open_shards}
+
+    def close(self):
+        self._sweep_stop.set()
+        with self._lock:
+            for guild_id in list(self._shards):
+                self._close_shard(guild_id)
@@ -0,0 +1,63 @@
+import argparse
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from tinydb import TinyDB
+from tinydb.table import Document
+
+
+TABLES = ('participants', 'submissions', 'completions', 'extreme_archive', 'discord_resources')
+
+
+def split(source: str, target: str) -> bool:
+    if not Path(source).exists():
+        raise FileNotFoundError(f"TinyDB file not found: {source}")
+    target_dir = Path(target)
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    grouped = defaultdict(lambda: defaultdict(list))
+    source_counts = {}
+    tiny = TinyDB(source, access_mode='r')
+    try:
+        for table_name in TABLES:
+            docs = tiny.table(table_name).all()
+            source_counts[table_name] = len(docs)
+            for doc in docs:
+                grouped[doc['guild_id']][table_name].append(Document(dict(doc), doc_id=doc.doc_id))
+    finally:
+        tiny.close()
+
+    split_counts = defaultdict(int)
+    for guild_id, tables in grouped.items():
+        shard_path = target_dir / f"{int(guild_id)}.json"
+        if shard_path.exists():
+            raise FileExistsError(f"Shard already exists: {shard_path}")
+        shard = TinyDB(shard_path)
+        try:
+            for table_name, docs in tables.items():
+                shard.table(table_name).insert_multiple(docs)
+                split_counts[table_name] += len(shard.table(table_name))
+        finally:
+            shard.close()
+
+    ok = True
+    for table_name in TABLES:
+        status = "OK" if split_counts[table_name] == source_counts[table_name] else "MISMATCH"
+        if status != "OK":
+            ok = False
+        print(f"{table_name}: {source_counts[table_name]} source rows, {split_counts[table_name]} sharded rows [{status}]")
+    print(f"Wrote {len(grouped)} guild files to {target_dir}")
+    return ok
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Split a TinyDB event database into per-guild files")
+    parser.add_argument("--source", default="data/event_bot.db")
+    parser.add_argument("--target", default="data/guilds")
+    args = parser.parse_args(argv)
+    return 0 if split(args.source, args.target) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
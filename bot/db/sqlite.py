@@ -0,0 +1,543 @@
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from bot.db.ranking import NO_COMPLETION
+from bot.db.resource_cache import ResourceCache
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS participants (
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    progress INTEGER NOT NULL DEFAULT 0,
+    mode TEXT NOT NULL DEFAULT 'normal',
+    joined_at TEXT,
+    last_completion TEXT,
+    reset_at TEXT,
+    next_extreme_boss TEXT,
+    PRIMARY KEY (guild_id, user_id)
+);
+CREATE INDEX IF NOT EXISTS idx_participants_rank
+    ON participants (guild_id, mode, progress DESC, last_completion);
+CREATE TABLE IF NOT EXISTS submissions (
+    id INTEGER PRIMARY KEY,
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    step INTEGER NOT NULL,
+    after_url TEXT,
+    ts TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_submissions_user
+    ON submissions (guild_id, user_id);
+CREATE TABLE IF NOT EXISTS completions (
+    id INTEGER PRIMARY KEY,
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    difficulty TEXT NOT NULL,
+    completion_time TEXT,
+    completion_order INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_completions_order
+    ON completions (guild_id, difficulty, completion_order);
+CREATE INDEX IF NOT EXISTS idx_completions_user
+    ON completions (guild_id, user_id);
+CREATE TABLE IF NOT EXISTS extreme_archive (
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    progress INTEGER NOT NULL DEFAULT 0,
+    last_completion TEXT,
+    next_extreme_boss TEXT,
+    PRIMARY KEY (guild_id, user_id)
+);
+CREATE TABLE IF NOT EXISTS discord_resources (
+    guild_id INTEGER NOT NULL,
+    resource_type TEXT NOT NULL,
+    resource_id INTEGER,
+    metadata TEXT NOT NULL DEFAULT '{}',
+    created_at TEXT,
+    PRIMARY KEY (guild_id, resource_type)
+);
+CREATE TABLE IF NOT EXISTS board_versions (
+    guild_id INTEGER NOT NULL,
+    mode TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (guild_id, mode)
+);
+"""
+
+BUMP_VERSION = (
+    "INSERT INTO board_versions (guild_id, mode, version) VALUES ({guild}, {mode}, 1) "
+    "ON CONFLICT (guild_id, mode) DO UPDATE SET version = version + 1;"
+)
+
+VERSION_TRIGGERS = {
+    'participants_insert': ("AFTER INSERT ON participants", [("NEW.guild_id", "NEW.mode")]),
+    'participants_update': ("AFTER UPDATE ON participants",
+                            [("OLD.guild_id", "OLD.mode"), ("NEW.guild_id", "NEW.mode")]),
+    'participants_delete': ("AFTER DELETE ON participants", [("OLD.guild_id", "OLD.mode")]),
+    'completions_insert': ("AFTER INSERT ON completions", [("NEW.guild_id", "NEW.difficulty")]),
+    'archive_insert': ("AFTER INSERT ON extreme_archive", [("NEW.guild_id", "'extreme'")]),
+    'archive_update': ("AFTER UPDATE ON extreme_archive", [("NEW.guild_id", "'extreme'")]),
+    'archive_delete': ("AFTER DELETE ON extreme_archive", [("OLD.guild_id", "'extreme'")]),
+}
+
+TRIGGERS = "".join(
+    f"CREATE TRIGGER IF NOT EXISTS bump_board_version_{name} {event} BEGIN "
+    + " ".join(BUMP_VERSION.format(guild=guild, mode=mode) for guild, mode in targets)
+    + " END;\n"
+    for name, (event, targets) in VERSION_TRIGGERS.items()
+)
+
+TABLE_COLUMNS = {
+    'participants': ('guild_id', 'user_id', 'progress', 'mode', 'joined_at',
+                     'last_completion', 'reset_at', 'next_extreme_boss'),
+    'submissions': ('id', 'guild_id', 'user_id', 'step', 'after_url', 'ts'),
+    'completions': ('id', 'guild_id', 'user_id', 'difficulty', 'completion_time', 'completion_order'),
+    'extreme_archive': ('guild_id', 'user_id', 'progress', 'last_completion', 'next_extreme_boss'),
+    'discord_resources': ('guild_id', 'resource_type', 'resource_id', 'metadata', 'created_at'),
+}
+
+RANK_ORDER = "progress DESC, COALESCE(last_completion, '9999-12-31')"
+
+EXTREME_BOARD = (
+    "SELECT guild_id, user_id, progress, mode, joined_at, last_completion, reset_at, next_extreme_boss "
+    "FROM participants WHERE guild_id = ? AND mode = 'extreme' "
+    "UNION ALL "
+    "SELECT a.guild_id, a.user_id, a.progress, 'extreme', NULL, a.last_completion, NULL, a.next_extreme_boss "
+    "FROM extreme_archive a WHERE a.guild_id = ? AND NOT EXISTS ("
+    "SELECT 1 FROM participants p WHERE p.guild_id = a.guild_id AND p.user_id = a.user_id AND p.mode = 'extreme')"
+)
+
+
+def _row_to_dict(row: sqlite3.Row) -> dict:
+    return {key: row[key] for key in row.keys() if row[key] is not None and key != 'id'}
+
+
+class SqliteEventDatabase:
+    def __init__(self, db_path="data/event_bot.sqlite3"):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._resources = ResourceCache()
+        self.conn.executescript(SCHEMA + TRIGGERS)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                isolation_level=None,
+                cached_statements=256,
+                check_same_thread=False
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def _fetch_participant(self, guild_id: int, user_id: int):
+        return self.conn.execute(
+            "SELECT * FROM participants WHERE guild_id = ? AND user_id = ?",
+            (guild_id, user_id)
+        ).fetchone()
+
+    def is_joined(self, guild_id: int, user_id: int) -> bool:
+        return self._fetch_participant(guild_id, user_id) is not None
+
+    def join_user(self, guild_id: int, user_id: int) -> bool:
+        return self.join_user_with_mode(guild_id, user_id, "normal")
+
+    def join_user_with_mode(self, guild_id: int, user_id: int, mode: str) -> bool:
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO participants (guild_id, user_id, progress, mode, joined_at) "
+            "VALUES (?, ?, 0, ?, ?)",
+            (guild_id, user_id, mode, datetime.utcnow().isoformat())
+        )
+        return cursor.rowcount > 0
+
+    def leave_user(self, guild_id: int, user_id: int) -> bool:
+        cursor = self.conn.execute(
+            "DELETE FROM participants WHERE guild_id = ? AND user_id = ?",
+            (guild_id, user_id)
+        )
+        return cursor.rowcount > 0
+
+    def reset_user(self, guild_id: int, user_id: int) -> bool:
+        cursor = self.conn.execute(
+            "UPDATE participants SET progress = 0, reset_at = ? WHERE guild_id = ? AND user_id = ?",
+            (datetime.utcnow().isoformat(), guild_id, user_id)
+        )
+        return cursor.rowcount > 0
+
+    def add_completion(self, guild_id: int, user_id: int, after_url: str) -> bool:
+        current_time = datetime.utcnow().isoformat()
+        with self._transaction() as conn:
+            row = self._fetch_participant(guild_id, user_id)
+            if row is None:
+                return False
+            new_progress = row['progress'] + 1
+            conn.execute(
+                "UPDATE participants SET progress = ?, last_completion = ? WHERE guild_id = ? AND user_id = ?",
+                (new_progress, current_time, guild_id, user_id)
+            )
+            conn.execute(
+                "INSERT INTO submissions (guild_id, user_id, step, after_url, ts) VALUES (?, ?, ?, ?, ?)",
+                (guild_id, user_id, new_progress, after_url, current_time)
+            )
+        return True
+
+    def record_submission(self, guild_id: int, user_id: int, after_url: str,
+                          is_complete: Callable[[int, str], bool],
+                          roll_extreme_boss: Callable[[], str]) -> dict | None:
+        current_time = datetime.utcnow().isoformat()
+        with self._transaction() as conn:
+            row = self._fetch_participant(guild_id, user_id)
+            if row is None:
+                return None
+
+            new_progress = row['progress'] + 1
+            mode = row['mode'] or 'normal'
+            rolled_next = roll_extreme_boss() if mode == 'extreme' else None
+            next_extreme_boss = rolled_next if mode == 'extreme' else row['next_extreme_boss']
+            conn.execute(
+                "UPDATE participants SET progress = ?, last_completion = ?, next_extreme_boss = ? "
+                "WHERE guild_id = ? AND user_id = ?",
+                (new_progress, current_time, next_extreme_boss, guild_id, user_id)
+            )
+            conn.execute(
+                "INSERT INTO submissions (guild_id, user_id, step, after_url, ts) VALUES (?, ?, ?, ?, ?)",
+                (guild_id, user_id, new_progress, after_url, current_time)
+            )
+
+            completed = mode != 'extreme' and is_complete(new_progress, mode)
+            completion_order = None
+            if completed:
+                completion_order = self.get_next_completion_order(guild_id, mode)
+                conn.execute(
+                    "INSERT INTO completions (guild_id, user_id, difficulty, completion_time, completion_order) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (guild_id, user_id, mode, current_time, completion_order)
+                )
+                conn.execute(
+                    "DELETE FROM participants WHERE guild_id = ? AND user_id = ?",
+                    (guild_id, user_id)
+                )
+
+        return {
+            'progress': new_progress,
+            'mode': mode,
+            'completed': completed,
+            'completion_order': completion_order,
+            'next_extreme_boss': rolled_next
+        }
+
+    def get_user_progress(self, guild_id: int, user_id: int) -> int:
+        row = self._fetch_participant(guild_id, user_id)
+        return row['progress'] if row else 0
+
+    def get_user_mode(self, guild_id: int, user_id: int) -> str:
+        row = self._fetch_participant(guild_id, user_id)
+        return (row['mode'] or 'normal') if row else 'normal'
+
+    def set_user_progress(self, guild_id: int, user_id: int, progress: int, mode: str) -> bool:
+        current_time = datetime.utcnow().isoformat()
+        self.conn.execute(
+            "INSERT INTO participants (guild_id, user_id, progress, mode, joined_at, last_completion) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (guild_id, user_id) DO UPDATE SET "
+            "progress = excluded.progress, mode = excluded.mode, last_completion = excluded.last_completion",
+            (guild_id, user_id, max(0, int(progress)), mode, current_time, current_time)
+        )
+        return True
+
+    def set_next_extreme_boss(self, guild_id: int, user_id: int, boss_name: str | None) -> None:
+        self.conn.execute(
+            "UPDATE participants SET next_extreme_boss = ? WHERE guild_id = ? AND user_id = ?",
+            (boss_name, guild_id, user_id)
+        )
+
+    def get_next_extreme_boss(self, guild_id: int, user_id: int) -> str | None:
+        row = self._fetch_participant(guild_id, user_id)
+        return row['next_extreme_boss'] if row else None
+
+    def get_leaderboard(self, guild_id: int, limit: int = 10) -> list:
+        rows = self.conn.execute(
+            f"SELECT * FROM participants WHERE guild_id = ? ORDER BY {RANK_ORDER} LIMIT ?",
+            (guild_id, limit)
+        ).fetchall()
+        return [_row_to_dict(row) for row in rows]
+
+    def mark_difficulty_complete(self, guild_id: int, user_id: int, difficulty: str, completion_time: str) -> bool:
+        with self._transaction() as conn:
+            if not self.is_joined(guild_id, user_id):
+                return False
+            conn.execute(
+                "INSERT INTO completions (guild_id, user_id, difficulty, completion_time, completion_order) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (guild_id, user_id, difficulty, completion_time,
+                 self.get_next_completion_order(guild_id, difficulty))
+            )
+            conn.execute(
+                "DELETE FROM participants WHERE guild_id = ? AND user_id = ?",
+                (guild_id, user_id)
+            )
+        return True
+
+    def get_completed_difficulties(self, guild_id: int, user_id: int) -> list[str]:
+        rows = self.conn.execute(
+            "SELECT difficulty FROM completions WHERE guild_id = ? AND user_id = ? ORDER BY id",
+            (guild_id, user_id)
+        ).fetchall()
+        return [row['difficulty'] for row in rows]
+
+    def get_next_completion_order(self, guild_id: int, difficulty: str) -> int:
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM completions WHERE guild_id = ? AND difficulty = ?",
+            (guild_id, difficulty)
+        ).fetchone()
+        return row[0] + 1
+
+    def get_finalized_leaderboard(self, guild_id: int, difficulty: str) -> list[dict]:
+        rows = self.conn.execute(
+            "SELECT * FROM completions WHERE guild_id = ? AND difficulty = ? ORDER BY completion_order",
+            (guild_id, difficulty)
+        ).fetchall()
+        return [_row_to_dict(row) for row in rows]
+
+    def get_live_leaderboard(self, guild_id: int, difficulty: str, limit: int | None = None, offset: int = 0) -> list[dict]:
+        rows = self.conn.execute(
+            f"SELECT * FROM participants WHERE guild_id = ? AND mode = ? ORDER BY {RANK_ORDER}, user_id LIMIT ? OFFSET ?",
+            (guild_id, difficulty, -1 if limit is None else limit, offset)
+        ).fetchall()
+        return [_row_to_dict(row) for row in rows]
+
+    def get_user_rank(self, guild_id: int, user_id: int, mode: str) -> int:
+        row = self._fetch_participant(guild_id, user_id)
+        if row is None or row['mode'] != mode:
+            return 0
+        last_completion = row['last_completion'] if row['last_completion'] is not None else NO_COMPLETION
+        ahead = self.conn.execute(
+            "SELECT COUNT(*) FROM participants WHERE guild_id = ? AND mode = ? AND ("
+            "progress > ? OR (progress = ? AND ("
+            "COALESCE(last_completion, '9999-12-31') < ? OR "
+            "(COALESCE(last_completion, '9999-12-31') = ? AND user_id < ?))))",
+            (guild_id, mode, row['progress'], row['progress'], last_completion, last_completion, user_id)
+        ).fetchone()[0]
+        return ahead + 1
+
+    def get_participants_many(self, guild_id: int, user_ids: list[int]) -> dict[int, dict]:
+        participants = {}
+        user_ids = list(user_ids)
+        for start in range(0, len(user_ids), 500):
+            chunk = user_ids[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self.conn.execute(
+                f"SELECT * FROM participants WHERE guild_id = ? AND user_id IN ({placeholders})",
+                (guild_id, *chunk)
+            ).fetchall()
+            for row in rows:
+                participants[row['user_id']] = _row_to_dict(row)
+        return participants
+
+    def _count_finalized(self, guild_id: int, difficulty: str) -> int:
+        return self.get_next_completion_order(guild_id, difficulty) - 1
+
+    def _finalized_page(self, guild_id: int, difficulty: str, limit: int | None, offset: int = 0) -> list[dict]:
+        rows = self.conn.execute(
+            "SELECT * FROM completions WHERE guild_id = ? AND difficulty = ? "
+            "ORDER BY completion_order LIMIT ? OFFSET ?",
+            (guild_id, difficulty, -1 if limit is None else limit, offset)
+        ).fetchall()
+        return [_row_to_dict(row) for row in rows]
+
+    def get_mode_board(self, guild_id: int, mode: str, limit: int | None = 10) -> dict:
+        self.conn.execute("BEGIN")
+        try:
+            if mode == 'extreme':
+                return {
+                    'finalized': [],
+                    'finalized_total': 0,
+                    'live': self.get_extreme_live_with_archive(guild_id, limit)
+                }
+            return {
+                'finalized': self._finalized_page(guild_id, mode, limit),
+                'finalized_total': self._count_finalized(guild_id, mode),
+                'live': self.get_live_leaderboard(guild_id, mode, limit)
+            }
+        finally:
+            self.conn.execute("COMMIT")
+
+    def get_board_version(self, guild_id: int, mode: str) -> int:
+        row = self.conn.execute(
+            "SELECT version FROM board_versions WHERE guild_id = ? AND mode = ?",
+            (guild_id, mode)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get_board_page(self, guild_id: int, mode: str, offset: int = 0, limit: int = 10) -> dict:
+        self.conn.execute("BEGIN")
+        try:
+            version = self.get_board_version(guild_id, mode)
+            if mode == 'extreme':
+                total = self.conn.execute(
+                    f"SELECT COUNT(*) FROM ({EXTREME_BOARD})", (guild_id, guild_id)
+                ).fetchone()[0]
+                return {
+                    'finalized': [],
+                    'live': self.get_extreme_live_with_archive(guild_id, limit, offset),
+                    'finalized_total': 0,
+                    'total': total,
+                    'version': version
+                }
+
+            finalized_total = self._count_finalized(guild_id, mode)
+            finalized = self._finalized_page(guild_id, mode, limit, offset)
+            live_limit = limit - len(finalized)
+            live = []
+            if live_limit > 0:
+                live = self.get_live_leaderboard(guild_id, mode, live_limit, max(0, offset - finalized_total))
+            live_total = self.conn.execute(
+                "SELECT COUNT(*) FROM participants WHERE guild_id = ? AND mode = ?",
+                (guild_id, mode)
+            ).fetchone()[0]
+            return {
+                'finalized': finalized,
+                'live': live,
+                'finalized_total': finalized_total,
+                'total': finalized_total + live_total,
+                'version': version
+            }
+        finally:
+            self.conn.execute("COMMIT")
+
+    def archive_extreme_participant(self, guild_id: int, user_id: int) -> bool:
+        with self._transaction() as conn:
+            row = self._fetch_participant(guild_id, user_id)
+            if row is None or row['mode'] != 'extreme':
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO extreme_archive "
+                "(guild_id, user_id, progress, last_completion, next_extreme_boss) VALUES (?, ?, ?, ?, ?)",
+                (guild_id, user_id, row['progress'] or 0, row['last_completion'] or '', row['next_extreme_boss'])
+            )
+            conn.execute(
+                "DELETE FROM participants WHERE guild_id = ? AND user_id = ?",
+                (guild_id, user_id)
+            )
+        return True
+
+    def get_extreme_live_with_archive(self, guild_id: int, limit: int | None = None, offset: int = 0) -> list[dict]:
+        rows = self.conn.execute(
+            f"SELECT * FROM ({EXTREME_BOARD}) ORDER BY {RANK_ORDER}, user_id LIMIT ? OFFSET ?",
+            (guild_id, guild_id, -1 if limit is None else limit, offset)
+        ).fetchall()
+        return [_row_to_dict(row) for row in rows]
+
+    def store_discord_resource(self, guild_id: int, resource_type: str, resource_id: int, metadata: dict = None):
+        resource = {
+            'guild_id': guild_id,
+            'resource_type': resource_type,
+            'resource_id': resource_id,
+            'metadata': metadata or {},
+            'created_at': datetime.utcnow().isoformat()
+        }
+        self.conn.execute(
+            "INSERT OR REPLACE INTO discord_resources (guild_id, resource_type, resource_id, metadata, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (guild_id, resource_type, resource_id, json.dumps(resource['metadata']), resource['created_at'])
+        )
+        self._resources.put(guild_id, resource_type, resource)
+
+    def _load_discord_resource(self, guild_id: int, resource_type: str) -> dict | None:
+        row = self.conn.execute(
+            "SELECT * FROM discord_resources WHERE guild_id = ? AND resource_type = ?",
+            (guild_id, resource_type)
+        ).fetchone()
+        if row is None:
+            return None
+        resource = _row_to_dict(row)
+        resource['metadata'] = json.loads(row['metadata'] or '{}')
+        return resource
+
+    def get_discord_resource(self, guild_id: int, resource_type: str) -> int:
+        resource = self._resources.get_or_load(
+            guild_id, resource_type,
+            lambda: self._load_discord_resource(guild_id, resource_type)
+        )
+        return resource['resource_id'] if resource else None
+
+    def get_discord_resource_record(self, guild_id: int, resource_type: str) -> dict | None:
+        resource = self._resources.get_or_load(
+            guild_id, resource_type,
+            lambda: self._load_discord_resource(guild_id, resource_type)
+        )
+        if resource is None:
+            return None
+        return {**resource, 'metadata': dict(resource.get('metadata') or {})}
+
+    def remove_discord_resource(self, guild_id: int, resource_type: str) -> bool:
+        cursor = self.conn.execute(
+            "DELETE FROM discord_resources WHERE guild_id = ? AND resource_type = ?",
+            (guild_id, resource_type)
+        )
+        self._resources.put(guild_id, resource_type, None)
+        return cursor.rowcount > 0
+
+    def set_guild_locked(self, guild_id: int, locked: bool) -> None:
+        self.store_discord_resource(guild_id, "guild_locked", 1 if locked else 0)
+
+    def is_guild_locked(self, guild_id: int) -> bool:
+        value = self.get_discord_resource(guild_id, "guild_locked")
+        if value is None:
+            return True
+        return int(value) == 1
+
+    def import_rows(self, table: str, rows: list[dict]):
+        columns = TABLE_COLUMNS[table]
+        values = []
+        for row in rows:
+            row = dict(row)
+            if table == 'discord_resources':
+                row['metadata'] = json.dumps(row.get('metadata') or {})
+            values.append(tuple(row.get(column) for column in columns))
+        placeholders = ", ".join("?" for _ in columns)
+        with self._transaction() as conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+                values
+            )
+        self._resources.clear()
+
+    def count_rows(self, table: str) -> int:
+        if table not in TABLE_COLUMNS:
+            raise ValueError(f"Unknown table: {table}")
+        return self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def close(self):
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
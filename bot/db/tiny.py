@@ -1,138 +1,388 @@
+import functools
+import heapq
+import threading
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
+from typing import Callable
 
 from tinydb import TinyDB, Query
+from tinydb.storages import JSONStorage
+from tinydb.table import Document
+
+from bot.db.ranking import Ranking, rank_key
+from bot.db.resource_cache import ResourceCache
+from bot.db.write_behind import AtomicJSONStorage, ReadCacheMiddleware, WriteBehindMiddleware
+
+
+def _synchronized(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class EventDatabase:
-    def __init__(self, db_path="data/event_bot.db"):
+    def __init__(self, db_path="data/event_bot.db", write_behind: bool = False,
+                 flush_interval: float = 5.0, max_pending_writes: int = 50, version_floor: int = 0):
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-        self.db = TinyDB(db_path)
-        self.participants = self.db.table('participants')
-        self.submissions = self.db.table('submissions')
-        self.completions = self.db.table('completions')
+        self._lock = threading.RLock()
+        self._flush_stop = None
+        self.db = self._open(db_path, write_behind, max_pending_writes)
+        if write_behind:
+            self._start_flusher(flush_interval)
+        self._open_raw_tables()
         self.extreme_archive = self.db.table('extreme_archive')
         self.discord_resources = self.db.table('discord_resources')
+        self._participant_ids = {}
+        self._guild_participant_ids = {}
+        self._rankings = {}
+        self._rank_entries = {}
+        self._archive_rankings = {}
+        self._archive_entries = {}
+        self._completion_ids = {}
+        self._next_ids = {}
+        self._board_versions = {}
+        self._version_floor = version_floor
+        self._resources = ResourceCache()
+        self._rebuild_participant_index()
+    
+    def _open_raw_tables(self):
+        self.participants = self.db.table_class(self.db.storage, 'participants')
+        self.submissions = self.db.table_class(self.db.storage, 'submissions')
+        self.completions = self.db.table_class(self.db.storage, 'completions')
+    
+    def _open(self, db_path: str, write_behind: bool, max_pending_writes: int) -> TinyDB:
+        if write_behind:
+            return TinyDB(
+                db_path,
+                storage=WriteBehindMiddleware(AtomicJSONStorage, max_pending_writes=max_pending_writes)
+            )
+        return TinyDB(db_path, storage=ReadCacheMiddleware(JSONStorage))
+    
+    def _start_flusher(self, flush_interval: float):
+        self._flush_stop = threading.Event()
+        threading.Thread(
+            target=self._flush_loop,
+            args=(flush_interval,),
+            name="db-flusher",
+            daemon=True
+        ).start()
+    
+    def _flush_loop(self, flush_interval: float):
+        while not self._flush_stop.wait(flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Error flushing database: {e}")
+    
+    def _rebuild_participant_index(self):
+        self._participant_ids = {}
+        self._guild_participant_ids = {}
+        self._rankings = {}
+        self._rank_entries = {}
+        self._archive_rankings = {}
+        self._archive_entries = {}
+        self._completion_ids = {}
+        tables = self.db.storage.read() or {}
+        self._next_ids = {
+            name: max((int(doc_id) for doc_id in tables.get(name, {})), default=0) + 1
+            for name in ('submissions', 'completions')
+        }
+        for row in self.participants.all():
+            self._index_participant(row['guild_id'], row['user_id'], row.doc_id, row)
+        for row in self.extreme_archive.all():
+            self._index_archived(row['guild_id'], row['user_id'], row.doc_id, row)
+        completions = sorted(self.completions.all(), key=lambda row: row['completion_order'])
+        for row in completions:
+            self._index_completion(row['guild_id'], row['difficulty'], row.doc_id)
+    
+    def _bump_version(self, guild_id: int, mode: str):
+        self._board_versions[(guild_id, mode)] = self._board_versions.get((guild_id, mode), self._version_floor) + 1
+    
+    def _index_completion(self, guild_id: int, difficulty: str, doc_id: int):
+        self._completion_ids.setdefault((guild_id, difficulty), []).append(doc_id)
+        self._bump_version(guild_id, difficulty)
+    
+    def _index_participant(self, guild_id: int, user_id: int, doc_id: int, row: dict):
+        self._participant_ids[(guild_id, user_id)] = doc_id
+        self._guild_participant_ids.setdefault(guild_id, set()).add(doc_id)
+        self._rank_participant(guild_id, user_id, row)
+    
+    def _rank_participant(self, guild_id: int, user_id: int, row: dict):
+        self._unrank_participant(guild_id, user_id)
+        mode = row.get('mode', 'normal')
+        key = rank_key(row.get('progress', 0), row.get('last_completion'), user_id)
+        self._rankings.setdefault((guild_id, mode), Ranking()).add(key)
+        self._rank_entries[(guild_id, user_id)] = (mode, key)
+        self._bump_version(guild_id, mode)
+    
+    def _unrank_participant(self, guild_id: int, user_id: int):
+        entry = self._rank_entries.pop((guild_id, user_id), None)
+        if entry is None:
+            return
+        mode, key = entry
+        self._bump_version(guild_id, mode)
+        ranking = self._rankings.get((guild_id, mode))
+        if ranking is not None:
+            ranking.discard(key)
+            if not len(ranking):
+                del self._rankings[(guild_id, mode)]
+    
+    def _rerank_participant(self, guild_id: int, user_id: int, fields: dict):
+        entry = self._rank_entries.get((guild_id, user_id))
+        if entry is None or not {'mode', 'progress', 'last_completion'} & fields.keys():
+            return
+        mode, key = entry
+        self._rank_participant(guild_id, user_id, {
+            'mode': fields.get('mode', mode),
+            'progress': fields.get('progress', -key[0]),
+            'last_completion': fields.get('last_completion', key[1]),
+        })
     
+    def _index_archived(self, guild_id: int, user_id: int, doc_id: int, row: dict):
+        previous = self._archive_entries.pop((guild_id, user_id), None)
+        ranking = self._archive_rankings.setdefault(guild_id, Ranking())
+        if previous is not None:
+            ranking.discard(previous[1])
+        key = rank_key(row.get('progress', 0), row.get('last_completion'), user_id)
+        ranking.add(key)
+        self._archive_entries[(guild_id, user_id)] = (doc_id, key)
+        self._bump_version(guild_id, 'extreme')
+    
+    def _get_docs(self, table_name: str, doc_ids: list[int], tables: dict | None = None) -> list:
+        if tables is None:
+            tables = self.db.storage.read() or {}
+        raw_table = tables.get(table_name, {})
+        docs = []
+        for doc_id in doc_ids:
+            raw_doc = raw_table.get(str(doc_id))
+            if raw_doc is not None:
+                docs.append(Document(raw_doc, doc_id))
+        return docs
+    
+    def _unindex_participant(self, guild_id: int, user_id: int) -> int | None:
+        doc_id = self._participant_ids.pop((guild_id, user_id), None)
+        if doc_id is None:
+            return None
+        self._unrank_participant(guild_id, user_id)
+        guild_ids = self._guild_participant_ids.get(guild_id)
+        if guild_ids is not None:
+            guild_ids.discard(doc_id)
+            if not guild_ids:
+                del self._guild_participant_ids[guild_id]
+        return doc_id
+    
+    def _get_participant(self, guild_id: int, user_id: int):
+        doc_id = self._participant_ids.get((guild_id, user_id))
+        if doc_id is None:
+            return None
+        return self.participants.get(doc_id=doc_id)
+    
+    def _get_guild_participants(self, guild_id: int) -> list:
+        doc_ids = self._guild_participant_ids.get(guild_id)
+        if not doc_ids:
+            return []
+        return self._get_docs('participants', list(doc_ids))
+    
+    def _get_ranked_participants(self, guild_id: int, keys: list[tuple], tables: dict | None = None) -> list:
+        doc_ids = [self._participant_ids[(guild_id, key[2])] for key in keys]
+        return self._get_docs('participants', doc_ids, tables)
+    
+    def _update_participant(self, guild_id: int, user_id: int, fields: dict) -> bool:
+        doc_id = self._participant_ids.get((guild_id, user_id))
+        if doc_id is None:
+            return False
+        self.participants.update(fields, doc_ids=[doc_id])
+        self._bump_version(guild_id, self._rank_entries[(guild_id, user_id)][0])
+        self._rerank_participant(guild_id, user_id, fields)
+        return True
+    
+    @_synchronized
     def is_joined(self, guild_id: int, user_id: int) -> bool:
-        User = Query()
-        result = self.participants.search(
-            (User.guild_id == guild_id) & (User.user_id == user_id)
-        )
-        return len(result) > 0
+        return (guild_id, user_id) in self._participant_ids
     
+    @_synchronized
     def join_user(self, guild_id: int, user_id: int) -> bool:
         return self.join_user_with_mode(guild_id, user_id, "normal")
     
+    @_synchronized
     def join_user_with_mode(self, guild_id: int, user_id: int, mode: str) -> bool:
         if self.is_joined(guild_id, user_id):
             return False
         
-        self.participants.insert({
+        row = {
             'guild_id': guild_id,
             'user_id': user_id,
             'progress': 0,
             'mode': mode,
             'joined_at': datetime.utcnow().isoformat()
-        })
+        }
+        doc_id = self.participants.insert(row)
+        self._index_participant(guild_id, user_id, doc_id, row)
         return True
     
+    @_synchronized
     def leave_user(self, guild_id: int, user_id: int) -> bool:
-        User = Query()
-        removed = self.participants.remove(
-            (User.guild_id == guild_id) & (User.user_id == user_id)
-        )
+        doc_id = self._unindex_participant(guild_id, user_id)
+        if doc_id is None:
+            return False
+        removed = self.participants.remove(doc_ids=[doc_id])
         return len(removed) > 0
     
+    @_synchronized
     def reset_user(self, guild_id: int, user_id: int) -> bool:
-        if not self.is_joined(guild_id, user_id):
-            return False
-        
-        User = Query()
-        self.participants.update(
-            {'progress': 0, 'reset_at': datetime.utcnow().isoformat()},
-            (User.guild_id == guild_id) & (User.user_id == user_id)
+        return self._update_participant(
+            guild_id, user_id,
+            {'progress': 0, 'reset_at': datetime.utcnow().isoformat()}
         )
-        return True
     
+    @_synchronized
     def add_completion(self, guild_id: int, user_id: int, after_url: str) -> bool:
-        if not self.is_joined(guild_id, user_id):
+        user_data = self._get_participant(guild_id, user_id)
+        if not user_data:
             return False
         
-        User = Query()
-        user_data = self.participants.search(
-            (User.guild_id == guild_id) & (User.user_id == user_id)
-        )[0]
-        
         new_progress = user_data['progress'] + 1
         current_time = datetime.utcnow().isoformat()
         
-        self.participants.update(
-            {'progress': new_progress, 'last_completion': current_time},
-            (User.guild_id == guild_id) & (User.user_id == user_id)
+        self._update_participant(
+            guild_id, user_id,
+            {'progress': new_progress, 'last_completion': current_time}
         )
         
-        self.submissions.insert({
+        submission_id = self.submissions.insert({
             'guild_id': guild_id,
             'user_id': user_id,
             'step': new_progress,
             'after_url': after_url,
             'ts': current_time
         })
+        self._note_doc_id('submissions', submission_id)
         
         return True
     
-    def get_user_progress(self, guild_id: int, user_id: int) -> int:
-        if not self.is_joined(guild_id, user_id):
-            return 0
+    def _next_doc_id(self, table_name: str) -> int:
+        return self._next_ids.get(table_name, 1)
+    
+    def _note_doc_id(self, table_name: str, doc_id: int):
+        if table_name in self._next_ids:
+            self._next_ids[table_name] = max(self._next_ids[table_name], doc_id + 1)
+    
+    def _commit_raw(self, tables: dict, touched: list[tuple[str, int]]):
+        self.db.storage.write(tables)
+        self._open_raw_tables()
+        for table_name, doc_id in touched:
+            self._note_doc_id(table_name, doc_id)
+    
+    @_synchronized
+    def record_submission(self, guild_id: int, user_id: int, after_url: str,
+                          is_complete: Callable[[int, str], bool],
+                          roll_extreme_boss: Callable[[], str]) -> dict | None:
+        doc_id = self._participant_ids.get((guild_id, user_id))
+        if doc_id is None:
+            return None
         
-        User = Query()
-        user_data = self.participants.search(
-            (User.guild_id == guild_id) & (User.user_id == user_id)
-        )
-        return user_data[0]['progress'] if user_data else 0
+        tables = self.db.storage.read() or {}
+        participants = tables.setdefault('participants', {})
+        row = participants.get(str(doc_id))
+        if row is None:
+            return None
+        
+        new_progress = row['progress'] + 1
+        current_time = datetime.utcnow().isoformat()
+        mode = row.get('mode', 'normal')
+        rolled_next = roll_extreme_boss() if mode == 'extreme' else None
+        completed = mode != 'extreme' and is_complete(new_progress, mode)
+        
+        row['progress'] = new_progress
+        row['last_completion'] = current_time
+        if mode == 'extreme':
+            row['next_extreme_boss'] = rolled_next
+        
+        submissions = tables.setdefault('submissions', {})
+        submission_id = self._next_doc_id('submissions')
+        touched = [('participants', doc_id), ('submissions', submission_id)]
+        submissions[str(submission_id)] = {
+            'guild_id': guild_id,
+            'user_id': user_id,
+            'step': new_progress,
+            'after_url': after_url,
+            'ts': current_time
+        }
+        
+        completion_order = None
+        if completed:
+            completions = tables.setdefault('completions', {})
+            completion_order = self.get_next_completion_order(guild_id, mode)
+            completion_id = self._next_doc_id('completions')
+            touched.append(('completions', completion_id))
+            completions[str(completion_id)] = {
+                'guild_id': guild_id,
+                'user_id': user_id,
+                'difficulty': mode,
+                'completion_time': current_time,
+                'completion_order': completion_order
+            }
+            del participants[str(doc_id)]
+        
+        self._commit_raw(tables, touched)
+        if completed:
+            self._index_completion(guild_id, mode, completion_id)
+            self._unindex_participant(guild_id, user_id)
+        else:
+            self._rerank_participant(
+                guild_id, user_id,
+                {'progress': new_progress, 'last_completion': current_time}
+            )
+        
+        return {
+            'progress': new_progress,
+            'mode': mode,
+            'completed': completed,
+            'completion_order': completion_order,
+            'next_extreme_boss': rolled_next
+        }
     
+    @_synchronized
+    def get_user_progress(self, guild_id: int, user_id: int) -> int:
+        user_data = self._get_participant(guild_id, user_id)
+        return user_data['progress'] if user_data else 0
+    
+    @_synchronized
     def get_user_mode(self, guild_id: int, user_id: int) -> str:
-        if not self.is_joined(guild_id, user_id):
-            return 'normal'
-        
-        User = Query()
-        user_data = self.participants.search(
-            (User.guild_id == guild_id) & (User.user_id == user_id)
-        )
-        return user_data[0].get('mode', 'normal') if user_data else 'normal'
+        user_data = self._get_participant(guild_id, user_id)
+        return user_data.get('mode', 'normal') if user_data else 'normal'
     
+    @_synchronized
     def set_user_progress(self, guild_id: int, user_id: int, progress: int, mode: str) -> bool:
-        User = Query()
         if not self.is_joined(guild_id, user_id):
             self.join_user_with_mode(guild_id, user_id, mode)
-        self.participants.update(
+        self._update_participant(
+            guild_id, user_id,
             {
                 'progress': max(0, int(progress)),
                 'mode': mode,
                 'last_completion': datetime.utcnow().isoformat()
-            },
-            (User.guild_id == guild_id) & (User.user_id == user_id)
+            }
         )
         return True
 
+    @_synchronized
     def set_next_extreme_boss(self, guild_id: int, user_id: int, boss_name: str | None) -> None:
-        User = Query()
-        self.participants.update(
-            {'next_extreme_boss': boss_name},
-            (User.guild_id == guild_id) & (User.user_id == user_id)
-        )
+        self._update_participant(guild_id, user_id, {'next_extreme_boss': boss_name})
 
+    @_synchronized
     def get_next_extreme_boss(self, guild_id: int, user_id: int) -> str | None:
-        User = Query()
-        row = self.participants.get((User.guild_id == guild_id) & (User.user_id == user_id))
+        row = self._get_participant(guild_id, user_id)
         if row:
             return row.get('next_extreme_boss')
         return None
     
+    @_synchronized
     def get_leaderboard(self, guild_id: int, limit: int = 10) -> list:
-        User = Query()
-        guild_participants = self.participants.search(User.guild_id == guild_id)
+        guild_participants = self._get_guild_participants(guild_id)
         
         sorted_participants = sorted(
             guild_participants,
@@ -141,20 +391,24 @@ class EventDatabase:
         
         return sorted_participants[:limit]
     
+    @_synchronized
     def mark_difficulty_complete(self, guild_id: int, user_id: int, difficulty: str, completion_time: str) -> bool:
         if not self.is_joined(guild_id, user_id):
             return False
         
-        self.completions.insert({
+        doc_id = self.completions.insert({
             'guild_id': guild_id,
             'user_id': user_id,
             'difficulty': difficulty,
             'completion_time': completion_time,
             'completion_order': self.get_next_completion_order(guild_id, difficulty)
         })
+        self._note_doc_id('completions', doc_id)
+        self._index_completion(guild_id, difficulty, doc_id)
         self.leave_user(guild_id, user_id)
         return True
     
+    @_synchronized
     def get_completed_difficulties(self, guild_id: int, user_id: int) -> list[str]:
         User = Query()
         completions = self.completions.search(
@@ -162,13 +416,11 @@ class EventDatabase:
         )
         return [completion['difficulty'] for completion in completions]
     
+    @_synchronized
     def get_next_completion_order(self, guild_id: int, difficulty: str) -> int:
-        User = Query()
-        existing_completions = self.completions.search(
-            (User.guild_id == guild_id) & (User.difficulty == difficulty)
-        )
-        return len(existing_completions) + 1
+        return len(self._completion_ids.get((guild_id, difficulty), ())) + 1
     
+    @_synchronized
     def get_finalized_leaderboard(self, guild_id: int, difficulty: str) -> list[dict]:
         User = Query()
         completions = self.completions.search(
@@ -178,90 +430,222 @@ class EventDatabase:
         sorted_completions = sorted(completions, key=lambda x: x['completion_order'])
         return sorted_completions
     
-    def get_live_leaderboard(self, guild_id: int, difficulty: str) -> list[dict]:
-        User = Query()
-        guild_participants = self.participants.search(User.guild_id == guild_id)
-        
-        mode_participants = [user for user in guild_participants if user.get('mode', 'normal') == difficulty]
-        
-        sorted_participants = sorted(
-            mode_participants,
-            key=lambda x: (-x['progress'], x.get('last_completion', '9999-12-31'))
-        )
-        
-        return sorted_participants
+    @_synchronized
+    def get_live_leaderboard(self, guild_id: int, difficulty: str, limit: int | None = None, offset: int = 0) -> list[dict]:
+        ranking = self._rankings.get((guild_id, difficulty))
+        if ranking is None:
+            return []
+        return self._get_ranked_participants(guild_id, ranking.keys(offset, limit))
+    
+    @_synchronized
+    def get_user_rank(self, guild_id: int, user_id: int, mode: str) -> int:
+        entry = self._rank_entries.get((guild_id, user_id))
+        if entry is None or entry[0] != mode:
+            return 0
+        return self._rankings[(guild_id, mode)].rank(entry[1])
 
+    @_synchronized
     def archive_extreme_participant(self, guild_id: int, user_id: int) -> bool:
         User = Query()
-        rows = self.participants.search((User.guild_id == guild_id) & (User.user_id == user_id))
-        if not rows:
+        row = self._get_participant(guild_id, user_id)
+        if not row:
             return False
-        row = rows[0]
         if row.get('mode') != 'extreme':
             return False
-        self.extreme_archive.upsert({
+        archived = {
             'guild_id': guild_id,
             'user_id': user_id,
             'progress': row.get('progress', 0),
             'last_completion': row.get('last_completion', ''),
             'next_extreme_boss': row.get('next_extreme_boss')
-        }, (User.guild_id == guild_id) & (User.user_id == user_id))
-        self.participants.remove((User.guild_id == guild_id) & (User.user_id == user_id))
+        }
+        doc_ids = self.extreme_archive.upsert(
+            archived, (User.guild_id == guild_id) & (User.user_id == user_id)
+        )
+        self._index_archived(guild_id, user_id, doc_ids[0], archived)
+        self.leave_user(guild_id, user_id)
         return True
 
-    def get_extreme_live_with_archive(self, guild_id: int) -> list[dict]:
-        User = Query()
-        active = [u for u in self.participants.search(User.guild_id == guild_id) if u.get('mode') == 'extreme']
-        archived = self.extreme_archive.search(User.guild_id == guild_id)
-        active_ids = {u['user_id'] for u in active}
-        combined = active + [a for a in archived if a['user_id'] not in active_ids]
-        for u in combined:
-            if 'mode' not in u:
-                u['mode'] = 'extreme'
-        combined_sorted = sorted(combined, key=lambda x: (-x.get('progress', 0), x.get('last_completion', '9999-12-31')))
-        return combined_sorted
+    @_synchronized
+    def get_extreme_live_with_archive(self, guild_id: int, limit: int | None = None, offset: int = 0) -> list[dict]:
+        return self._extreme_live_with_archive(guild_id, limit, self.db.storage.read() or {}, offset)
+    
+    def _extreme_total(self, guild_id: int) -> int:
+        active = self._rankings.get((guild_id, 'extreme'), Ranking())
+        archive = self._archive_rankings.get(guild_id, Ranking())
+        if len(active) <= len(archive):
+            shadowed = sum(1 for key in active if (guild_id, key[2]) in self._archive_entries)
+        else:
+            shadowed = sum(
+                1 for key in archive
+                if self._rank_entries.get((guild_id, key[2]), (None,))[0] == 'extreme'
+            )
+        return len(active) + len(archive) - shadowed
+    
+    def _extreme_live_with_archive(self, guild_id: int, limit: int | None, tables: dict, offset: int = 0) -> list[dict]:
+        active = self._rankings.get((guild_id, 'extreme'), Ranking())
+        archive = self._archive_rankings.get(guild_id, Ranking())
+        archived = (
+            key for key in archive
+            if self._rank_entries.get((guild_id, key[2]), (None,))[0] != 'extreme'
+        )
+        merged = list(islice(heapq.merge(
+            ((key, True) for key in active),
+            ((key, False) for key in archived)
+        ), offset, None if limit is None else offset + limit))
+        
+        rows = {}
+        for doc in self._get_ranked_participants(guild_id, [key for key, is_active in merged if is_active], tables):
+            rows[doc['user_id']] = doc
+        archive_ids = [self._archive_entries[(guild_id, key[2])][0] for key, is_active in merged if not is_active]
+        for doc in self._get_docs('extreme_archive', archive_ids, tables):
+            doc.setdefault('mode', 'extreme')
+            rows[doc['user_id']] = doc
+        return [rows[key[2]] for key, _ in merged if key[2] in rows]
+    
+    @_synchronized
+    def get_participants_many(self, guild_id: int, user_ids: list[int]) -> dict[int, dict]:
+        doc_ids = [
+            self._participant_ids[(guild_id, user_id)]
+            for user_id in user_ids
+            if (guild_id, user_id) in self._participant_ids
+        ]
+        return {doc['user_id']: doc for doc in self._get_docs('participants', doc_ids)}
+    
+    @_synchronized
+    def get_mode_board(self, guild_id: int, mode: str, limit: int | None = 10) -> dict:
+        tables = self.db.storage.read() or {}
+        if mode == 'extreme':
+            return {
+                'finalized': [],
+                'finalized_total': 0,
+                'live': self._extreme_live_with_archive(guild_id, limit, tables)
+            }
+        
+        completion_ids = self._completion_ids.get((guild_id, mode), [])
+        finalized = self._get_docs('completions', completion_ids[:limit], tables)
+        ranking = self._rankings.get((guild_id, mode))
+        live = self._get_ranked_participants(guild_id, ranking.keys(limit=limit), tables) if ranking else []
+        return {'finalized': finalized, 'finalized_total': len(completion_ids), 'live': live}
+    
+    @_synchronized
+    def get_board_version(self, guild_id: int, mode: str) -> int:
+        return self._board_versions.get((guild_id, mode), self._version_floor)
     
+    @_synchronized
+    def max_board_version(self) -> int:
+        return max(self._board_versions.values(), default=self._version_floor)
+    
+    @_synchronized
+    def get_board_page(self, guild_id: int, mode: str, offset: int = 0, limit: int = 10) -> dict:
+        tables = self.db.storage.read() or {}
+        version = self._board_versions.get((guild_id, mode), self._version_floor)
+        if mode == 'extreme':
+            return {
+                'finalized': [],
+                'live': self._extreme_live_with_archive(guild_id, limit, tables, offset),
+                'finalized_total': 0,
+                'total': self._extreme_total(guild_id),
+                'version': version
+            }
+        
+        completion_ids = self._completion_ids.get((guild_id, mode), [])
+        finalized = self._get_docs('completions', completion_ids[offset:offset + limit], tables)
+        ranking = self._rankings.get((guild_id, mode), Ranking())
+        live_limit = limit - len(finalized)
+        live_keys = ranking.keys(max(0, offset - len(completion_ids)), live_limit) if live_limit > 0 else []
+        return {
+            'finalized': finalized,
+            'live': self._get_ranked_participants(guild_id, live_keys, tables),
+            'finalized_total': len(completion_ids),
+            'total': len(completion_ids) + len(ranking),
+            'version': version
+        }
+    
+    @_synchronized
     def store_discord_resource(self, guild_id: int, resource_type: str, resource_id: int, metadata: dict = None):
         Resource = Query()
-        self.discord_resources.upsert({
+        resource = {
             'guild_id': guild_id,
             'resource_type': resource_type,
             'resource_id': resource_id,
             'metadata': metadata or {},
             'created_at': datetime.utcnow().isoformat()
-        }, (Resource.guild_id == guild_id) & (Resource.resource_type == resource_type))
+        }
+        self.discord_resources.upsert(
+            resource, (Resource.guild_id == guild_id) & (Resource.resource_type == resource_type)
+        )
+        self._resources.put(guild_id, resource_type, resource)
     
-    def get_discord_resource(self, guild_id: int, resource_type: str) -> int:
+    def _load_discord_resource(self, guild_id: int, resource_type: str) -> dict | None:
         Resource = Query()
         result = self.discord_resources.search(
             (Resource.guild_id == guild_id) & (Resource.resource_type == resource_type)
         )
-        return result[0]['resource_id'] if result else None
+        return dict(result[0]) if result else None
+    
+    @_synchronized
+    def get_discord_resource(self, guild_id: int, resource_type: str) -> int:
+        resource = self._resources.get_or_load(
+            guild_id, resource_type,
+            lambda: self._load_discord_resource(guild_id, resource_type)
+        )
+        return resource['resource_id'] if resource else None
+    
+    @_synchronized
+    def get_discord_resource_record(self, guild_id: int, resource_type: str) -> dict | None:
+        resource = self._resources.get_or_load(
+            guild_id, resource_type,
+            lambda: self._load_discord_resource(guild_id, resource_type)
+        )
+        if resource is None:
+            return None
+        return {**resource, 'metadata': dict(resource.get('metadata') or {})}
     
+    @_synchronized
     def remove_discord_resource(self, guild_id: int, resource_type: str) -> bool:
         Resource = Query()
         removed = self.discord_resources.remove(
             (Resource.guild_id == guild_id) & (Resource.resource_type == resource_type)
         )
+        self._resources.put(guild_id, resource_type, None)
         return len(removed) > 0
 
+    @_synchronized
     def set_guild_locked(self, guild_id: int, locked: bool) -> None:
         self.store_discord_resource(guild_id, "guild_locked", 1 if locked else 0)
 
+    @_synchronized
     def is_guild_locked(self, guild_id: int) -> bool:
         value = self.get_discord_resource(guild_id, "guild_locked")
         if value is None:
             return True
         return int(value) == 1
     
+    @_synchronized
+    def flush(self) -> int:
+        storage = self.db.storage
+        if isinstance(storage, WriteBehindMiddleware):
+            return storage.flush()
+        return 0
+    
+    @_synchronized
+    def get_storage_metrics(self) -> dict:
+        storage = self.db.storage
+        if isinstance(storage, (WriteBehindMiddleware, ReadCacheMiddleware)):
+            return storage.metrics()
+        return {}
+    
+    @_synchronized
     def close(self):
+        if self._flush_stop is not None:
+            self._flush_stop.set()
         self.db.close()
+        storage = self.db.storage
+        if isinstance(storage, WriteBehindMiddleware):
+            metrics = storage.metrics()
+            print(
+                f"Database closed after {metrics['writes']} writes in {metrics['flushes']} flushes "
+                f"({metrics['writes_per_flush']:.1f} writes per flush)"
+            )
 
-
-_db_instance = None
-
-def get_database() -> EventDatabase:
-    global _db_instance
-    if _db_instance is None:
-        _db_instance = EventDatabase()
-    return _db_instance
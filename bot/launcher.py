@@ -0,0 +1,117 @@
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import aiohttp
+from dotenv import load_dotenv
+
+
+def shard_ranges(shard_count: int, processes: int) -> list[list[int]]:
+    processes = max(1, min(processes, shard_count))
+    base, extra = divmod(shard_count, processes)
+    ranges = []
+    start = 0
+    for index in range(processes):
+        size = base + (1 if index < extra else 0)
+        ranges.append(list(range(start, start + size)))
+        start += size
+    return ranges
+
+
+async def recommended_shard_count(token: str) -> int:
+    async with aiohttp.ClientSession() as session:
+        async with session.get(
+            "https://discord.com/api/v10/gateway/bot",
+            headers={"Authorization": f"Bot {token}"}
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+    return int(data["shards"])
+
+
+class Launcher:
+    def __init__(self, shard_count: int, processes: int, restart_delay: float = 5.0):
+        self.ranges = shard_ranges(shard_count, processes)
+        self.shard_count = shard_count
+        self.restart_delay = restart_delay
+        self.workers = {}
+        self.restarts = 0
+        self.stopping = False
+        self.terminated = set()
+
+    def _spawn(self, index: int) -> subprocess.Popen:
+        shard_ids = self.ranges[index]
+        env = dict(os.environ)
+        env["SHARD_COUNT"] = str(self.shard_count)
+        env["SHARD_IDS"] = ",".join(str(shard_id) for shard_id in shard_ids)
+        env["BOT_WORKER_INDEX"] = str(index)
+        if len(self.ranges) > 1:
+            env["DB_PROCESS_LOCKS"] = "1"
+        print(f"Starting worker {index} for shards {shard_ids[0]}-{shard_ids[-1]} of {self.shard_count}")
+        return subprocess.Popen([sys.executable, "-m", "bot.main"], env=env)
+
+    def stop(self, *_):
+        self.stopping = True
+        for index, process in self.workers.items():
+            if process.poll() is None:
+                self.terminated.add(index)
+                process.terminate()
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        for index in range(len(self.ranges)):
+            self.workers[index] = self._spawn(index)
+        pending_restarts = {}
+        while not self.stopping:
+            time.sleep(1)
+            for index, process in list(self.workers.items()):
+                code = process.poll()
+                if code is None or self.stopping:
+                    continue
+                if index not in pending_restarts:
+                    print(f"Worker {index} exited with code {code}, restarting in {self.restart_delay:.0f}s")
+                    pending_restarts[index] = time.monotonic() + self.restart_delay
+                elif time.monotonic() >= pending_restarts[index]:
+                    del pending_restarts[index]
+                    self.restarts += 1
+                    self.workers[index] = self._spawn(index)
+        codes = {index: process.wait() for index, process in self.workers.items()}
+        print(f"All workers stopped ({self.restarts} restarts)")
+        return max(
+            (abs(code) for index, code in codes.items() if index not in self.terminated),
+            default=0
+        )
+
+
+def main(argv=None) -> int:
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Run the bot as several worker processes, each owning a range of shards")
+    parser.add_argument("--processes", type=int, default=int(os.getenv("BOT_PROCESSES", "1")))
+    parser.add_argument("--shards", type=int, default=int(os.getenv("SHARD_COUNT", "0")) or None)
+    parser.add_argument("--restart-delay", type=float, default=5.0)
+    args = parser.parse_args(argv)
+
+    backend = os.getenv("DB_BACKEND", "tiny").lower()
+    if args.processes > 1 and backend != "sqlite":
+        print(f"Error: running {args.processes} processes requires DB_BACKEND=sqlite, got '{backend}'")
+        return 2
+
+    shard_count = args.shards
+    if shard_count is None:
+        token = os.getenv("DISCORD_TOKEN")
+        if not token:
+            print("Error: DISCORD_TOKEN not found in environment variables")
+            return 2
+        shard_count = asyncio.run(recommended_shard_count(token))
+        print(f"Discord recommends {shard_count} shards")
+
+    return Launcher(shard_count, args.processes, args.restart_delay).run()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
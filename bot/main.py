@@ -1,58 +1,283 @@
 import asyncio
+import hashlib
+import json
 import os
+import signal
+import time
+from datetime import datetime
 
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 from bot.services.boss_progression import BossProgressionService
+from bot.services.discord_dispatcher import (
+    PRIORITY_COSMETIC, PRIORITY_LEADERBOARD,
+    get_dispatcher, guild_route
+)
+from bot.services.image_upload import get_image_service
+from bot.services.static_messages import embed_fingerprint, get_static_message_tracker
+
+BOSS_CHALLENGE_CATEGORY = "╔═══Boss Challenge═══╗"
+BOOTSTRAP_RESOURCES = (
+    "channel_easy", "channel_normal", "channel_hard", "channel_extreme", "completions", "info"
+)
 
 load_dotenv()
 
-class EventBot(commands.Bot):
+class EventBot(commands.AutoShardedBot):
     def __init__(self):
         intents = discord.Intents.default()
         intents.guilds = True
+        shard_count = os.getenv('SHARD_COUNT')
+        shard_ids = os.getenv('SHARD_IDS')
         super().__init__(
             command_prefix='!',
             intents=intents,
-            help_command=None
+            help_command=None,
+            shard_count=int(shard_count) if shard_count else None,
+            shard_ids=[int(shard_id) for shard_id in shard_ids.split(',')] if shard_ids else None
         )
+        self.bootstrap_metrics = {}
+        self._bootstrap_locks = {}
+        self._layout_version = None
+        self.lazy_provisioning = os.getenv('LAZY_PROVISIONING', '0').lower() in ('1', 'true', 'yes')
+        self._provisioned_guilds = set()
+        self._provisioning_tasks = {}
     
     async def setup_hook(self):
+        await get_image_service().start()
         await self.load_extension('bot.cogs.event')
+        if self.shard_ids is None or 0 in self.shard_ids:
+            await self.sync_command_tree()
+        else:
+            print(f"Shards {self.shard_ids} leave slash command sync to shard 0")
+    
+    def command_tree_hash(self) -> str:
+        payload = {
+            'application_id': self.application_id,
+            'commands': sorted(
+                (command.to_dict(self.tree) for command in self.tree.get_commands()),
+                key=lambda command: (command.get('type', 1), command['name'])
+            ),
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+    
+    async def sync_command_tree(self):
+        path = os.getenv('COMMAND_SYNC_HASH_PATH', 'data/command_tree.sha256')
+        force = os.getenv('FORCE_COMMAND_SYNC', '0').lower() in ('1', 'true', 'yes')
+        tree_hash = self.command_tree_hash()
+        stored_hash = None
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                stored_hash = f.read().strip()
+        if stored_hash == tree_hash and not force:
+            print(f"Slash commands unchanged ({tree_hash[:12]}), skipped sync")
+            return
         await self.tree.sync()
-        print(f"Synced slash commands for {self.user}")
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(tree_hash)
+        os.replace(temp_path, path)
+        reason = "forced" if force and stored_hash == tree_hash else "changed"
+        print(f"Synced slash commands for {self.user} ({reason}, {tree_hash[:12]})")
+    
+    async def shutdown(self):
+        try:
+            await self.close()
+        except Exception as e:
+            print(f"Error closing Discord connection: {e!r}")
+        if self.lazy_provisioning:
+            print(f"Lazily provisioned guilds: {self.bootstrap_metrics.get('lazy_provisioned', 0)}")
+        metrics = get_dispatcher().metrics()
+        for name, counts in metrics.items():
+            print(f"Discord {name} requests: {counts['completed']} completed, {counts['failed']} failed, max queue {counts['max_depth']}, avg wait {counts['avg_wait_ms']}ms")
+        await get_dispatcher().close()
+        image_metrics = get_image_service().metrics()
+        print(f"Image downloads: {image_metrics['downloads']} ok, {image_metrics['failed_downloads']} failed, avg {image_metrics['avg_download_ms']}ms, {image_metrics['connections_created']} connections opened (avg {image_metrics['avg_connect_ms']}ms), {image_metrics['connections_reused']} reused")
+        await get_image_service().close()
+        from bot.db import get_async_database
+        await get_async_database().close()
     
     async def on_ready(self):
-        print(f'{self.user} has connected to Discord!')
+        shards = ', '.join(str(shard_id) for shard_id in sorted(self.shards))
+        print(f'{self.user} has connected to Discord! (shards {shards} of {self.shard_count})')
+        if self.lazy_provisioning:
+            print(f"Lazy provisioning enabled, {len(self.guilds)} guilds will be set up on first use")
+            return
         await self.ensure_leaderboard_channels()
     
+    async def on_guild_join(self, guild):
+        print(f"Joined guild {guild.name} ({guild.id})")
+        if self.lazy_provisioning:
+            return
+        try:
+            await self.ensure_guild_bootstrapped(guild)
+        except Exception as e:
+            print(f"Bootstrap failed for guild {guild.id}: {e!r}")
+    
     async def ensure_leaderboard_channels(self):
-        for guild in self.guilds:
-            category = await self.ensure_boss_challenge_category(guild)
-            svc = BossProgressionService()
-            easy_count = svc.get_max_bosses_for_mode("easy")
-            normal_count = svc.get_max_bosses_for_mode("normal")
-            hard_count = svc.get_max_bosses_for_mode("hard")
-            difficulties = [
-                ("easy", "🌱", f"Easy Mode Challenge - Obor to TOA 150 Invocation ({easy_count} bosses)"),
-                ("normal", "🛡️", f"Normal Mode Challenge - Obor to Phosani's Nightmare ({normal_count} bosses)"),
-                ("hard", "🔥", f"Hard Mode Challenge - Obor to Sol Heredit ({hard_count} bosses)"),
-                ("extreme", "💀", "Extreme Mode Challenge - Corrupted Hunleff to Infinite Random")
-            ]
-            for difficulty, emoji, topic in difficulties:
-                await self.ensure_difficulty_channel(guild, difficulty, emoji, topic, category)
-            await self.ensure_completions_channel(guild, category)
-            await self.ensure_info_channel(guild, category)
-            await self.position_category_channels(guild, category)
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(max(1, int(os.getenv('BOOTSTRAP_CONCURRENCY', '8'))))
+        guilds = list(self.guilds)
+        results = await asyncio.gather(
+            *(self._bootstrap_guild_limited(semaphore, guild) for guild in guilds),
+            return_exceptions=True
+        )
+        failed = 0
+        checked = 0
+        for guild, result in zip(guilds, results):
+            if isinstance(result, BaseException):
+                failed += 1
+                print(f"Bootstrap failed for guild {guild.id}: {result!r}")
+            elif result:
+                checked += 1
+        duration_ms = (time.perf_counter() - started) * 1000
+        self.bootstrap_metrics = {
+            'guilds': len(guilds),
+            'checked': checked,
+            'skipped': len(guilds) - checked - failed,
+            'failed': failed,
+            'duration_ms': round(duration_ms, 1),
+        }
+        print(f"Bootstrapped {checked} of {len(guilds)} guilds ({self.bootstrap_metrics['skipped']} up to date, {failed} failed) in {duration_ms:.0f}ms")
+    
+    async def _bootstrap_guild_limited(self, semaphore, guild):
+        async with semaphore:
+            return await self.ensure_guild_bootstrapped(guild)
+    
+    def _bootstrap_lock(self, guild_id: int) -> asyncio.Lock:
+        lock = self._bootstrap_locks.get(guild_id)
+        if lock is None:
+            lock = self._bootstrap_locks[guild_id] = asyncio.Lock()
+        return lock
+    
+    def provision_guild_lazily(self, guild):
+        if not self.lazy_provisioning or guild is None or guild.id in self._provisioned_guilds:
+            return
+        self._provisioned_guilds.add(guild.id)
+        task = asyncio.create_task(self._provision_guild(guild), name=f"provision-{guild.id}")
+        self._provisioning_tasks[guild.id] = task
+        task.add_done_callback(lambda _: self._provisioning_tasks.pop(guild.id, None))
+    
+    async def wait_until_provisioned(self, guild):
+        if not self.lazy_provisioning or guild is None:
+            return
+        self.provision_guild_lazily(guild)
+        task = self._provisioning_tasks.get(guild.id)
+        if task is not None:
+            await asyncio.shield(task)
+    
+    async def _provision_guild(self, guild):
+        try:
+            if await self.ensure_guild_bootstrapped(guild):
+                self.bootstrap_metrics['lazy_provisioned'] = self.bootstrap_metrics.get('lazy_provisioned', 0) + 1
+                print(f"Lazily provisioned guild {guild.id} ({self.bootstrap_metrics['lazy_provisioned']} so far)")
+        except Exception as e:
+            self._provisioned_guilds.discard(guild.id)
+            print(f"Lazy provisioning failed for guild {guild.id}: {e!r}")
+    
+    async def ensure_guild_bootstrapped(self, guild, force: bool = False) -> bool:
+        async with self._bootstrap_lock(guild.id):
+            from bot.db import get_async_database
+            db = get_async_database()
+            state = await db.get_discord_resource_record(guild.id, "bootstrap")
+            if not force and self._bootstrap_state_is_fresh(guild, state):
+                return False
+            started = time.perf_counter()
+            try:
+                category = await self.bootstrap_guild(guild)
+                await self._store_bootstrap_state(guild, category)
+            finally:
+                print(f"Bootstrapped guild {guild.id} in {(time.perf_counter() - started) * 1000:.0f}ms")
+            return True
+    
+    def _bootstrap_state_is_fresh(self, guild, state) -> bool:
+        if not state:
+            return False
+        metadata = state['metadata']
+        if metadata.get('layout') != self.bootstrap_layout_version():
+            return False
+        try:
+            verified_at = datetime.fromisoformat(metadata['verified_at'])
+        except (KeyError, TypeError, ValueError):
+            return False
+        max_age = float(os.getenv('BOOTSTRAP_MAX_AGE', '86400'))
+        if (datetime.utcnow() - verified_at).total_seconds() > max_age:
+            return False
+        channel_ids = [state['resource_id']] + list((metadata.get('channels') or {}).values())
+        if len(channel_ids) != len(BOOTSTRAP_RESOURCES) + 1:
+            return False
+        return all(channel_id and guild.get_channel(channel_id) for channel_id in channel_ids)
+    
+    async def _store_bootstrap_state(self, guild, category):
+        if not category:
+            raise RuntimeError(f"Could not find or create the {BOSS_CHALLENGE_CATEGORY} category in guild {guild.id}")
+        from bot.db import get_async_database
+        db = get_async_database()
+        channels = {}
+        for resource_type in BOOTSTRAP_RESOURCES:
+            channel_id = await db.get_discord_resource(guild.id, resource_type)
+            if channel_id:
+                channels[resource_type] = channel_id
+        missing = [resource_type for resource_type in BOOTSTRAP_RESOURCES if resource_type not in channels]
+        if missing:
+            raise RuntimeError(f"Could not set up {', '.join(missing)} in guild {guild.id}")
+        await db.store_discord_resource(guild.id, "bootstrap", category.id, {
+            'layout': self.bootstrap_layout_version(),
+            'channels': channels,
+            'verified_at': datetime.utcnow().isoformat(),
+        })
+    
+    def bootstrap_layout_version(self) -> str:
+        if self._layout_version is None:
+            layout = {
+                'category': BOSS_CHALLENGE_CATEGORY,
+                'difficulties': self._difficulty_layout(),
+                'resources': BOOTSTRAP_RESOURCES,
+                'info': [embed_fingerprint(self._info_event_embed()), embed_fingerprint(self._info_commands_embed())],
+            }
+            event_cog = self.get_cog('EventCog')
+            if event_cog:
+                layout['boss_lists'] = [
+                    embed_fingerprint(event_cog.leaderboard_manager._create_boss_list_embed(difficulty))
+                    for difficulty, _, _ in layout['difficulties']
+                ]
+            self._layout_version = hashlib.sha1(
+                json.dumps(layout, sort_keys=True).encode('utf-8')
+            ).hexdigest()
+        return self._layout_version
+    
+    def _difficulty_layout(self) -> list[tuple[str, str, str]]:
+        svc = BossProgressionService()
+        easy_count = svc.get_max_bosses_for_mode("easy")
+        normal_count = svc.get_max_bosses_for_mode("normal")
+        hard_count = svc.get_max_bosses_for_mode("hard")
+        return [
+            ("easy", "🌱", f"Easy Mode Challenge - Obor to TOA 150 Invocation ({easy_count} bosses)"),
+            ("normal", "🛡️", f"Normal Mode Challenge - Obor to Phosani's Nightmare ({normal_count} bosses)"),
+            ("hard", "🔥", f"Hard Mode Challenge - Obor to Sol Heredit ({hard_count} bosses)"),
+            ("extreme", "💀", "Extreme Mode Challenge - Corrupted Hunleff to Infinite Random")
+        ]
+    
+    async def bootstrap_guild(self, guild):
+        category = await self.ensure_boss_challenge_category(guild)
+        await asyncio.gather(
+            *(self.ensure_difficulty_channel(guild, difficulty, emoji, topic, category)
+              for difficulty, emoji, topic in self._difficulty_layout()),
+            self.ensure_completions_channel(guild, category),
+            self.ensure_info_channel(guild, category)
+        )
+        await self.position_category_channels(guild, category)
+        return category
     
     async def ensure_boss_challenge_category(self, guild):
-        styled_name = "╔═══Boss Challenge═══╗"
+        styled_name = BOSS_CHALLENGE_CATEGORY
         existing = discord.utils.get(guild.categories, name=styled_name)
         if existing:
             return existing
         try:
-            category = await guild.create_category(styled_name)
+            category = await get_dispatcher().run(PRIORITY_LEADERBOARD, guild_route(guild.id), guild.create_category, styled_name)
             return category
         except discord.Forbidden:
             return None
@@ -61,13 +286,13 @@ class EventBot(commands.Bot):
     
     async def ensure_difficulty_channel(self, guild, difficulty, emoji, topic, category):
         try:
-            from bot.db.tiny import get_database
-            db = get_database()
+            from bot.db import get_async_database
+            db = get_async_database()
             
             channel_name = f"{emoji}・{difficulty}"
             channel = None
             
-            stored_channel_id = db.get_discord_resource(guild.id, f"channel_{difficulty}")
+            stored_channel_id = await db.get_discord_resource(guild.id, f"channel_{difficulty}")
             
             if stored_channel_id:
                 channel = guild.get_channel(stored_channel_id)
@@ -75,7 +300,7 @@ class EventBot(commands.Bot):
                     print(f"Found valid {difficulty} channel: {channel.name}")
                     if category and channel.category != category:
                         try:
-                            await channel.edit(category=category)
+                            await get_dispatcher().run(PRIORITY_COSMETIC, guild_route(guild.id), channel.edit, category=category)
                         except discord.Forbidden:
                             pass
                     try:
@@ -85,15 +310,17 @@ class EventBot(commands.Bot):
                     return
                 else:
                     print(f"Stored {difficulty} channel ID {stored_channel_id} is invalid, removing from DB")
-                    db.remove_discord_resource(guild.id, f"channel_{difficulty}")
+                    await db.remove_discord_resource(guild.id, f"channel_{difficulty}")
             
             print(f"Creating new {difficulty} channel: {channel_name}")
-            channel = await guild.create_text_channel(
+            channel = await get_dispatcher().run(
+                PRIORITY_LEADERBOARD, guild_route(guild.id),
+                guild.create_text_channel,
                 channel_name,
                 topic=topic,
                 category=category
             )
-            self._store_channel_id(guild.id, difficulty, channel.id, channel_name)
+            await self._store_channel_id(guild.id, difficulty, channel.id, channel_name)
             await self._create_channel_content(channel, guild.id, difficulty)
                     
         except discord.Forbidden:
@@ -101,10 +328,10 @@ class EventBot(commands.Bot):
         except Exception as e:
             print(f"Error with boss-challenge-{difficulty} channel in {guild.name}: {e}")
     
-    def _store_channel_id(self, guild_id, difficulty, channel_id, channel_name):
-        from bot.db.tiny import get_database
-        db = get_database()
-        db.store_discord_resource(guild_id, f"channel_{difficulty}", channel_id, {'name': channel_name})
+    async def _store_channel_id(self, guild_id, difficulty, channel_id, channel_name):
+        from bot.db import get_async_database
+        db = get_async_database()
+        await db.store_discord_resource(guild_id, f"channel_{difficulty}", channel_id, {'name': channel_name})
     
     async def _create_channel_content(self, channel, guild_id, difficulty):
         event_cog = self.get_cog('EventCog')
@@ -122,12 +349,12 @@ class EventBot(commands.Bot):
     
     async def ensure_completions_channel(self, guild, category):
         try:
-            from bot.db.tiny import get_database
-            db = get_database()
+            from bot.db import get_async_database
+            db = get_async_database()
             
             completions_channel_name = "🏆・boss-completions"
             
-            stored_channel_id = db.get_discord_resource(guild.id, "completions")
+            stored_channel_id = await db.get_discord_resource(guild.id, "completions")
             
             if stored_channel_id:
                 channel = guild.get_channel(stored_channel_id)
@@ -135,25 +362,22 @@ class EventBot(commands.Bot):
                     print(f"Found valid completions channel: {channel.name}")
                     if category and channel.category != category:
                         try:
-                            await channel.edit(category=category)
+                            await get_dispatcher().run(PRIORITY_COSMETIC, guild_route(guild.id), channel.edit, category=category)
                         except discord.Forbidden:
                             pass
                     return
                 else:
                     print(f"Stored completions channel ID {stored_channel_id} is invalid, removing from DB")
-                    db.remove_discord_resource(guild.id, "completions")
+                    await db.remove_discord_resource(guild.id, "completions")
             print(f"Creating new completions channel: {completions_channel_name}")
-            channel = await guild.create_text_channel(
+            channel = await get_dispatcher().run(
+                PRIORITY_LEADERBOARD, guild_route(guild.id),
+                guild.create_text_channel,
                 completions_channel_name,
                 topic="Boss Defeats and Progress Updates - View difficulty channels for rules and leaderboards",
                 category=category
             )
-            db.store_discord_resource(guild.id, "completions", channel.id, {'name': completions_channel_name})
-            
-            try:
-                await channel.edit(position=1)
-            except discord.Forbidden:
-                pass
+            await db.store_discord_resource(guild.id, "completions", channel.id, {'name': completions_channel_name})
                         
         except discord.Forbidden:
             print(f"No permission to create boss-completions channel in {guild.name}")
@@ -164,42 +388,43 @@ class EventBot(commands.Bot):
         if not category:
             return
         try:
-            from bot.db.tiny import get_database
-            db = get_database()
-            info_channel_id = db.get_discord_resource(guild.id, "info")
-            if info_channel_id:
-                info = guild.get_channel(info_channel_id)
-                if info and info.category == category:
-                    try:
-                        await info.edit(position=0)
-                    except discord.Forbidden:
-                        pass
-            completions_channel_id = db.get_discord_resource(guild.id, "completions")
-            if completions_channel_id:
-                completions = guild.get_channel(completions_channel_id)
-                if completions and completions.category == category:
-                    try:
-                        await completions.edit(position=1)
-                    except discord.Forbidden:
-                        pass
+            from bot.db import get_async_database
+            db = get_async_database()
+            current = category.text_channels
+            wanted = []
+            for resource_type in ("info", "completions"):
+                channel_id = await db.get_discord_resource(guild.id, resource_type)
+                channel = guild.get_channel(channel_id) if channel_id else None
+                if channel and channel.category == category:
+                    wanted.append(channel)
             order = [
                 ("easy", "🌱"),
                 ("normal", "🛡️"),
                 ("hard", "🔥"),
                 ("extreme", "💀"),
             ]
-            next_pos = 2
             for difficulty, emoji in order:
-                name = f"{emoji}・{difficulty}"
-                ch = discord.utils.get(guild.text_channels, name=name)
-                if ch and ch.category == category:
-                    try:
-                        await ch.edit(position=next_pos)
-                        next_pos += 1
-                    except discord.Forbidden:
-                        continue
-        except Exception:
-            pass
+                ch = discord.utils.get(current, name=f"{emoji}・{difficulty}")
+                if ch and ch not in wanted:
+                    wanted.append(ch)
+            layout = wanted + [ch for ch in current if ch not in wanted]
+            if [ch.id for ch in layout] == [ch.id for ch in current]:
+                return
+            base = min(ch.position for ch in current)
+            payload = [
+                {'id': ch.id, 'position': base + index}
+                for index, ch in enumerate(layout)
+                if ch.position != base + index
+            ]
+            print(f"Reordering {len(payload)} channels in {guild.name}")
+            await get_dispatcher().run(
+                PRIORITY_COSMETIC, guild_route(guild.id),
+                self.http.bulk_channel_update, guild.id, payload
+            )
+        except discord.Forbidden:
+            print(f"No permission to reorder Boss Challenge channels in {guild.name}")
+        except Exception as e:
+            print(f"Error positioning Boss Challenge channels in {guild.name}: {e}")
 
     async def ensure_info_channel(self, guild, category):
         try:
@@ -208,115 +433,109 @@ class EventBot(commands.Bot):
             full_name = f"{info_icon}・{base_name}"
             info_channel = discord.utils.get(guild.text_channels, name=full_name)
             if not info_channel:
-                info_channel = await guild.create_text_channel(full_name, category=category)
-                from bot.db.tiny import get_database
-                db = get_database()
-                db.store_discord_resource(guild.id, "info", info_channel.id, {'name': full_name})
-            elif category and info_channel.category != category:
-                try:
-                    await info_channel.edit(category=category)
-                except discord.Forbidden:
-                    pass
-            try:
-                await info_channel.edit(position=0)
-            except discord.Forbidden:
-                pass
+                info_channel = await get_dispatcher().run(PRIORITY_LEADERBOARD, guild_route(guild.id), guild.create_text_channel, full_name, category=category)
+                from bot.db import get_async_database
+                db = get_async_database()
+                await db.store_discord_resource(guild.id, "info", info_channel.id, {'name': full_name})
+            else:
+                from bot.db import get_async_database
+                db = get_async_database()
+                if await db.get_discord_resource(guild.id, "info") != info_channel.id:
+                    await db.store_discord_resource(guild.id, "info", info_channel.id, {'name': full_name})
+                if category and info_channel.category != category:
+                    try:
+                        await get_dispatcher().run(PRIORITY_COSMETIC, guild_route(guild.id), info_channel.edit, category=category)
+                    except discord.Forbidden:
+                        pass
             try:
-                messages = [msg async for msg in info_channel.history(limit=10)]
-                has_commands_embed = any(
-                    msg.embeds and msg.author == self.user and 
-                    msg.embeds[0].title == "🏆 Boss Challenge Commands" 
-                    for msg in messages
-                )
-                has_event_embed = any(
-                    msg.embeds and msg.author == self.user and 
-                    msg.embeds[0].title == "📖 About the Boss Challenge"
-                    for msg in messages
-                )
-                
-                if not has_event_embed:
-                    svc = BossProgressionService()
-                    easy_count = svc.get_max_bosses_for_mode("easy")
-                    normal_count = svc.get_max_bosses_for_mode("normal")
-                    hard_count = svc.get_max_bosses_for_mode("hard")
-                    event_embed = discord.Embed(
-                        title="📖 About the Boss Challenge",
-                        description="Progress through RuneScape bosses in order. Complete one boss, move to the next.",
-                        color=discord.Color.blue()
-                    )
-                    event_embed.add_field(
-                        name="🌱 Easy Mode", 
-                        value=f"{easy_count} bosses: Obor → TOA 150 Invocation", 
-                        inline=True
-                    )
-                    event_embed.add_field(
-                        name="🛡️ Normal Mode", 
-                        value=f"{normal_count} bosses: Obor → Phosani's Nightmare", 
-                        inline=True
-                    )
-                    event_embed.add_field(
-                        name="🔥 Hard Mode", 
-                        value=f"{hard_count} bosses: Obor → Sol Heredit", 
-                        inline=True
-                    )
-                    event_embed.add_field(
-                        name="💀 Extreme Mode", 
-                        value="Infinite: Corrupted Hunleff → Random bosses", 
-                        inline=True
-                    )
-                    event_embed.add_field(
-                        name="📝 Core Rules", 
-                        value="• Submit before/after screenshots\n• One boss at a time in order\n• Death = reset progress to 0", 
-                        inline=False
-                    )
-                    event_embed.add_field(
-                        name="💰 Economy Rules", 
-                        value="• Only boss loot can be sold for money\n• No other money-making methods\n• Can buy from Grand Exchange & shops\n• No picking up spawned items", 
-                        inline=True
-                    )
-                    event_embed.add_field(
-                        name="⚔️ Gear Restrictions", 
-                        value="• Only items buyable from GE/shops\n• No void, dragon defender, arclight, etc.\n• Start with nothing after death", 
-                        inline=True
-                    )
-                    event_embed.add_field(
-                        name="🎥 Example", 
-                        value="[Settled - Killing every Boss in Runescape, using ONLY their loot](https://www.youtube.com/watch?v=9eMCUVVmgBs)", 
-                        inline=False
-                    )
-                    await info_channel.send(embed=event_embed)
-                    
-                if not has_commands_embed:
-                    embed = discord.Embed(
-                        title="🏆 Boss Challenge Commands",
-                        description="Use these slash commands to participate in the boss challenge!",
-                        color=discord.Color.blue()
-                    )
-                    embed.add_field(
-                        name="🎯 ```/join```", 
-                        value="Join the boss challenge by selecting a difficulty mode", 
-                        inline=False
-                    )
-                    embed.add_field(
-                        name="🚪 ```/leave```", 
-                        value="Leave the challenge", 
-                        inline=False
-                    )
-                    embed.add_field(
-                        name="🔄 ```/reset```", 
-                        value="Reset your progress back to **0**, if you died", 
-                        inline=False
-                    )
-                    embed.add_field(
-                        name="✅ ```/submit```", 
-                        value="Submit **before** & **after** screenshots of your boss kill", 
-                        inline=False
-                    )
-                    await info_channel.send(embed=embed)
-            except Exception:
-                pass
+                tracker = get_static_message_tracker(self)
+                await tracker.ensure(info_channel, guild.id, "info_event", self._info_event_embed())
+                await tracker.ensure(info_channel, guild.id, "info_commands", self._info_commands_embed())
+            except Exception as e:
+                print(f"Error ensuring info embeds in {guild.name}: {e}")
         except discord.Forbidden:
             pass
+    
+    def _info_event_embed(self) -> discord.Embed:
+        svc = BossProgressionService()
+        easy_count = svc.get_max_bosses_for_mode("easy")
+        normal_count = svc.get_max_bosses_for_mode("normal")
+        hard_count = svc.get_max_bosses_for_mode("hard")
+        event_embed = discord.Embed(
+            title="📖 About the Boss Challenge",
+            description="Progress through RuneScape bosses in order. Complete one boss, move to the next.",
+            color=discord.Color.blue()
+        )
+        event_embed.add_field(
+            name="🌱 Easy Mode", 
+            value=f"{easy_count} bosses: Obor → TOA 150 Invocation", 
+            inline=True
+        )
+        event_embed.add_field(
+            name="🛡️ Normal Mode", 
+            value=f"{normal_count} bosses: Obor → Phosani's Nightmare", 
+            inline=True
+        )
+        event_embed.add_field(
+            name="🔥 Hard Mode", 
+            value=f"{hard_count} bosses: Obor → Sol Heredit", 
+            inline=True
+        )
+        event_embed.add_field(
+            name="💀 Extreme Mode", 
+            value="Infinite: Corrupted Hunleff → Random bosses", 
+            inline=True
+        )
+        event_embed.add_field(
+            name="📝 Core Rules", 
+            value="• Submit before/after screenshots\n• One boss at a time in order\n• Death = reset progress to 0", 
+            inline=False
+        )
+        event_embed.add_field(
+            name="💰 Economy Rules", 
+            value="• Only boss loot can be sold for money\n• No other money-making methods\n• Can buy from Grand Exchange & shops\n• No picking up spawned items", 
+            inline=True
+        )
+        event_embed.add_field(
+            name="⚔️ Gear Restrictions", 
+            value="• Only items buyable from GE/shops\n• No void, dragon defender, arclight, etc.\n• Start with nothing after death", 
+            inline=True
+        )
+        event_embed.add_field(
+            name="🎥 Example", 
+            value="[Settled - Killing every Boss in Runescape, using ONLY their loot](https://www.youtube.com/watch?v=9eMCUVVmgBs)", 
+            inline=False
+        )
+        return event_embed
+    
+    def _info_commands_embed(self) -> discord.Embed:
+        embed = discord.Embed(
+            title="🏆 Boss Challenge Commands",
+            description="Use these slash commands to participate in the boss challenge!",
+            color=discord.Color.blue()
+        )
+        embed.add_field(
+            name="🎯 ```/join```", 
+            value="Join the boss challenge by selecting a difficulty mode", 
+            inline=False
+        )
+        embed.add_field(
+            name="🚪 ```/leave```", 
+            value="Leave the challenge", 
+            inline=False
+        )
+        embed.add_field(
+            name="🔄 ```/reset```", 
+            value="Reset your progress back to **0**, if you died", 
+            inline=False
+        )
+        embed.add_field(
+            name="✅ ```/submit```", 
+            value="Submit **before** & **after** screenshots of your boss kill", 
+            inline=False
+        )
+        return embed
+
 
 async def main():
     bot = EventBot()
@@ -326,10 +545,16 @@ async def main():
         print("Error: DISCORD_TOKEN not found in environment variables")
         return
     
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGTERM, lambda: loop.create_task(bot.close()))
+    except NotImplementedError:
+        pass
+    
     try:
         await bot.start(token)
-    except KeyboardInterrupt:
-        await bot.close()
+    finally:
+        await bot.shutdown()
 
 if __name__ == '__main__':
     asyncio.run(main())
@@ -0,0 +1,165 @@
+import asyncio
+import os
+from collections import deque
+
+
+PRIORITY_FOLLOWUP = 0
+PRIORITY_COMPLETION = 1
+PRIORITY_LEADERBOARD = 2
+PRIORITY_COSMETIC = 3
+
+PRIORITY_NAMES = {
+    PRIORITY_FOLLOWUP: 'followup',
+    PRIORITY_COMPLETION: 'completion',
+    PRIORITY_LEADERBOARD: 'leaderboard',
+    PRIORITY_COSMETIC: 'cosmetic',
+}
+
+
+def channel_route(channel_id: int) -> str:
+    return f"channel:{channel_id}"
+
+
+def guild_route(guild_id: int) -> str:
+    return f"guild:{guild_id}"
+
+
+def interaction_route(interaction) -> str:
+    return f"interaction:{interaction.id}"
+
+
+async def fetch_history(channel, limit: int) -> list:
+    return [message async for message in channel.history(limit=limit)]
+
+
+class DiscordDispatcher:
+    def __init__(self, workers: int = 4, route_concurrency: int = 1):
+        self.workers = max(3, workers)
+        self.route_concurrency = max(1, route_concurrency)
+        self.class_limits = {
+            PRIORITY_LEADERBOARD: self.workers - 2,
+            PRIORITY_COSMETIC: 1,
+        }
+        self._queues = {priority: deque() for priority in PRIORITY_NAMES}
+        self._active = {priority: 0 for priority in PRIORITY_NAMES}
+        self._routes = {}
+        self._ready = None
+        self._tasks = []
+        self.max_depth = {priority: 0 for priority in PRIORITY_NAMES}
+        self.completed = {priority: 0 for priority in PRIORITY_NAMES}
+        self.failed = {priority: 0 for priority in PRIORITY_NAMES}
+        self.wait_ms = {priority: 0.0 for priority in PRIORITY_NAMES}
+
+    def _start(self):
+        if self._tasks:
+            return
+        self._ready = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"discord-dispatch-{index}")
+            for index in range(self.workers)
+        ]
+
+    def submit(self, priority: int, route: str, func, *args, **kwargs) -> asyncio.Future:
+        self._start()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self._queues[priority]
+        queue.append((route, func, args, kwargs, future, loop.time()))
+        self.max_depth[priority] = max(self.max_depth[priority], len(queue))
+        self._ready.set()
+        return future
+
+    async def run(self, priority: int, route: str, func, *args, **kwargs):
+        return await self.submit(priority, route, func, *args, **kwargs)
+
+    def post(self, priority: int, route: str, func, *args, **kwargs) -> asyncio.Future:
+        future = self.submit(priority, route, func, *args, **kwargs)
+        future.add_done_callback(self._log_failure)
+        return future
+
+    def _log_failure(self, future: asyncio.Future):
+        if not future.cancelled() and future.exception():
+            print(f"Queued Discord request failed: {future.exception()}")
+
+    def _take(self):
+        for priority, queue in self._queues.items():
+            limit = self.class_limits.get(priority)
+            if limit is not None and self._active[priority] >= limit:
+                continue
+            for index, item in enumerate(queue):
+                if item[4].cancelled():
+                    continue
+                route = item[0]
+                if self._routes.get(route, 0) >= self.route_concurrency:
+                    continue
+                del queue[index]
+                self._active[priority] += 1
+                self._routes[route] = self._routes.get(route, 0) + 1
+                return priority, item
+            while queue and queue[0][4].cancelled():
+                queue.popleft()
+        return None
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            taken = self._take()
+            if taken is None:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            priority, (route, func, args, kwargs, future, queued_at) = taken
+            self.wait_ms[priority] += (loop.time() - queued_at) * 1000
+            try:
+                result = await func(*args, **kwargs)
+                self.completed[priority] += 1
+                if not future.done():
+                    future.set_result(result)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                self.failed[priority] += 1
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._active[priority] -= 1
+                self._routes[route] -= 1
+                if not self._routes[route]:
+                    del self._routes[route]
+                self._ready.set()
+
+    def metrics(self) -> dict:
+        metrics = {}
+        for priority, name in PRIORITY_NAMES.items():
+            done = self.completed[priority] + self.failed[priority]
+            metrics[name] = {
+                'queued': len(self._queues[priority]),
+                'active': self._active[priority],
+                'max_depth': self.max_depth[priority],
+                'completed': self.completed[priority],
+                'failed': self.failed[priority],
+                'avg_wait_ms': round(self.wait_ms[priority] / done, 2) if done else 0.0,
+            }
+        return metrics
+
+    async def close(self):
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for queue in self._queues.values():
+            while queue:
+                queue.popleft()[4].cancel()
+
+
+_dispatcher = None
+
+def get_dispatcher() -> DiscordDispatcher:
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = DiscordDispatcher(
+            workers=int(os.getenv('DISCORD_DISPATCH_WORKERS', '4')),
+            route_concurrency=int(os.getenv('DISCORD_ROUTE_CONCURRENCY', '1'))
+        )
+    return _dispatcher
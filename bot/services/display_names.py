@@ -0,0 +1,147 @@
+import asyncio
+import os
+import time
+from collections import OrderedDict
+
+import discord
+
+from bot.services.discord_dispatcher import PRIORITY_LEADERBOARD, get_dispatcher
+
+
+QUERY_CHUNK_SIZE = 100
+
+
+def _name_of(user) -> str | None:
+    if getattr(user, 'display_name', None):
+        return user.display_name
+    if getattr(user, 'global_name', None):
+        return user.global_name
+    return getattr(user, 'name', None)
+
+
+class DisplayNameCache:
+    def __init__(self, bot, max_entries: int = 5000, ttl: float = 600.0, negative_ttl: float = 120.0):
+        self.bot = bot
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.member_queries = 0
+        self.user_fetches = 0
+
+    def _lookup(self, key: tuple[int, int], now: float):
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        name, expires_at = entry
+        if expires_at <= now:
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, name
+
+    def _store(self, guild_id: int, user_id: int, name: str | None):
+        ttl = self.ttl if name else self.negative_ttl
+        key = (guild_id, user_id)
+        self._entries[key] = (name, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def remember(self, guild_id: int, user):
+        name = _name_of(user)
+        if name:
+            self._store(guild_id, user.id, name)
+
+    def invalidate(self, guild_id: int, user_id: int):
+        self._entries.pop((guild_id, user_id), None)
+
+    async def resolve_many(self, guild_id: int, user_ids) -> dict[int, str]:
+        now = time.monotonic()
+        names = {}
+        missing = []
+        for user_id in dict.fromkeys(user_ids):
+            found, name = self._lookup((guild_id, user_id), now)
+            if found:
+                self.hits += 1
+                names[user_id] = name
+            else:
+                self.misses += 1
+                missing.append(user_id)
+
+        guild = self.bot.get_guild(guild_id)
+        unresolved = []
+        for user_id in missing:
+            user = guild.get_member(user_id) if guild else None
+            if user is None:
+                user = self.bot.get_user(user_id)
+            if user is None:
+                unresolved.append(user_id)
+            else:
+                names[user_id] = _name_of(user)
+                self._store(guild_id, user_id, names[user_id])
+
+        if unresolved and guild:
+            unresolved = await self._query_members(guild, unresolved, names)
+        for user_id in unresolved:
+            names[user_id] = await self._fetch_user(guild_id, user_id)
+
+        return {user_id: names.get(user_id) or f"User {user_id}" for user_id in dict.fromkeys(user_ids)}
+
+    async def _query_members(self, guild, user_ids: list[int], names: dict) -> list[int]:
+        remaining = []
+        for start in range(0, len(user_ids), QUERY_CHUNK_SIZE):
+            chunk = user_ids[start:start + QUERY_CHUNK_SIZE]
+            self.member_queries += 1
+            try:
+                members = await guild.query_members(user_ids=chunk, limit=len(chunk), cache=True)
+            except (asyncio.TimeoutError, discord.ClientException) as e:
+                print(f"Member query failed for guild {guild.id}: {e}")
+                remaining.extend(chunk)
+                continue
+            found = {member.id: member for member in members}
+            for user_id in chunk:
+                member = found.get(user_id)
+                if member is None:
+                    remaining.append(user_id)
+                else:
+                    names[user_id] = _name_of(member)
+                    self._store(guild.id, user_id, names[user_id])
+        return remaining
+
+    async def _fetch_user(self, guild_id: int, user_id: int) -> str | None:
+        self.user_fetches += 1
+        try:
+            user = await get_dispatcher().run(PRIORITY_LEADERBOARD, "users", self.bot.fetch_user, user_id)
+        except discord.NotFound:
+            user = None
+        except discord.HTTPException as e:
+            print(f"Error fetching user {user_id}: {e}")
+            return None
+        name = _name_of(user) if user else None
+        self._store(guild_id, user_id, name)
+        return name
+
+    def metrics(self) -> dict:
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'member_queries': self.member_queries,
+            'user_fetches': self.user_fetches,
+        }
+
+
+_display_name_cache = None
+
+def get_display_name_cache(bot) -> DisplayNameCache:
+    global _display_name_cache
+    if _display_name_cache is None:
+        _display_name_cache = DisplayNameCache(
+            bot,
+            max_entries=int(os.getenv('DISPLAY_NAME_CACHE_SIZE', '5000')),
+            ttl=float(os.getenv('DISPLAY_NAME_TTL', '600'))
+        )
+    return _display_name_cache
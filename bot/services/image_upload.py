@@ -1,4 +1,5 @@
 import os
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -8,17 +9,93 @@ import aiohttp
 
 
 class ImageUploadService:
-    def __init__(self, storage_path="data/images"):
+    def __init__(self, storage_path="data/images", connection_limit: int = 20, connections_per_host: int = 8,
+                 keepalive: float = 30.0, dns_cache_ttl: int = 300, timeout: float = 30.0):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.connection_limit = connection_limit
+        self.connections_per_host = connections_per_host
+        self.keepalive = keepalive
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = timeout
+        self._session = None
+        self.downloads = 0
+        self.failed_downloads = 0
+        self.download_ms = 0.0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.connect_ms = 0.0
+    
+    async def start(self):
+        if self._session and not self._session.closed:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connections_per_host,
+            keepalive_timeout=self.keepalive,
+            ttl_dns_cache=self.dns_cache_ttl
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout, connect=min(10.0, self.timeout)),
+            trace_configs=[self._trace_config()]
+        )
+    
+    async def close(self):
+        session, self._session = self._session, None
+        if session and not session.closed:
+            await session.close()
+    
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        
+        async def on_connection_create_start(session, context, params):
+            context.connect_started = time.perf_counter()
+        
+        async def on_connection_create_end(session, context, params):
+            self.connections_created += 1
+            self.connect_ms += (time.perf_counter() - context.connect_started) * 1000
+        
+        async def on_connection_reuseconn(session, context, params):
+            self.connections_reused += 1
+        
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+    
+    async def _download(self, image_url: str):
+        if self._session is None or self._session.closed:
+            await self.start()
+        started = time.perf_counter()
+        try:
+            async with self._session.get(image_url) as response:
+                if response.status != 200:
+                    self.failed_downloads += 1
+                    return None, None
+                image_data = await response.read()
+        except Exception:
+            self.failed_downloads += 1
+            raise
+        self.downloads += 1
+        self.download_ms += (time.perf_counter() - started) * 1000
+        return image_data, response.headers.get('content-type', '')
+    
+    def metrics(self) -> dict:
+        return {
+            'downloads': self.downloads,
+            'failed_downloads': self.failed_downloads,
+            'avg_download_ms': round(self.download_ms / self.downloads, 1) if self.downloads else 0.0,
+            'connections_created': self.connections_created,
+            'connections_reused': self.connections_reused,
+            'avg_connect_ms': round(self.connect_ms / self.connections_created, 1) if self.connections_created else 0.0,
+        }
     
     async def upload_from_url(self, image_url: str, guild_id: int, user_id: int, image_type: str = "unknown", step: int = 1) -> Optional[str]:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(image_url) as response:
-                    if response.status != 200:
-                        return None
-                    image_data = await response.read()
+            image_data, content_type = await self._download(image_url)
+            if image_data is None:
+                return None
             
             guild_dir = self.storage_path / f"guild_{guild_id}"
             user_dir = guild_dir / f"user_{user_id}"
@@ -29,7 +106,7 @@ class ImageUploadService:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             unique_id = str(uuid.uuid4())[:8]
             
-            file_ext = self._get_file_extension(image_url, response.headers.get('content-type', ''))
+            file_ext = self._get_file_extension(image_url, content_type)
             
             filename = f"step_{step}_{timestamp}_{unique_id}{file_ext}"
             file_path = type_dir / filename
@@ -80,5 +157,11 @@ _upload_service = None
 def get_image_service() -> ImageUploadService:
     global _upload_service
     if _upload_service is None:
-        _upload_service = ImageUploadService()
+        _upload_service = ImageUploadService(
+            connection_limit=int(os.getenv('IMAGE_HTTP_CONNECTIONS', '20')),
+            connections_per_host=int(os.getenv('IMAGE_HTTP_CONNECTIONS_PER_HOST', '8')),
+            keepalive=float(os.getenv('IMAGE_HTTP_KEEPALIVE', '30')),
+            dns_cache_ttl=int(os.getenv('IMAGE_HTTP_DNS_TTL', '300')),
+            timeout=float(os.getenv('IMAGE_HTTP_TIMEOUT', '30'))
+        )
     return _upload_service
@@ -0,0 +1,95 @@
+import asyncio
+from typing import Awaitable, Callable
+
+
+class LeaderboardRefreshScheduler:
+    def __init__(self, refresh: Callable[[int, str], Awaitable[None]],
+                 window: float = 3.0, max_staleness: float = 10.0, flush_timeout: float = 10.0):
+        self.refresh = refresh
+        self.window = window
+        self.max_staleness = max(window, max_staleness)
+        self.flush_timeout = flush_timeout
+        self._dirty_since = {}
+        self._deadlines = {}
+        self._last_run = {}
+        self._tasks = {}
+        self._refreshing = set()
+        self.requested = 0
+        self.coalesced = 0
+        self.executed = 0
+        self.failed = 0
+
+    def mark_dirty(self, guild_id: int, mode: str):
+        now = asyncio.get_running_loop().time()
+        key = (guild_id, mode)
+        self.requested += 1
+        dirty_since = self._dirty_since.setdefault(key, now)
+        deadline = min(now + self.window, dirty_since + self.max_staleness)
+        self._deadlines[key] = max(deadline, self._last_run.get(key, float('-inf')) + self.window)
+        if key in self._tasks:
+            self.coalesced += 1
+            return
+        self._tasks[key] = asyncio.create_task(self._drain(key))
+
+    async def _drain(self, key: tuple[int, str]):
+        loop = asyncio.get_running_loop()
+        try:
+            while (delay := self._deadlines[key] - loop.time()) > 0:
+                await asyncio.sleep(delay)
+            self._dirty_since.pop(key, None)
+            self._deadlines.pop(key, None)
+            await self._refresh_once(key)
+        finally:
+            self._tasks.pop(key, None)
+            if key in self._deadlines and not loop.is_closed():
+                self._tasks[key] = asyncio.create_task(self._drain(key))
+
+    async def _refresh_once(self, key: tuple[int, str]):
+        self._last_run[key] = asyncio.get_running_loop().time()
+        self._refreshing.add(key)
+        try:
+            await self.refresh(*key)
+            self.executed += 1
+        except Exception as e:
+            self.failed += 1
+            print(f"Error refreshing {key[1]} leaderboard for guild {key[0]}: {e}")
+        finally:
+            self._refreshing.discard(key)
+    
+    async def _flush(self, key: tuple[int, str], task: asyncio.Task | None, dirty: bool):
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+        if dirty:
+            await self._refresh_once(key)
+    
+    def metrics(self) -> dict:
+        return {
+            'requested': self.requested,
+            'coalesced': self.coalesced,
+            'executed': self.executed,
+            'failed': self.failed,
+            'pending': len(self._tasks),
+        }
+
+    async def close(self):
+        dirty = set(self._deadlines)
+        tasks = dict(self._tasks)
+        self._tasks.clear()
+        self._deadlines.clear()
+        self._dirty_since.clear()
+        for key, task in tasks.items():
+            if key not in self._refreshing:
+                task.cancel()
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(
+                    self._flush(key, tasks.get(key), key in dirty)
+                    for key in dirty | tasks.keys()
+                )),
+                self.flush_timeout
+            )
+        except asyncio.TimeoutError:
+            print(f"Timed out flushing {len(dirty)} dirty leaderboards on shutdown")
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
@@ -0,0 +1,90 @@
+import hashlib
+import json
+
+import discord
+
+from bot.services.discord_dispatcher import PRIORITY_LEADERBOARD, channel_route, fetch_history, get_dispatcher
+
+
+def embed_fingerprint(embed: discord.Embed) -> str:
+    content = embed.to_dict()
+    content.pop('timestamp', None)
+    content.pop('footer', None)
+    content.pop('type', None)
+    return hashlib.sha1(json.dumps(content, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class StaticMessageTracker:
+    def __init__(self, bot, db, history_limit: int = 50):
+        self.bot = bot
+        self.db = db
+        self.history_limit = history_limit
+        self.dispatcher = get_dispatcher()
+        self.verified = 0
+        self.edited = 0
+        self.repaired = 0
+        self.sent = 0
+
+    async def ensure(self, channel, guild_id: int, resource_type: str, embed: discord.Embed) -> bool:
+        version = embed_fingerprint(embed)
+        record = await self.db.get_discord_resource_record(guild_id, resource_type)
+        if record:
+            metadata = record.get('metadata') or {}
+            if metadata.get('channel_id') == channel.id:
+                if metadata.get('version') == version:
+                    self.verified += 1
+                    return False
+                try:
+                    await self._run(channel, channel.get_partial_message(record['resource_id']).edit, embed=embed)
+                    await self._store(guild_id, resource_type, record['resource_id'], channel, version)
+                    self.edited += 1
+                    return False
+                except discord.NotFound:
+                    pass
+            await self.db.remove_discord_resource(guild_id, resource_type)
+
+        message = await self._find_in_history(channel, embed.title)
+        if message:
+            if embed_fingerprint(message.embeds[0]) != version:
+                await self._run(channel, message.edit, embed=embed)
+            await self._store(guild_id, resource_type, message.id, channel, version)
+            self.repaired += 1
+            return False
+
+        message = await self._run(channel, channel.send, embed=embed)
+        await self._store(guild_id, resource_type, message.id, channel, version)
+        self.sent += 1
+        return True
+
+    async def _find_in_history(self, channel, title: str):
+        messages = await self._run(channel, fetch_history, channel, self.history_limit)
+        for message in messages:
+            if message.author == self.bot.user and message.embeds and message.embeds[0].title == title:
+                return message
+        return None
+
+    async def _store(self, guild_id: int, resource_type: str, message_id: int, channel, version: str):
+        await self.db.store_discord_resource(
+            guild_id, resource_type, message_id, {'channel_id': channel.id, 'version': version}
+        )
+
+    async def _run(self, channel, func, *args, **kwargs):
+        return await self.dispatcher.run(PRIORITY_LEADERBOARD, channel_route(channel.id), func, *args, **kwargs)
+
+    def metrics(self) -> dict:
+        return {
+            'verified': self.verified,
+            'edited': self.edited,
+            'repaired': self.repaired,
+            'sent': self.sent,
+        }
+
+
+_static_message_tracker = None
+
+def get_static_message_tracker(bot) -> StaticMessageTracker:
+    global _static_message_tracker
+    if _static_message_tracker is None:
+        from bot.db import get_async_database
+        _static_message_tracker = StaticMessageTracker(bot, get_async_database())
+    return _static_message_tracker
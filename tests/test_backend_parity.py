@@ -0,0 +1,94 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from bot.db.sqlite import SqliteEventDatabase
+from bot.db.tiny import EventDatabase
+
+MODES = ("easy", "normal", "hard")
+GUILDS = (1, 2)
+USERS = range(12)
+
+
+class SteppingClock:
+    current = datetime(2025, 1, 1)
+
+    @classmethod
+    def utcnow(cls):
+        cls.current += timedelta(seconds=1)
+        return cls.current
+
+
+@pytest.fixture
+def backends(tmp_path, monkeypatch):
+    monkeypatch.setattr("bot.db.tiny.datetime", SteppingClock)
+    monkeypatch.setattr("bot.db.sqlite.datetime", SteppingClock)
+    tiny = EventDatabase(str(tmp_path / "event_bot.db"))
+    sqlite = SqliteEventDatabase(str(tmp_path / "event_bot.sqlite3"))
+    yield tiny, sqlite
+    tiny.close()
+    sqlite.close()
+
+
+def _operations(seed: int, count: int):
+    rng = random.Random(seed)
+    for _ in range(count):
+        guild_id = rng.choice(GUILDS)
+        user_id = rng.choice(USERS)
+        operation = rng.choice(["join", "submit", "submit", "submit", "reset", "leave", "mark"])
+        yield operation, guild_id, user_id, rng.choice(MODES)
+
+
+def _apply(db, operation: str, guild_id: int, user_id: int, mode: str):
+    if operation == "join":
+        return db.join_user_with_mode(guild_id, user_id, mode)
+    if operation == "submit":
+        return db.record_submission(
+            guild_id, user_id, "after.png",
+            is_complete=lambda progress, _: progress >= 6,
+            roll_extreme_boss=lambda: "Zulrah"
+        )
+    if operation == "reset":
+        return db.reset_user(guild_id, user_id)
+    if operation == "leave":
+        return db.leave_user(guild_id, user_id)
+    return db.mark_difficulty_complete(guild_id, user_id, mode, "2025-06-01T00:00:00")
+
+
+def _live(rows: list[dict]) -> list[tuple]:
+    return [(row['user_id'], row['progress'], row['mode']) for row in rows]
+
+
+def _finalized(rows: list[dict]) -> list[tuple]:
+    return [(row['user_id'], row['difficulty'], row['completion_order']) for row in rows]
+
+
+def _snapshot(db) -> dict:
+    snapshot = {}
+    for guild_id in GUILDS:
+        for mode in MODES:
+            board = db.get_mode_board(guild_id, mode, limit=None)
+            pages = []
+            for offset in range(0, board['finalized_total'] + len(board['live']) + 1, 3):
+                page = db.get_board_page(guild_id, mode, offset, 3)
+                pages.append((_finalized(page['finalized']), _live(page['live']), page['finalized_total'], page['total']))
+            snapshot[(guild_id, mode)] = {
+                'finalized': _finalized(db.get_finalized_leaderboard(guild_id, mode)),
+                'finalized_total': board['finalized_total'],
+                'live': _live(board['live']),
+                'ranks': [db.get_user_rank(guild_id, user_id, mode) for user_id in USERS],
+                'next_order': db.get_next_completion_order(guild_id, mode),
+                'pages': pages,
+            }
+    return snapshot
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sqlite_matches_tiny_for_the_same_operations(backends, seed):
+    tiny, sqlite = backends
+    for index, (operation, guild_id, user_id, mode) in enumerate(_operations(seed, 300)):
+        assert _apply(tiny, operation, guild_id, user_id, mode) == _apply(sqlite, operation, guild_id, user_id, mode)
+        if index % 50 == 49:
+            assert _snapshot(tiny) == _snapshot(sqlite)
+    assert _snapshot(tiny) == _snapshot(sqlite)
@@ -0,0 +1,96 @@
+import asyncio
+
+from bot.services.discord_dispatcher import (
+    PRIORITY_COMPLETION,
+    PRIORITY_COSMETIC,
+    PRIORITY_FOLLOWUP,
+    PRIORITY_LEADERBOARD,
+    DiscordDispatcher,
+)
+
+
+class Recorder:
+    def __init__(self):
+        self.started = []
+        self.active = 0
+        self.peak = 0
+        self.release = asyncio.Event()
+
+    async def call(self, name, wait=True):
+        self.started.append(name)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if wait:
+                await self.release.wait()
+            else:
+                await asyncio.sleep(0)
+        finally:
+            self.active -= 1
+        return name
+
+
+def test_higher_priorities_run_first():
+    async def scenario():
+        dispatcher = DiscordDispatcher(workers=3)
+        recorder = Recorder()
+        try:
+            blockers = [dispatcher.submit(PRIORITY_FOLLOWUP, f"block:{index}", recorder.call, f"block{index}") for index in range(3)]
+            await asyncio.sleep(0.01)
+            queued = [
+                dispatcher.submit(PRIORITY_COSMETIC, "a", recorder.call, "cosmetic", False),
+                dispatcher.submit(PRIORITY_LEADERBOARD, "b", recorder.call, "leaderboard", False),
+                dispatcher.submit(PRIORITY_COMPLETION, "c", recorder.call, "completion", False),
+                dispatcher.submit(PRIORITY_FOLLOWUP, "d", recorder.call, "followup", False),
+            ]
+            recorder.release.set()
+            await asyncio.gather(*blockers, *queued)
+        finally:
+            await dispatcher.close()
+        return recorder.started[3:]
+
+    assert asyncio.run(scenario()) == ["followup", "completion", "leaderboard", "cosmetic"]
+
+
+def test_one_request_per_route_at_a_time():
+    async def scenario():
+        dispatcher = DiscordDispatcher(workers=4, route_concurrency=1)
+        recorder = Recorder()
+        try:
+            same_route = [dispatcher.submit(PRIORITY_COMPLETION, "channel:1", recorder.call, index) for index in range(3)]
+            other_route = dispatcher.submit(PRIORITY_COMPLETION, "channel:2", recorder.call, "other")
+            await asyncio.sleep(0.01)
+            running = list(recorder.started)
+            recorder.release.set()
+            results = await asyncio.gather(*same_route, other_route)
+        finally:
+            await dispatcher.close()
+        return running, results
+
+    running, results = asyncio.run(scenario())
+    assert running == [0, "other"]
+    assert results == [0, 1, 2, "other"]
+
+
+def test_class_limits_leave_workers_for_interactions():
+    async def scenario():
+        dispatcher = DiscordDispatcher(workers=4)
+        recorder = Recorder()
+        try:
+            leaderboards = [dispatcher.submit(PRIORITY_LEADERBOARD, f"channel:{index}", recorder.call, f"board{index}") for index in range(4)]
+            cosmetics = [dispatcher.submit(PRIORITY_COSMETIC, f"guild:{index}", recorder.call, f"cosmetic{index}") for index in range(2)]
+            await asyncio.sleep(0.01)
+            before_followup = list(recorder.started)
+            followup = dispatcher.submit(PRIORITY_FOLLOWUP, "interaction:1", recorder.call, "followup", False)
+            assert await asyncio.wait_for(followup, 1) == "followup"
+            recorder.release.set()
+            await asyncio.gather(*leaderboards, *cosmetics)
+        finally:
+            await dispatcher.close()
+        return before_followup, dispatcher.metrics()
+
+    before_followup, metrics = asyncio.run(scenario())
+    assert sorted(before_followup) == ["board0", "board1", "cosmetic0"]
+    assert metrics['leaderboard']['completed'] == 4
+    assert metrics['cosmetic']['completed'] == 2
+    assert metrics['followup']['completed'] == 1
@@ -0,0 +1,28 @@
+import os
+from pathlib import Path
+
+from bot.db.journal import JournalEventDatabase
+
+
+def test_entries_appended_after_a_torn_line_survive_reopen(tmp_path):
+    path = str(tmp_path / "event_bot.db")
+    log_path = Path(f"{path}.log")
+    db = JournalEventDatabase(path)
+    db.join_user_with_mode(1, 1, "easy")
+    db.join_user_with_mode(1, 2, "easy")
+    db.close()
+
+    size = log_path.stat().st_size
+    os.truncate(log_path, size - 10)
+
+    db = JournalEventDatabase(path)
+    assert db.is_joined(1, 1)
+    assert not db.is_joined(1, 2)
+    db.join_user_with_mode(1, 3, "hard")
+    db.close()
+
+    reopened = JournalEventDatabase(path)
+    assert reopened.is_joined(1, 1)
+    assert reopened.is_joined(1, 3)
+    assert reopened.get_user_mode(1, 3) == "hard"
+    reopened.close()
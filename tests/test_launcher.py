@@ -0,0 +1,27 @@
+import subprocess
+import sys
+import threading
+
+from bot.launcher import Launcher, shard_ranges
+
+
+def test_shard_ranges_are_contiguous_and_cover_every_shard():
+    assert shard_ranges(10, 3) == [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    assert shard_ranges(2, 4) == [[0], [1]]
+    assert shard_ranges(1, 1) == [[0]]
+
+
+def test_clean_shutdown_ignores_workers_the_launcher_terminated(monkeypatch):
+    monkeypatch.setattr("bot.launcher.signal.signal", lambda signum, handler: None)
+    launcher = Launcher(shard_count=2, processes=2)
+    monkeypatch.setattr(
+        launcher, "_spawn",
+        lambda index: subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    )
+    timer = threading.Timer(0.5, launcher.stop)
+    timer.start()
+    try:
+        assert launcher.run() == 0
+    finally:
+        timer.cancel()
+    assert launcher.terminated == {0, 1}
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+import bot.db as bot_db
+from bot.cogs.commands.leaderboard_manager import LeaderboardManager
+from bot.cogs.commands.submit_command import SubmitCommand
+from bot.db.async_db import AsyncEventDatabase
+from bot.db.sqlite import SqliteEventDatabase
+from bot.main import EventBot
+from bot.services.boss_progression import BossProgressionService
+from bot.services.discord_dispatcher import get_dispatcher
+
+
+class FakeChannel:
+    def __init__(self, channel_id, name):
+        self.id = channel_id
+        self.name = name
+        self.sent = []
+
+    async def send(self, embed=None):
+        self.sent.append(embed)
+
+
+class FakeGuild:
+    def __init__(self, guild_id):
+        self.id = guild_id
+        self.name = f"guild {guild_id}"
+        self.channels = {}
+        self.created = []
+
+    def get_channel(self, channel_id):
+        return self.channels.get(channel_id)
+
+    async def create_text_channel(self, name, **kwargs):
+        channel = FakeChannel(9000 + len(self.created), name)
+        self.created.append(channel)
+        self.channels[channel.id] = channel
+        return channel
+
+
+class FakeUser:
+    id = 42
+    display_name = "Zezima"
+
+
+class FakeInteraction:
+    def __init__(self, guild):
+        self.guild = guild
+        self.guild_id = guild.id
+        self.user = FakeUser()
+        self.command = None
+
+
+class FakeAttachment:
+    url = "https://cdn.example/after.png"
+
+
+class RecordingLeaderboardManager:
+    def __init__(self):
+        self.requested = []
+
+    def request_update(self, guild_id, mode):
+        self.requested.append((guild_id, mode))
+
+
+@pytest.fixture
+def lazy_bot(tmp_path, monkeypatch):
+    monkeypatch.setenv("LAZY_PROVISIONING", "1")
+    db = AsyncEventDatabase(SqliteEventDatabase(str(tmp_path / "event_bot.sqlite3")))
+    monkeypatch.setattr(bot_db, "_async_db_instance", db)
+    bot = EventBot()
+    bot.bootstrap_calls = 0
+
+    async def bootstrap_guild(guild):
+        bot.bootstrap_calls += 1
+        await asyncio.sleep(0.05)
+        completions = FakeChannel(100, "🏆・boss-completions")
+        normal = FakeChannel(101, "🛡️・normal")
+        guild.channels.update({completions.id: completions, normal.id: normal})
+        await db.store_discord_resource(guild.id, "completions", completions.id)
+        await db.store_discord_resource(guild.id, "channel_normal", normal.id)
+        for index, resource_type in enumerate(("channel_easy", "channel_hard", "channel_extreme", "info")):
+            await db.store_discord_resource(guild.id, resource_type, 200 + index)
+        return FakeChannel(99, "category")
+
+    bot.bootstrap_guild = bootstrap_guild
+    monkeypatch.setattr(EventBot, "get_guild", lambda self, guild_id: self.test_guilds.get(guild_id))
+    bot.test_guilds = {}
+    yield bot, db
+    asyncio.run(db.close())
+
+
+def test_first_submit_waits_for_lazy_provisioning(lazy_bot):
+    bot, db = lazy_bot
+    guild = FakeGuild(1)
+    interaction = FakeInteraction(guild)
+    leaderboard_manager = RecordingLeaderboardManager()
+    submit = SubmitCommand(bot, db, BossProgressionService(), None, leaderboard_manager)
+
+    async def scenario():
+        try:
+            bot.provision_guild_lazily(guild)
+            await submit._post_boss_completion(
+                interaction, FakeAttachment(), 1, 1, "normal", is_completed=True
+            )
+            bot.provision_guild_lazily(guild)
+            await bot.wait_until_provisioned(guild)
+        finally:
+            await get_dispatcher().close()
+
+    asyncio.run(scenario())
+
+    assert guild.created == []
+    assert len(guild.channels[100].sent) == 1
+    assert bot.bootstrap_calls == 1
+    assert bot.bootstrap_metrics['lazy_provisioned'] == 1
+    assert leaderboard_manager.requested == [(1, "normal")]
+
+
+def test_leaderboard_refresh_waits_for_lazy_provisioning(lazy_bot):
+    bot, db = lazy_bot
+    guild = FakeGuild(2)
+    bot.test_guilds[guild.id] = guild
+    manager = LeaderboardManager(bot, db, BossProgressionService())
+    refreshed = []
+
+    async def update_mode_leaderboard(channel, guild_id, mode):
+        refreshed.append((channel.id, guild_id, mode))
+
+    manager.update_mode_leaderboard = update_mode_leaderboard
+
+    async def scenario():
+        try:
+            bot.provision_guild_lazily(guild)
+            await manager.refresh_mode_leaderboard(guild.id, "normal")
+        finally:
+            await manager.close()
+            await get_dispatcher().close()
+
+    asyncio.run(scenario())
+
+    assert refreshed == [(101, 2, "normal")]
+    assert bot.bootstrap_calls == 1
@@ -0,0 +1,59 @@
+from tinydb import TinyDB
+from tinydb.storages import MemoryStorage
+
+from bot.cogs.commands.leaderboard_renderer import LeaderboardRenderer
+from bot.db.tiny import EventDatabase
+from bot.services.boss_progression import BossProgressionService
+
+
+class CountingStorage(MemoryStorage):
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def read(self):
+        self.reads += 1
+        return super().read()
+
+
+class CountingEventDatabase(EventDatabase):
+    def _open(self, db_path, write_behind, max_pending_writes):
+        return TinyDB(storage=CountingStorage)
+
+
+def _populate(db, guild_id=1):
+    for user_id in range(30):
+        mode = ("easy", "normal", "extreme")[user_id % 3]
+        db.join_user_with_mode(guild_id, user_id, mode)
+        for _ in range(user_id % 5):
+            db.add_completion(guild_id, user_id, "after.png")
+    for user_id in range(100, 115):
+        db.join_user_with_mode(guild_id, user_id, "normal")
+        db.mark_difficulty_complete(guild_id, user_id, "normal", f"2025-01-01T00:00:{user_id - 100:02d}")
+
+
+def test_board_render_reads_storage_once(tmp_path):
+    db = CountingEventDatabase(str(tmp_path / "unused.db"))
+    _populate(db)
+    renderer = LeaderboardRenderer(BossProgressionService())
+    storage = db.db.storage
+
+    for mode in ("easy", "normal", "extreme"):
+        storage.reads = 0
+        board = db.get_mode_board(1, mode, limit=10)
+        names = {row['user_id']: f"Player {row['user_id']}" for row in board['finalized'] + board['live']}
+        embed = renderer.render(mode, board, names)
+        assert storage.reads == 1, mode
+        assert embed.fields
+
+
+def test_board_is_limited_but_reports_the_finalized_total(tmp_path):
+    db = CountingEventDatabase(str(tmp_path / "unused.db"))
+    _populate(db)
+
+    board = db.get_mode_board(1, "normal", limit=10)
+
+    assert len(board['finalized']) == 10
+    assert board['finalized_total'] == 15
+    assert [row['completion_order'] for row in board['finalized']] == list(range(1, 11))
+    assert len(board['live']) == 10
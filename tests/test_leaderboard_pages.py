@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+import bot.db as bot_db
+import bot.services.display_names as display_names
+import bot.services.static_messages as static_messages
+from bot.cogs.commands.leaderboard_manager import LeaderboardManager
+from bot.db.async_db import AsyncEventDatabase
+from bot.db.sharded import ShardedEventDatabase
+from bot.services.boss_progression import BossProgressionService
+
+
+class FakeUser:
+    def __init__(self, user_id):
+        self.id = user_id
+        self.display_name = f"Player {user_id}"
+
+
+class FakeBot:
+    def get_guild(self, guild_id):
+        return None
+
+    def get_user(self, user_id):
+        return FakeUser(user_id)
+
+
+@pytest.fixture
+def sharded(tmp_path, monkeypatch):
+    db = AsyncEventDatabase(ShardedEventDatabase(str(tmp_path / "guilds"), max_open_shards=1))
+    monkeypatch.setattr(bot_db, "_async_db_instance", db)
+    monkeypatch.setattr(display_names, "_display_name_cache", None)
+    monkeypatch.setattr(static_messages, "_static_message_tracker", None)
+    yield db
+    asyncio.run(db.close())
+
+
+def _submit(db, guild_id, user_id):
+    return db.record_submission(
+        guild_id, user_id, "after.png",
+        is_complete=lambda progress, _: False,
+        roll_extreme_boss=lambda: "Zulrah"
+    )
+
+
+def test_page_is_not_served_from_cache_after_a_shard_is_reopened(sharded):
+    db = sharded
+    manager = LeaderboardManager(FakeBot(), db, BossProgressionService())
+
+    async def scenario():
+        try:
+            for user_id in range(5):
+                await db.join_user_with_mode(1, user_id, "normal")
+            first, _, _ = await manager.get_leaderboard_page(1, "normal", 1)
+            await _submit(db, 1, 3)
+
+            await db.join_user_with_mode(2, 99, "normal")
+            assert db.db.open_shard_count() == 1
+
+            reopened, _, _ = await manager.get_leaderboard_page(1, "normal", 1)
+            await _submit(db, 1, 3)
+            await db.join_user_with_mode(2, 98, "normal")
+            written, _, _ = await manager.get_leaderboard_page(1, "normal", 1)
+        finally:
+            await manager.close()
+        return first, reopened, written
+
+    first, reopened, written = asyncio.run(scenario())
+    assert manager.page_hits == 0
+    assert manager.page_misses == 3
+    assert "Player 0" in first.fields[0].value.splitlines()[0]
+    assert "Player 3" in reopened.fields[0].value.splitlines()[0]
+    assert written.to_dict() != reopened.to_dict()
@@ -0,0 +1,63 @@
+import asyncio
+
+from bot.services.leaderboard_scheduler import LeaderboardRefreshScheduler
+
+
+def test_close_flushes_boards_still_inside_the_window():
+    refreshed = []
+
+    async def refresh(guild_id, mode):
+        refreshed.append((guild_id, mode))
+
+    async def scenario():
+        scheduler = LeaderboardRefreshScheduler(refresh, window=60, max_staleness=60)
+        scheduler.mark_dirty(1, "normal")
+        scheduler.mark_dirty(1, "normal")
+        scheduler.mark_dirty(2, "hard")
+        await asyncio.sleep(0)
+        await scheduler.close()
+        return scheduler.metrics()
+
+    metrics = asyncio.run(scenario())
+    assert sorted(refreshed) == [(1, "normal"), (2, "hard")]
+    assert metrics['executed'] == 2
+    assert metrics['pending'] == 0
+
+
+def test_close_waits_for_a_running_refresh_and_reruns_it_if_marked_again():
+    refreshed = []
+
+    async def scenario():
+        running = asyncio.Event()
+        release = asyncio.Event()
+
+        async def refresh(guild_id, mode):
+            refreshed.append((guild_id, mode))
+            running.set()
+            if len(refreshed) == 1:
+                await release.wait()
+
+        scheduler = LeaderboardRefreshScheduler(refresh, window=0, max_staleness=0)
+        scheduler.mark_dirty(1, "easy")
+        await running.wait()
+        scheduler.mark_dirty(1, "easy")
+        closing = asyncio.create_task(scheduler.close())
+        await asyncio.sleep(0.01)
+        release.set()
+        await closing
+
+    asyncio.run(scenario())
+    assert refreshed == [(1, "easy"), (1, "easy")]
+
+
+def test_close_gives_up_after_the_flush_timeout():
+    async def refresh(guild_id, mode):
+        await asyncio.sleep(60)
+
+    async def scenario():
+        scheduler = LeaderboardRefreshScheduler(refresh, window=60, max_staleness=60, flush_timeout=0.05)
+        scheduler.mark_dirty(1, "normal")
+        await asyncio.wait_for(scheduler.close(), 1)
+        return scheduler.metrics()
+
+    assert asyncio.run(scenario())['executed'] == 0
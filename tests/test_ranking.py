@@ -0,0 +1,43 @@
+from bot.db.ranking import Ranking, rank_key
+
+
+def test_add_orders_by_progress_then_completion_time_then_user():
+    ranking = Ranking()
+    ranking.add(rank_key(2, "2025-01-02T00:00:00", 5))
+    ranking.add(rank_key(3, "2025-01-03T00:00:00", 9))
+    ranking.add(rank_key(2, "2025-01-01T00:00:00", 7))
+    ranking.add(rank_key(0, None, 1))
+
+    assert [key[2] for key in ranking] == [9, 7, 5, 1]
+    assert ranking.rank(rank_key(2, "2025-01-01T00:00:00", 7)) == 2
+    assert ranking.keys(1, 2) == [rank_key(2, "2025-01-01T00:00:00", 7), rank_key(2, "2025-01-02T00:00:00", 5)]
+
+
+def test_ties_are_broken_by_user_id():
+    ranking = Ranking()
+    for user_id in (30, 10, 20):
+        ranking.add(rank_key(1, "2025-01-01T00:00:00", user_id))
+    ranking.add(rank_key(0, None, 5))
+    ranking.add(rank_key(0, None, 2))
+
+    assert [key[2] for key in ranking] == [10, 20, 30, 2, 5]
+    assert ranking.rank(rank_key(1, "2025-01-01T00:00:00", 30)) == 3
+    assert ranking.rank(rank_key(0, None, 5)) == 5
+
+
+def test_discard_removes_only_the_exact_key():
+    ranking = Ranking()
+    first = rank_key(1, "2025-01-01T00:00:00", 1)
+    second = rank_key(1, "2025-01-01T00:00:00", 2)
+    ranking.add(first)
+    ranking.add(second)
+
+    ranking.discard(rank_key(1, "2025-01-02T00:00:00", 1))
+    assert len(ranking) == 2
+
+    ranking.discard(first)
+    assert len(ranking) == 1
+    assert ranking.rank(first) == 0
+    assert ranking.rank(second) == 1
+    ranking.discard(first)
+    assert list(ranking) == [second]
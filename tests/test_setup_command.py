@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+import bot.db as bot_db
+from bot.cogs.commands.setup_command import SetupCommand
+from bot.db.async_db import AsyncEventDatabase
+from bot.db.sqlite import SqliteEventDatabase
+from bot.main import BOOTSTRAP_RESOURCES, EventBot
+from bot.services.discord_dispatcher import get_dispatcher
+
+
+class FakeCategory:
+    id = 500
+
+
+class FakeGuild:
+    id = 1
+
+    def get_channel(self, channel_id):
+        return None
+
+
+class FakePermissions:
+    manage_guild = True
+
+
+class FakeUser:
+    guild_permissions = FakePermissions()
+
+
+class FakeResponse:
+    async def defer(self, ephemeral=False):
+        pass
+
+
+class FakeFollowup:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message, ephemeral=False):
+        self.sent.append(message)
+
+
+class FakeInteraction:
+    id = 77
+
+    def __init__(self):
+        self.guild = FakeGuild()
+        self.user = FakeUser()
+        self.response = FakeResponse()
+        self.followup = FakeFollowup()
+
+
+@pytest.fixture
+def setup_bot(tmp_path, monkeypatch):
+    db = AsyncEventDatabase(SqliteEventDatabase(str(tmp_path / "event_bot.sqlite3")))
+    monkeypatch.setattr(bot_db, "_async_db_instance", db)
+    bot = EventBot()
+    bot._layout_version = "test-layout"
+    yield bot, db
+    asyncio.run(db.close())
+
+
+def _run_setup(bot, db):
+    interaction = FakeInteraction()
+
+    async def scenario():
+        try:
+            await SetupCommand(bot, db).setup(interaction)
+            return await db.get_discord_resource_record(interaction.guild.id, "bootstrap")
+        finally:
+            await get_dispatcher().close()
+
+    return interaction.followup.sent, asyncio.run(scenario())
+
+
+def test_setup_reports_failure_when_the_category_cannot_be_created(setup_bot):
+    bot, db = setup_bot
+
+    async def bootstrap_guild(guild):
+        return None
+
+    bot.bootstrap_guild = bootstrap_guild
+    sent, state = _run_setup(bot, db)
+
+    assert len(sent) == 1 and sent[0].startswith("❌")
+    assert state is None
+
+
+def test_setup_reports_failure_when_a_channel_is_missing(setup_bot):
+    bot, db = setup_bot
+
+    async def bootstrap_guild(guild):
+        for index, resource_type in enumerate(BOOTSTRAP_RESOURCES[:-1]):
+            await db.store_discord_resource(guild.id, resource_type, 100 + index)
+        return FakeCategory()
+
+    bot.bootstrap_guild = bootstrap_guild
+    sent, state = _run_setup(bot, db)
+
+    assert sent[0].startswith("❌")
+    assert state is None
+
+
+def test_setup_reports_success_once_every_channel_is_stored(setup_bot):
+    bot, db = setup_bot
+
+    async def bootstrap_guild(guild):
+        for index, resource_type in enumerate(BOOTSTRAP_RESOURCES):
+            await db.store_discord_resource(guild.id, resource_type, 100 + index)
+        return FakeCategory()
+
+    bot.bootstrap_guild = bootstrap_guild
+    sent, state = _run_setup(bot, db)
+
+    assert sent[0].startswith("✅")
+    assert state['resource_id'] == FakeCategory.id
+    assert len(state['metadata']['channels']) == len(BOOTSTRAP_RESOURCES)
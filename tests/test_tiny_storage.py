@@ -0,0 +1,91 @@
+from bot.db.tiny import EventDatabase
+
+
+def test_indexed_lookups_do_not_reparse_the_file(tmp_path):
+    db = EventDatabase(str(tmp_path / "event_bot.db"))
+    for user_id in range(20):
+        db.join_user_with_mode(1, user_id, "normal")
+    storage = db.db.storage
+    before = storage.metrics()['storage_reads']
+
+    for user_id in range(20):
+        assert db.is_joined(1, user_id)
+        assert db.get_user_progress(1, user_id) == 0
+    db.get_mode_board(1, "normal", limit=10)
+
+    assert storage.metrics()['storage_reads'] == before
+    db.close()
+
+
+def test_cached_reads_see_writes_and_survive_reopen(tmp_path):
+    path = str(tmp_path / "event_bot.db")
+    db = EventDatabase(path)
+    db.join_user_with_mode(1, 7, "hard")
+    db.add_completion(1, 7, "after.png")
+    assert db.get_user_progress(1, 7) == 1
+    db.close()
+
+    reopened = EventDatabase(path)
+    assert reopened.is_joined(1, 7)
+    assert reopened.get_user_progress(1, 7) == 1
+    reopened.close()
+
+
+def _finish(db, guild_id, user_id, mode="easy"):
+    return db.record_submission(
+        guild_id, user_id, "after.png",
+        is_complete=lambda progress, _: progress >= 1,
+        roll_extreme_boss=lambda: "Zulrah"
+    )
+
+
+def test_completion_order_counts_only_the_same_guild_and_mode(tmp_path):
+    path = str(tmp_path / "event_bot.db")
+    db = EventDatabase(path)
+    for user_id, (guild_id, mode) in enumerate([(1, "easy"), (1, "easy"), (2, "easy"), (1, "hard"), (1, "easy")]):
+        db.join_user_with_mode(guild_id, user_id, mode)
+        result = _finish(db, guild_id, user_id, mode)
+        assert result['completed']
+    orders = [row['completion_order'] for row in db.get_finalized_leaderboard(1, "easy")]
+    assert orders == [1, 2, 3]
+    assert db.get_next_completion_order(1, "hard") == 2
+    db.close()
+
+    reopened = EventDatabase(path)
+    reopened.join_user_with_mode(1, 50, "easy")
+    assert _finish(reopened, 1, 50)['completion_order'] == 4
+    reopened.close()
+
+
+def test_table_inserts_after_a_raw_commit_do_not_reuse_ids(tmp_path):
+    db = EventDatabase(str(tmp_path / "event_bot.db"))
+    db.join_user_with_mode(1, 1, "easy")
+    _finish(db, 1, 1)
+    db.join_user_with_mode(1, 2, "normal")
+    db.mark_difficulty_complete(1, 2, "normal", "2025-01-01T00:00:00")
+    db.join_user_with_mode(1, 3, "easy")
+    _finish(db, 1, 3)
+
+    completions = db.completions.all()
+    assert len({row.doc_id for row in completions}) == 3
+    assert [row['user_id'] for row in db.get_finalized_leaderboard(1, "easy")] == [1, 3]
+    db.close()
+
+
+def test_submission_ids_continue_after_reopen(tmp_path):
+    path = str(tmp_path / "event_bot.db")
+    db = EventDatabase(path)
+    db.join_user_with_mode(1, 1, "normal")
+    db.add_completion(1, 1, "first.png")
+    db.join_user_with_mode(1, 2, "easy")
+    _finish(db, 1, 2)
+    db.close()
+
+    reopened = EventDatabase(path)
+    reopened.join_user_with_mode(1, 3, "easy")
+    _finish(reopened, 1, 3)
+    reopened.add_completion(1, 1, "second.png")
+
+    assert sorted(row.doc_id for row in reopened.submissions.all()) == [1, 2, 3, 4]
+    assert sorted(row.doc_id for row in reopened.completions.all()) == [1, 2]
+    reopened.close()